@@ -0,0 +1,208 @@
+# benchmarks/fakes.py
+
+"""
+Deterministic local stand-ins for Groq, Tavily and SMTP used by the benchmark harness.
+"""
+
+import hashlib
+import html
+import json
+import os
+import re
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def load_fixture_articles() -> list:
+    with open(os.path.join(FIXTURES_DIR, "articles.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat model that answers after `latency` seconds plus `output_tokens / tokens_per_second`,
+    mimicking time-to-first-token and generation speed of a hosted model.
+    Answers are markdown shaped like a news summary, citing the URLs found in the prompt,
+    so output validation passes and downstream nodes (PDF, email) do real work.
+    Packed article summary and batch translation prompts get one answer per item marker.
+    """
+    model_name: str = "fake-llama3-8b-8192"
+    latency: float = 0.2
+    tokens_per_second: float = 800.0
+    output_tokens: int = 300
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat-model"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        time.sleep(self.latency + self.output_tokens / self.tokens_per_second)
+        prompt = "\n".join(m.content for m in messages if isinstance(m.content, str))
+        prompt_chars = len(prompt)
+        markers = re.findall(r"^<<<\d+>>>$", prompt, re.MULTILINE)
+        if markers:
+            # Packed article summaries and batch translations: answer every item under its marker
+            answer = ("**Headline**: A deterministic benchmark summary sentence." if "Summarize each numbered article" in prompt
+                      else "Traduction déterministe de l'élément.")
+            content = "".join(f"{marker}\n{answer}\n" for marker in markers)
+            return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content, response_metadata={"prompt_chars": prompt_chars}))])
+        urls = list(dict.fromkeys(re.findall(r"https?://[^\s)\]]+", prompt))) or ["https://example-news.com/a"]
+        # Roughly `output_tokens` tokens at ~4 characters per token, citing every URL at least once
+        lines = max(len(urls), self.output_tokens * 4 // 100)
+        body = "".join(f"- **Headline**: A deterministic benchmark summary sentence. ([Source]({urls[i % len(urls)]}))\n" for i in range(lines))
+        content = f"### 2026-10-18\n{body}"
+        message = AIMessage(content=content, response_metadata={"prompt_chars": prompt_chars})
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def bind_tools(self, tools, **kwargs):
+        # The fake never emits tool calls, so the web chatbot answers directly
+        return self
+
+class FakeTavilyClient:
+    """
+    Drop-in for tavily.TavilyClient returning fixture articles after a fixed latency.
+    With `article_base_url` set, article URLs point at an ArticleServer.
+    """
+    latency: float = 0.1
+    article_base_url: str | None = None
+
+    def __init__(self, *args, **kwargs):
+        self.articles = load_fixture_articles()
+        if self.article_base_url:
+            self.articles = [{**a, "url": f"{self.article_base_url}/articles/{i}"} for i, a in enumerate(self.articles)]
+
+    def search(self, query: str, max_results: int = 5, **kwargs) -> dict:
+        time.sleep(self.latency)
+        return {"query": query, "results": self.articles[:max_results]}
+
+class _SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough SMTP (EHLO, AUTH PLAIN, MAIL, RCPT, DATA) for smtplib to deliver a message."""
+    def _reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self._reply("220 localhost SMTP sink ready")
+        in_data, lines = False, []
+        for raw in self.rfile:
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            if in_data:
+                if line == ".":
+                    in_data = False
+                    self.server.messages.append("\n".join(lines))
+                    lines = []
+                    self._reply("250 OK queued")
+                else:
+                    lines.append(line[1:] if line.startswith("..") else line)
+                continue
+            command = line.split(" ", 1)[0].upper()
+            if command == "EHLO":
+                self.wfile.write(b"250-localhost\r\n250-AUTH PLAIN\r\n250 8BITMIME\r\n")
+            elif command == "AUTH":
+                self._reply("235 2.7.0 Authentication successful")
+            elif command == "DATA":
+                in_data = True
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("250 OK")
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """Local SMTP server that accepts any login and keeps received messages in memory."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _SMTPSinkHandler)
+        self.messages = []
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> "SMTPSink":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+class _ArticleHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        match = re.fullmatch(r"/articles/(\d+)", self.path)
+        articles = self.server.articles
+        if not match or int(match.group(1)) >= len(articles):
+            self.send_error(404)
+            return
+        time.sleep(self.server.latency)
+        self.server.requests += 1
+        page = self.server.render(articles[int(match.group(1))])
+        etag = '"' + hashlib.sha1(page).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.server.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(page)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        try:
+            self.wfile.write(page)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client gave up (deadline reached)
+
+class ArticleServer(ThreadingHTTPServer):
+    """
+    Local HTTP server serving the fixture articles as full HTML pages (with navigation and
+    footer boilerplate) at /articles/<index>. Supports ETag revalidation and adds `latency`
+    seconds per request.
+    """
+    daemon_threads = True
+    # Concurrent fetches open many connections at once; the default backlog of 5 would stall them
+    request_queue_size = 128
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.05, paragraphs: int = 6):
+        super().__init__((host, port), _ArticleHandler)
+        self.articles = load_fixture_articles()
+        self.latency = latency
+        self.paragraphs = paragraphs
+        self.requests = 0
+        self.not_modified = 0
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+    def render(self, article: dict) -> bytes:
+        body = "".join(f"<p>{html.escape(article['content'])}</p>" for _ in range(self.paragraphs))
+        return (f"<html><head><title>{html.escape(article['title'])}</title><script>var x = 1;</script></head><body>"
+                f"<nav><p>Home | World | Business | Technology | Sign in to read more stories</p></nav>"
+                f"<article><h1>{html.escape(article['title'])}</h1>{body}</article>"
+                f"<footer><p>Copyright 2026 Example News. All rights reserved. Privacy policy.</p></footer>"
+                f"</body></html>").encode("utf-8")
+
+    def start(self) -> "ArticleServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,103 @@
+# benchmarks/import_time.py
+
+"""
+Import-time benchmark for the API process.
+
+Imports the FastAPI app in fresh interpreters, reports the median wall time and the
+slowest modules (from `python -X importtime`), and fails if a module that should load
+lazily (Streamlit, PDF rendering, Tavily, langchain_community, ...) is imported eagerly
+or if the median exceeds --max-seconds. Run it in CI to keep cold starts from regressing.
+
+NOTE: Run from the project root.
+
+Usage:
+  python -m benchmarks.import_time
+  python -m benchmarks.import_time --runs 10 --max-seconds 1.5 --output import-time.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+TARGET = "src.langgraphagenticai.api.app"
+
+# Modules the API must not import at startup: Streamlit belongs to the UI process only,
+# the rest are heavy tool dependencies loaded on first use.
+FORBIDDEN_MODULES = [
+    "streamlit",
+    "markdown_pdf",
+    "fitz",
+    "tavily",
+    "langchain_community",
+    "langgraph.prebuilt",
+    "langchain_groq",
+    "numpy",
+]
+
+_PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import {TARGET}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {FORBIDDEN_MODULES!r} if m in sys.modules]}}))
+"""
+
+def measure_once() -> dict:
+    result = subprocess.run([sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def slowest_modules(top: int) -> list:
+    """Returns the `top` modules with the largest cumulative import time, in seconds."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+                            capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # Format: "import time: <self us> | <cumulative us> | <indented module name>"
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        rows.append({"module": name, "self_s": int(self_us) / 1e6, "cumulative_s": int(cumulative_us) / 1e6})
+    return sorted(rows, key=lambda row: row["cumulative_s"], reverse=True)[:top]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure how long the API takes to import.")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to measure.")
+    parser.add_argument("--max-seconds", type=float, default=None, help="Fail if the median import time exceeds this.")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list.")
+    parser.add_argument("--output", help="Optional JSON result file.")
+    args = parser.parse_args(argv)
+
+    runs = [measure_once() for _ in range(args.runs)]
+    timings = [run["seconds"] for run in runs]
+    loaded = sorted({module for run in runs for module in run["loaded"]})
+    report = {
+        "target": TARGET,
+        "runs": args.runs,
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "max_s": max(timings),
+        "eagerly_loaded": loaded,
+        "slowest_modules": slowest_modules(args.top),
+    }
+
+    print(f"Import {TARGET}: median {report['median_s']:.3f}s (min {report['min_s']:.3f}s, max {report['max_s']:.3f}s, {args.runs} runs)")
+    print("\nSlowest modules (cumulative):")
+    for row in report["slowest_modules"]:
+        print(f"  {row['cumulative_s']:>7.3f}s  {row['module']}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    failures = []
+    if loaded:
+        failures.append(f"modules that should load lazily were imported at startup: {', '.join(loaded)}")
+    if args.max_seconds is not None and report["median_s"] > args.max_seconds:
+        failures.append(f"median import time {report['median_s']:.3f}s exceeds --max-seconds {args.max_seconds}")
+    for failure in failures:
+        print(f"\n❌ {failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+# benchmarks/run_benchmark.py
+
+"""
+Offline end-to-end benchmark for the News Weaver API.
+
+Drives the FastAPI app in-process (no network) with fake Groq, Tavily and SMTP
+stand-ins, and reports throughput, p50/p95/p99 latency per endpoint, per graph node
+and per dependency, plus peak RSS. Results are written as JSON so runs can be compared.
+
+NOTE: Run from the project root.
+
+Usage:
+  python -m benchmarks.run_benchmark --requests 20 --concurrency 4
+  python -m benchmarks.run_benchmark --endpoints basic news --llm-latency 0.5 --output before.json
+  python -m benchmarks.run_benchmark --output after.json --compare before.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from benchmarks.fakes import ArticleServer, FakeChatModel, FakeTavilyClient, SMTPSink
+
+LANGUAGES = ["English", "Hindi"]
+
+def _payload(endpoint: str, i: int, model: str) -> tuple[str, dict]:
+    """Returns (path, json body) for the i-th request of an endpoint scenario."""
+    if endpoint == "basic":
+        return "/chat/basic", {"message": f"Benchmark question {i}: summarize topic {i}"}
+    if endpoint == "web":
+        return "/chat/web", {"message": f"What happened with topic {i} today?", "model": model}
+    if endpoint == "news":
+        return "/news/structured", {
+            "model": model,
+            "frequency": "daily",
+            "topic": f"bench topic {i % 4}",
+            "language": LANGUAGES[i % len(LANGUAGES)],
+            "recipient_email": "reader@example.com",
+        }
+    if endpoint == "translate":
+        return "/translate", {"model": model, "text": f"Headline number {i} for the benchmark.", "target_language": "French"}
+    if endpoint == "translate_batch":
+        texts = [f"Headline number {i}-{j} for the benchmark." for j in range(50)]
+        return "/translate/batch", {"model": model, "texts": texts, "target_language": "French"}
+    raise ValueError(f"Unknown endpoint: {endpoint}")
+
+def percentile(sorted_values: list, p: float) -> float | None:
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * p / 100
+    lo = int(rank)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (rank - lo)
+
+def summarize_samples(samples: list) -> dict:
+    values = sorted(samples)
+    return {
+        "count": len(values),
+        "mean_s": sum(values) / len(values) if values else None,
+        "p50_s": percentile(values, 50),
+        "p95_s": percentile(values, 95),
+        "p99_s": percentile(values, 99),
+        "max_s": values[-1] if values else None,
+    }
+
+def peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+def install_fakes(args, smtp_port: int, work_dir: str, article_base_url: str | None = None):
+    """Points the app at the fakes. Must run before the app modules are imported."""
+    os.environ.update({
+        "GROQ_API_KEY": "fake-groq-key",
+        "TAVILY_API_KEY": "fake-tavily-key",
+        "GMAIL_SENDER_EMAIL": "bench@example.com",
+        "GMAIL_SENDER_PASSWORD": "fake-password",
+        "SMTP_HOST": "127.0.0.1",
+        "SMTP_PORT": str(smtp_port),
+        "SMTP_USE_SSL": "false",
+        "PROMPT_CACHE_ENABLED": "true" if args.with_cache else "false",
+        "PROMPT_CACHE_DB_PATH": os.path.join(work_dir, "prompt_cache.sqlite"),
+        "TRANSLATION_CACHE_ENABLED": "true" if args.with_cache else "false",
+        "TRANSLATION_CACHE_DB_PATH": os.path.join(work_dir, "translation_cache.sqlite"),
+        "CHAT_MEMORY_DB_PATH": os.path.join(work_dir, "chat_memory.sqlite"),
+        "DIGEST_LEDGER_DB_PATH": os.path.join(work_dir, "digest_ledger.sqlite"),
+        "SUBSCRIPTIONS_DB_PATH": os.path.join(work_dir, "subscriptions.sqlite"),
+        "NEWS_RUNS_DB_PATH": os.path.join(work_dir, "news_runs.sqlite"),
+        "ARTICLE_SUMMARY_CACHE_ENABLED": "true" if args.with_cache else "false",
+        "ARTICLE_SUMMARY_CACHE_DB_PATH": os.path.join(work_dir, "article_summaries.sqlite"),
+        "ARTICLE_ARCHIVE_DIR": os.path.join(work_dir, "articles"),
+        "DIGEST_CACHE_ENABLED": "true" if args.with_cache else "false",
+        "DIGEST_CACHE_DB_PATH": os.path.join(work_dir, "digest_cache.sqlite"),
+        "NEWS_ENRICH_ENABLED": "true" if article_base_url else "false",
+    })
+    FakeTavilyClient.latency = args.tavily_latency
+    FakeTavilyClient.article_base_url = article_base_url
+
+    from src.langgraphagenticai.api.routes import chat, news, subscriptions, utils
+    from src.langgraphagenticai.nodes import ai_news_node
+    from src.langgraphagenticai.LLMS import model_router
+    from src.langgraphagenticai.monitoring.metrics import DependencyMetricsCallback
+
+    def fake_llm(model: str = "llama3-8b-8192"):
+        return FakeChatModel(
+            model_name=model,
+            latency=args.llm_latency,
+            tokens_per_second=args.llm_tokens_per_second,
+            output_tokens=args.llm_output_tokens,
+            callbacks=[DependencyMetricsCallback("groq")],
+        )
+
+    for module in (chat, news, subscriptions, utils):
+        module.initialize_llm = fake_llm
+    model_router.create_llm = fake_llm
+    ai_news_node.TavilyClient = FakeTavilyClient
+
+async def _run_endpoint(client, endpoint: str, requests: int, concurrency: int, model: str) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors, shed = [], 0, 0
+
+    async def one(i: int):
+        nonlocal errors, shed
+        path, body = _payload(endpoint, i, model)
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(path, json=body)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code in (429, 503) and "retry-after" in response.headers:
+                shed += 1  # rejected by admission control
+            elif response.status_code >= 400:
+                errors += 1
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    wall = time.perf_counter() - wall_start
+    return {
+        **summarize_samples(latencies),
+        "errors": errors,
+        "shed": shed,
+        "wall_time_s": wall,
+        "throughput_rps": requests / wall if wall else None,
+    }
+
+async def run(args) -> dict:
+    import httpx
+    from src.langgraphagenticai.api.app import app
+    from src.langgraphagenticai.monitoring.metrics import add_latency_listener
+
+    samples = {"node": defaultdict(list), "dependency": defaultdict(list), "queue": defaultdict(list)}
+    add_latency_listener(lambda kind, name, seconds: samples[kind][name].append(seconds))
+
+    endpoints = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        for endpoint in args.endpoints:
+            print(f"▶ {endpoint}: {args.requests} requests, concurrency {args.concurrency}")
+            endpoints[endpoint] = await _run_endpoint(client, endpoint, args.requests, args.concurrency, args.model)
+
+    return {
+        "endpoints": endpoints,
+        "nodes": {name: summarize_samples(values) for name, values in sorted(samples["node"].items())},
+        "dependencies": {name: summarize_samples(values) for name, values in sorted(samples["dependency"].items())},
+        "admission_wait": {name: summarize_samples(values) for name, values in sorted(samples["queue"].items())},
+    }
+
+def compare(current: dict, baseline: dict):
+    """Prints p95 and throughput changes per endpoint against a previous result file."""
+    print(f"\nComparison with baseline ({baseline.get('git_revision')} @ {baseline.get('started_at')}):")
+    for endpoint, stats in current["endpoints"].items():
+        base = baseline.get("endpoints", {}).get(endpoint)
+        if not base:
+            continue
+        for key in ("p95_s", "throughput_rps"):
+            if stats.get(key) and base.get(key):
+                change = (stats[key] - base[key]) / base[key] * 100
+                print(f"  {endpoint:<10} {key:<15} {base[key]:>9.4f} → {stats[key]:>9.4f} ({change:+.1f}%)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark for the News Weaver API.")
+    parser.add_argument("--endpoints", nargs="+", default=["basic", "web", "news", "translate"],
+                        choices=["basic", "web", "news", "translate", "translate_batch"], help="Endpoint scenarios to run, in order.")
+    parser.add_argument("--requests", type=int, default=20, help="Requests per endpoint.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum requests in flight per endpoint.")
+    parser.add_argument("--model", default="llama3-8b-8192", help="Model name sent in requests (served by the fake).")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Fake LLM time to first token, seconds.")
+    parser.add_argument("--llm-tokens-per-second", type=float, default=800.0, help="Fake LLM generation speed.")
+    parser.add_argument("--llm-output-tokens", type=int, default=300, help="Tokens generated per fake LLM call.")
+    parser.add_argument("--tavily-latency", type=float, default=0.1, help="Fake Tavily search latency, seconds.")
+    parser.add_argument("--with-cache", action="store_true", help="Keep the response caches enabled.")
+    parser.add_argument("--with-enrichment", action="store_true", help="Fetch full articles from a local fixture HTTP server.")
+    parser.add_argument("--article-latency", type=float, default=0.05, help="Fixture article server latency per page, seconds.")
+    parser.add_argument("--output", help="Path of the JSON result file (default: benchmarks/results/<timestamp>.json).")
+    parser.add_argument("--compare", help="Previous JSON result file to compare against.")
+    args = parser.parse_args(argv)
+
+    started_at = datetime.now(timezone.utc)
+    output = os.path.abspath(args.output or os.path.join(
+        "benchmarks", "results", f"benchmark-{started_at.strftime('%Y%m%dT%H%M%SZ')}.json"))
+    project_root = os.getcwd()
+
+    sink = SMTPSink().start()
+    article_server = ArticleServer(latency=args.article_latency).start() if args.with_enrichment else None
+    work_dir = tempfile.mkdtemp(prefix="news-weaver-bench-")
+    try:
+        install_fakes(args, sink.port, work_dir, article_server.base_url if article_server else None)
+        # Keep generated News/ files out of the project tree
+        os.chdir(work_dir)
+        results = asyncio.run(run(args))
+    finally:
+        os.chdir(project_root)
+        sink.stop()
+        if article_server:
+            article_server.stop()
+
+    report = {
+        "started_at": started_at.isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+        **results,
+        "emails_delivered": len(sink.messages),
+        "article_pages": {"served": article_server.requests, "not_modified": article_server.not_modified} if article_server else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\n{'endpoint':<12}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'errors':>8}{'shed':>6}")
+    for endpoint, stats in report["endpoints"].items():
+        print(f"{endpoint:<12}{stats['throughput_rps']:>8.2f}{stats['p50_s']:>9.3f}{stats['p95_s']:>9.3f}{stats['p99_s']:>9.3f}{stats['errors']:>8}{stats['shed']:>6}")
+    print(f"\nPeak RSS: {report['peak_rss_mb']} MB | emails delivered: {report['emails_delivered']}")
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+if __name__ == "__main__":
+    main()
@@ -15,38 +15,119 @@ Usage:
 
 - To run both the FastAPI server and the Streamlit UI:
   python run.py --mode both
+
+- To run the FastAPI server in production with 4 worker processes:
+  python run.py --mode production --workers 4 --port 8000
 """
 # run_both.py
 
+import argparse
 import threading
 import uvicorn
 import subprocess
 import os
+import shutil
+import tempfile
 import time
 from dotenv import load_dotenv
 import sys # Import the sys module
 
-def run_fastapi():
+APP_PATH = "src.langgraphagenticai.api.app:app"
+
+def run_fastapi(port: int = 8000):
     """
     Runs the FastAPI application using uvicorn as a separate thread.
     """
     print("🚀 Starting FastAPI server...")
     uvicorn.run(
-        "src.langgraphagenticai.api.app:app", 
-        host="0.0.0.0", 
-        port=8000, 
+        APP_PATH,
+        host="0.0.0.0",
+        port=port,
         log_level="info"
     )
 
-def run_streamlit():
+def run_streamlit(backend_url: str | None = None):
     """
     Runs the Streamlit application using subprocess.
+    With a backend URL, the UI sends its work to that FastAPI server instead of
+    running the graphs itself.
     """
     print("🎨 Starting Streamlit UI...")
+    env = os.environ.copy()
+    if backend_url:
+        env["NEWS_WEAVER_BACKEND_URL"] = backend_url
     streamlit_file = os.path.join("src", "langgraphagenticai", "main.py")
     # Set the working directory for the subprocess to the project root
     project_root = os.path.dirname(os.path.abspath(__file__))
-    subprocess.run(["streamlit", "run", streamlit_file], cwd=project_root)
+    subprocess.run(["streamlit", "run", streamlit_file], cwd=project_root, env=env)
+
+def _prepare_prometheus_multiproc_dir():
+    """
+    Worker processes write metrics to files in PROMETHEUS_MULTIPROC_DIR so /metrics can
+    aggregate them. It must be set before prometheus_client is imported and start empty.
+    """
+    metrics_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not metrics_dir:
+        metrics_dir = os.path.join(tempfile.gettempdir(), "news-weaver-metrics")
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = metrics_dir
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+def run_production(host: str, port: int, workers: int, graceful_timeout: int, worker_timeout: int):
+    """
+    Runs the FastAPI application with several worker processes.
+
+    On POSIX, gunicorn imports the app once in the master process (preload) and forks
+    uvicorn workers from it, so module imports are shared copy-on-write. Each worker then
+    warms up its own resources (SQLite connections, caches) before serving. On SIGTERM,
+    workers stop accepting connections and wait up to `graceful_timeout` seconds for
+    in-flight requests and graph runs to finish.
+    """
+    os.environ.setdefault("WARMUP_ON_STARTUP", "true")
+    os.environ.setdefault("GRACEFUL_TIMEOUT_SECONDS", str(graceful_timeout))
+    _prepare_prometheus_multiproc_dir()
+
+    if os.name == "nt":
+        # gunicorn is POSIX-only; uvicorn spawns workers without preloading the app
+        print(f"🚀 Starting FastAPI with {workers} uvicorn workers...")
+        uvicorn.run(APP_PATH, host=host, port=port, workers=workers,
+                    timeout_graceful_shutdown=graceful_timeout, log_level="info")
+        return
+
+    from gunicorn.app.base import BaseApplication
+    from src.langgraphagenticai.api.core.lifecycle import warmup_imports
+
+    def child_exit(server, worker):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
+
+    class ProductionServer(BaseApplication):
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from src.langgraphagenticai.api.app import app
+            return app
+
+    # Imports only; connections are opened per worker after the fork
+    warmup_imports()
+    print(f"🚀 Starting FastAPI with {workers} worker processes (preloaded)...")
+    ProductionServer({
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": True,
+        "graceful_timeout": graceful_timeout,
+        # News runs can take minutes; don't let the arbiter kill busy workers
+        "timeout": worker_timeout,
+        "child_exit": child_exit,
+        "loglevel": "info",
+    }).run()
 
 
 if __name__ == "__main__":
@@ -55,19 +136,35 @@ if __name__ == "__main__":
     project_root = os.path.dirname(os.path.abspath(__file__))
     sys.path.insert(0, project_root)
     # --- END FIX ---
-    
+
+    parser = argparse.ArgumentParser(description="Run the News Weaver application.")
+    parser.add_argument("--mode", choices=["streamlit", "fastapi", "both", "production"], default="both")
+    parser.add_argument("--host", default="0.0.0.0", help="Host for production mode.")
+    parser.add_argument("--port", type=int, default=8000, help="Port for the FastAPI server.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes in production mode.")
+    parser.add_argument("--graceful-timeout", type=int, default=120, help="Seconds to drain in-flight work on shutdown.")
+    parser.add_argument("--worker-timeout", type=int, default=600, help="Seconds a busy worker may go silent before it is restarted.")
+    args = parser.parse_args()
+
     # Load environment variables from .env file
     load_dotenv()
 
     # Ensure the 'News' directory exists before starting servers
     os.makedirs("News", exist_ok=True)
 
-    # Run FastAPI in a separate thread
-    fastapi_thread = threading.Thread(target=run_fastapi, daemon=True)
-    fastapi_thread.start()
+    if args.mode == "streamlit":
+        run_streamlit()
+    elif args.mode == "fastapi":
+        run_fastapi(args.port)
+    elif args.mode == "production":
+        run_production(args.host, args.port, args.workers, args.graceful_timeout, args.worker_timeout)
+    else:
+        # Run FastAPI in a separate thread
+        fastapi_thread = threading.Thread(target=run_fastapi, args=(args.port,), daemon=True)
+        fastapi_thread.start()
 
-    # Give the FastAPI server a moment to start up before launching Streamlit
-    time.sleep(3)
+        # Give the FastAPI server a moment to start up before launching Streamlit
+        time.sleep(3)
 
-    # Run Streamlit in the main thread
-    run_streamlit()
\ No newline at end of file
+        # Run Streamlit in the main thread as a client of the FastAPI server
+        run_streamlit(backend_url=f"http://localhost:{args.port}")
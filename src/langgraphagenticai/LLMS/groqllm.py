@@ -1,8 +1,8 @@
 # src/langgraphagenticai/LLMS/groqllm.py
 
 import os
-import streamlit as st
-from langchain_groq import ChatGroq
+from src.langgraphagenticai.LLMS.resilience import request_timeout
+from src.langgraphagenticai.monitoring.metrics import DependencyMetricsCallback
 
 class GroqLLM:
     def __init__(self,user_contols_input):
@@ -10,12 +10,17 @@ class GroqLLM:
 
     def get_llm_model(self):
         try:
+            # Imported on first use so API cold starts don't pay for the Groq SDK
+            from langchain_groq import ChatGroq
+
             groq_api_key=self.user_controls_input["GROQ_API_KEY"]
             selected_groq_model=self.user_controls_input["selected_groq_model"]
-            if groq_api_key=='' and os.environ["GROQ_API_KEY"] =='':
-                st.error("Please Enter the Groq API KEY")
+            if groq_api_key=='' and os.getenv("GROQ_API_KEY", '')=='':
+                raise ValueError("Please Enter the Groq API KEY")
 
-            llm=ChatGroq(api_key=groq_api_key,model=selected_groq_model)
+            # A request timeout, so calls abandoned during a provider hang don't hold threads indefinitely
+            llm=ChatGroq(api_key=groq_api_key,model=selected_groq_model,timeout=request_timeout(),
+                         max_retries=int(os.getenv("LLM_REQUEST_MAX_RETRIES","2")),callbacks=[DependencyMetricsCallback("groq")])
 
         except Exception as e:
             raise ValueError(f"Error Ocuured With Exception : {e}")
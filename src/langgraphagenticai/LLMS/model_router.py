@@ -0,0 +1,96 @@
+# src/langgraphagenticai/LLMS/model_router.py
+
+import os
+from src.langgraphagenticai.LLMS.groqllm import GroqLLM
+from src.langgraphagenticai.LLMS.resilience import LLMError, call_llm
+from src.langgraphagenticai.monitoring.metrics import MODEL_CALLS
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+STAGES = ("chunk_summary", "merge", "translation")
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ui", "uiconfigfile.ini")
+
+def create_llm(model_name: str):
+    """Creates a Groq chat model using the API key from the environment."""
+    return GroqLLM(user_contols_input={"GROQ_API_KEY": os.getenv("GROQ_API_KEY", ""), "selected_groq_model": model_name}).get_llm_model()
+
+class ModelRouter:
+    """
+    Picks the model for each news pipeline stage and escalates to a larger one when
+    the output fails validation.
+
+    Cheap, high-volume stages (chunk summaries, translation) default to a small model;
+    the final merge uses the large one. Stages without a configured model use `default_llm`.
+    With `chunk_size` None, news is summarized in a single call instead of per chunk.
+    """
+    def __init__(self, default_llm, stage_models: dict | None = None, tiers: list | None = None,
+                 chunk_size: int | None = None, min_link_coverage: float = 0.5):
+        self.default_llm = default_llm
+        self.default_model = getattr(default_llm, "model_name", None)
+        self.stage_models = {stage: model for stage, model in (stage_models or {}).items() if model}
+        self.tiers = tiers or []
+        self.chunk_size = chunk_size
+        self.min_link_coverage = min_link_coverage
+        self.calls = []
+        self._llms = {}
+
+    @classmethod
+    def from_config(cls, default_llm, overrides: dict | None = None, config_file: str = CONFIG_FILE):
+        """Builds a router from the [MODEL_ROUTING] section; `overrides` maps stage -> model per request."""
+        routing = Config(config_file).get_model_routing()
+        stage_models = {**routing.get("stage_models", {}), **(overrides or {})}
+        return cls(default_llm, stage_models, routing.get("tiers"),
+                   routing.get("chunk_size"), routing.get("min_link_coverage", 0.5))
+
+    def model_for(self, stage: str) -> str | None:
+        return self.stage_models.get(stage, self.default_model)
+
+    def routing(self) -> dict:
+        """The model each stage starts with: {stage: model}."""
+        return {stage: self.model_for(stage) for stage in STAGES}
+
+    def llm(self, model_name: str | None):
+        if model_name is None or model_name == self.default_model:
+            return self.default_llm
+        if model_name not in self._llms:
+            self._llms[model_name] = create_llm(model_name)
+        return self._llms[model_name]
+
+    def escalation_path(self, stage: str) -> list:
+        """The stage's model followed by every larger tier."""
+        model = self.model_for(stage)
+        if model in self.tiers:
+            return self.tiers[self.tiers.index(model):]
+        return [model]
+
+    def run(self, stage: str, call, validate):
+        """
+        Runs `call(llm)` with the stage's model, under the stage deadline, hedging and the
+        model's circuit breaker, and checks the result with `validate(output)`, which returns
+        a list of problems. On problems or an LLMError, retries with the next larger model.
+        The last model's output is returned even if it fails validation; its LLMError is raised.
+        """
+        path = self.escalation_path(stage)
+        for i, model in enumerate(path):
+            llm = self.llm(model)
+            try:
+                output = call_llm(stage, model, lambda: call(llm))
+                problems = validate(output)
+            except LLMError as e:
+                if i == len(path) - 1:
+                    self.calls.append({"stage": stage, "model": model, "problems": [str(e)]})
+                    raise
+                output, problems = None, [f"{type(e).__name__}: {e}"]
+            escalate = bool(problems) and i < len(path) - 1
+            self.calls.append({"stage": stage, "model": model, "problems": problems})
+            MODEL_CALLS.labels(stage, model or "default", "escalated" if escalate else "ok").inc()
+            if not escalate:
+                return output
+            print(f"Escalating {stage} from {model} to {path[i + 1]}: {'; '.join(problems)}")
+        return output
+
+    def report(self) -> dict:
+        return {
+            "stage_models": self.routing(),
+            "calls": self.calls,
+            "failed_validations": sum(1 for call in self.calls if call["problems"]),
+        }
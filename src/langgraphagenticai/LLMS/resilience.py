@@ -0,0 +1,191 @@
+# src/langgraphagenticai/LLMS/resilience.py
+
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from src.langgraphagenticai.monitoring.metrics import LLM_FAILURES, LLM_HEDGES
+
+# Seconds a stage may take in total, hedges included. LLM_DEADLINE_<STAGE>_SECONDS overrides.
+STAGE_DEADLINE_SECONDS = {"chunk_summary": 30.0, "merge": 90.0, "translation": 60.0}
+DEFAULT_DEADLINE_SECONDS = float(os.getenv("LLM_DEADLINE_SECONDS", "90"))
+HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "true").lower() not in ("0", "false", "no")
+# Hedge after the p95 latency of the stage and model, but never sooner than this
+HEDGE_MIN_DELAY_SECONDS = float(os.getenv("LLM_HEDGE_MIN_DELAY_SECONDS", "2"))
+HEDGE_MIN_SAMPLES = 20
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_SECONDS = float(os.getenv("LLM_CIRCUIT_RESET_SECONDS", "30"))
+
+class LLMError(Exception):
+    """Base class for failed LLM calls."""
+    def __init__(self, message: str, stage: str | None = None, model: str | None = None):
+        super().__init__(message)
+        self.stage = stage
+        self.model = model
+
+class LLMTimeoutError(LLMError):
+    """The call did not finish within its stage deadline."""
+
+class CircuitOpenError(LLMError):
+    """The model failed repeatedly and is not being called until the circuit resets."""
+    def __init__(self, message: str, retry_after: float, stage: str | None = None, model: str | None = None):
+        super().__init__(message, stage, model)
+        self.retry_after = retry_after
+
+class LLMProviderError(LLMError):
+    """The provider returned an error."""
+
+def stage_deadline(stage: str) -> float:
+    override = os.getenv(f"LLM_DEADLINE_{stage.upper()}_SECONDS")
+    return float(override) if override else STAGE_DEADLINE_SECONDS.get(stage, DEFAULT_DEADLINE_SECONDS)
+
+def request_timeout() -> float:
+    """
+    HTTP timeout of a single provider request: by default the longest stage deadline, so an
+    attempt abandoned by `call_llm` ends soon after its deadline and frees its thread.
+    """
+    override = os.getenv("LLM_REQUEST_TIMEOUT_SECONDS")
+    if override:
+        return float(override)
+    return max(DEFAULT_DEADLINE_SECONDS, *(stage_deadline(stage) for stage in STAGE_DEADLINE_SECONDS))
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for `reset_timeout`
+    seconds. Then one trial call is let through (half-open): success closes the circuit,
+    failure opens it again.
+    """
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = CIRCUIT_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if time.monotonic() - self.opened_at >= self.reset_timeout else "open"
+
+    def before_call(self) -> float | None:
+        """Returns None if the call may proceed, otherwise the seconds until the next trial."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return None
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return None
+            return max(self.reset_timeout - (time.monotonic() - self.opened_at), 0.0) if state == "open" else self.reset_timeout
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+class LatencyWindow:
+    """Recent successful call latencies, used to derive the hedge delay."""
+    def __init__(self, size: int = 200):
+        self.samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        with self._lock:
+            self.samples.append(seconds)
+
+    def p95(self) -> float | None:
+        with self._lock:
+            if len(self.samples) < HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self.samples)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+_breakers = {}
+_latencies = {}
+_registry_lock = threading.Lock()
+
+def get_circuit_breaker(model: str) -> CircuitBreaker:
+    with _registry_lock:
+        return _breakers.setdefault(model, CircuitBreaker())
+
+def _latency_window(stage: str, model: str) -> LatencyWindow:
+    with _registry_lock:
+        return _latencies.setdefault((stage, model), LatencyWindow())
+
+@lru_cache(maxsize=1)
+def _executor() -> ThreadPoolExecutor:
+    # Abandoned attempts (timed out or beaten by a hedge) keep their thread until the provider
+    # answers or the client's request timeout (`request_timeout()`) ends them
+    return ThreadPoolExecutor(max_workers=int(os.getenv("LLM_CALL_THREADS", "32")), thread_name_prefix="llm-call")
+
+def call_llm(stage: str, model: str | None, call, deadline: float | None = None, hedge: bool = HEDGE_ENABLED):
+    """
+    Runs `call()` (one LLM request) with a deadline, an optional hedged duplicate and a
+    per-model circuit breaker. Returns the first successful result.
+
+    Raises CircuitOpenError without calling when the model's circuit is open,
+    LLMTimeoutError when no attempt finishes in time and LLMProviderError when all attempts fail.
+    """
+    model = model or "default"
+    breaker = get_circuit_breaker(model)
+    retry_after = breaker.before_call()
+    if retry_after is not None:
+        LLM_FAILURES.labels(stage, model, "circuit_open").inc()
+        raise CircuitOpenError(f"{model} is failing; not called for {retry_after:.0f}s", retry_after, stage, model)
+
+    deadline = deadline if deadline is not None else stage_deadline(stage)
+    window = _latency_window(stage, model)
+    p95 = window.p95()
+    hedge_delay = max(HEDGE_MIN_DELAY_SECONDS, p95) if hedge and p95 is not None else None
+
+    def attempt():
+        start = time.perf_counter()
+        result = call()
+        window.add(time.perf_counter() - start)
+        return result
+
+    # Each attempt runs in a copy of the caller's context so trace spans stay attached
+    submit = lambda: _executor().submit(contextvars.copy_context().run, attempt)
+    started = time.monotonic()
+    primary = submit()
+    pending = {primary}
+    hedge_due = hedge_delay is not None
+    hedged = False
+    error = None
+    while pending:
+        elapsed = time.monotonic() - started
+        if elapsed >= deadline:
+            break
+        wake_at = min(deadline, hedge_delay) if hedge_due else deadline
+        done, pending = wait(pending, timeout=max(wake_at - elapsed, 0), return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                breaker.record_success()
+                if hedged:
+                    LLM_HEDGES.labels(stage, model, "primary" if future is primary else "hedge").inc()
+                return future.result()
+            error = future.exception()
+        if hedge_due and pending and time.monotonic() - started >= hedge_delay:
+            # The primary is slower than usual: race a duplicate request against it
+            pending.add(submit())
+            hedge_due, hedged = False, True
+
+    breaker.record_failure()
+    if pending or error is None:
+        LLM_FAILURES.labels(stage, model, "timeout").inc()
+        raise LLMTimeoutError(f"{model} did not answer {stage} within {deadline:g}s", stage, model)
+    LLM_FAILURES.labels(stage, model, "provider_error").inc()
+    raise LLMProviderError(f"{model} failed during {stage}: {error}", stage, model) from error
@@ -1,16 +1,24 @@
 # src/langgraphagenticai/api/app.py
 
-from fastapi import FastAPI
+import math
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
-from src.langgraphagenticai.api.routes import chat, news, utils
+from src.langgraphagenticai.api.routes import chat, news, subscriptions, utils
+from src.langgraphagenticai.monitoring.metrics import metrics_middleware
+from src.langgraphagenticai.monitoring.tracing import tracing_middleware
+from src.langgraphagenticai.api.core.lifecycle import lifespan
+from src.langgraphagenticai.LLMS.resilience import LLMError, LLMTimeoutError, CircuitOpenError
+from src.langgraphagenticai.api.core.admission import OverloadedError
 
 # Load environment variables at the start
 load_dotenv()
 
 app = FastAPI(
     title="News Weaver",
-    description="An API for a news agent, a web-enabled chatbot, and a basic chatbot."
+    description="An API for a news agent, a web-enabled chatbot, and a basic chatbot.",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -22,7 +30,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Record per-route latency and in-flight requests for /metrics
+app.middleware("http")(metrics_middleware)
+# Per-request trace IDs, Server-Timing spans and opt-in profiling (X-Profile: <PROFILING_TOKEN>)
+app.middleware("http")(tracing_middleware)
+
+@app.exception_handler(LLMError)
+async def llm_error_handler(request: Request, exc: LLMError):
+    """Maps failed LLM calls to gateway errors instead of a generic 500."""
+    # Set when a checkpointed news run failed, so the client can resume it
+    headers = {"X-Run-Id": exc.run_id} if getattr(exc, "run_id", None) else {}
+    if isinstance(exc, CircuitOpenError):
+        headers["Retry-After"] = str(math.ceil(exc.retry_after))
+        return JSONResponse(status_code=503, content={"detail": str(exc)}, headers=headers)
+    status_code = 504 if isinstance(exc, LLMTimeoutError) else 502
+    return JSONResponse(status_code=status_code, content={"detail": str(exc)}, headers=headers)
+
+@app.exception_handler(OverloadedError)
+async def overloaded_handler(request: Request, exc: OverloadedError):
+    """Sheds load fast: 429 when the route's queue is full, 503 when a queued request waited too long."""
+    return JSONResponse(status_code=exc.status_code, content={"detail": str(exc)}, headers={"Retry-After": str(exc.retry_after)})
+
 # Include the routers from the different route files
 app.include_router(utils.router, tags=["Utility"])
 app.include_router(chat.router, prefix="/chat", tags=["Chat"])
-app.include_router(news.router, prefix="/news", tags=["News & Files"])
\ No newline at end of file
+app.include_router(news.router, prefix="/news", tags=["News & Files"])
+app.include_router(subscriptions.router, prefix="/subscriptions", tags=["Subscriptions"])
\ No newline at end of file
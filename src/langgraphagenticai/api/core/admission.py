@@ -0,0 +1,194 @@
+# src/langgraphagenticai/api/core/admission.py
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from functools import lru_cache
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import iterate_in_threadpool
+from src.langgraphagenticai.monitoring.metrics import ADMISSION_QUEUE_DEPTH, ADMISSION_REJECTED, observe_admission_wait
+from src.langgraphagenticai.monitoring.tracing import profile_current_thread
+
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "true").lower() not in ("0", "false", "no")
+# Route group: (concurrent executions, queued requests, seconds a request may wait in the queue).
+# ADMISSION_<GROUP>_CONCURRENCY / _QUEUE / _QUEUE_TIMEOUT_SECONDS override them per worker process.
+ADMISSION_LIMITS = {
+    "news": (4, 16, 30.0),
+    "chat": (16, 64, 10.0),
+    "translate": (8, 32, 15.0),
+}
+
+class OverloadedError(Exception):
+    """The request was shed: 429 when the queue is full, 503 when it waited too long for a slot."""
+    def __init__(self, message: str, status_code: int, retry_after: int):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+class AdmissionController:
+    """
+    Bounds the concurrent executions of a route group. Requests beyond `max_concurrent` wait
+    in a FIFO queue of at most `max_queue` entries for up to `queue_timeout` seconds; past
+    that they are rejected at once with a Retry-After estimated from recent execution times.
+    Belongs to one event loop; the work itself runs in worker threads.
+    """
+    def __init__(self, group: str, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.group = group
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._waiters = deque()
+        self._mean_seconds = None  # moving average of execution time
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Seconds until a request arriving now would likely get a slot."""
+        mean = self._mean_seconds or self.queue_timeout
+        return max(1, math.ceil(mean * (self.queue_depth + 1) / self.max_concurrent))
+
+    def _reject(self, reason: str, status_code: int, message: str):
+        self.rejected += 1
+        ADMISSION_REJECTED.labels(self.group, reason).inc()
+        raise OverloadedError(message, status_code, self.retry_after())
+
+    async def acquire(self) -> float:
+        """Waits for an execution slot. Returns the seconds spent waiting or raises OverloadedError."""
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            observe_admission_wait(self.group, 0.0)
+            return 0.0
+        if len(self._waiters) >= self.max_queue:
+            self._reject("queue_full", 429, f"Too many {self.group} requests queued; try again later.")
+
+        started = time.perf_counter()
+        slot = asyncio.get_running_loop().create_future()
+        self._waiters.append(slot)
+        ADMISSION_QUEUE_DEPTH.labels(self.group).inc()
+        try:
+            await asyncio.wait_for(slot, self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if slot.done() and not slot.cancelled():
+                # The slot was handed over just as the wait ended; pass it on
+                self.release()
+            else:
+                self._remove_waiter(slot)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self._reject("queue_timeout", 503, f"No {self.group} execution slot became free within {self.queue_timeout:g}s.")
+        waited = time.perf_counter() - started
+        self.admitted += 1
+        observe_admission_wait(self.group, waited)
+        return waited
+
+    def _remove_waiter(self, slot):
+        try:
+            self._waiters.remove(slot)
+            ADMISSION_QUEUE_DEPTH.labels(self.group).dec()
+        except ValueError:
+            pass
+
+    def release(self):
+        """Frees a slot, handing it straight to the oldest waiter if there is one."""
+        while self._waiters:
+            slot = self._waiters.popleft()
+            ADMISSION_QUEUE_DEPTH.labels(self.group).dec()
+            if not slot.done():
+                slot.set_result(None)
+                return
+        self.active -= 1
+
+    def _finished(self, seconds: float):
+        self._mean_seconds = seconds if self._mean_seconds is None else 0.8 * self._mean_seconds + 0.2 * seconds
+        self.release()
+
+    async def run(self, fn, *args):
+        """
+        Runs the blocking `fn(*args)` in a worker thread once admitted and returns its result.
+        The slot is held until the thread finishes, even if the client disconnects first.
+        """
+        await self.acquire()
+        started = time.perf_counter()
+        task = asyncio.ensure_future(asyncio.to_thread(_run_profiled, fn, *args))
+
+        def finished(task):
+            if not task.cancelled():
+                task.exception()  # retrieved here when the awaiting request was cancelled
+            self._finished(time.perf_counter() - started)
+        task.add_done_callback(finished)
+        return await asyncio.shield(task)
+
+    async def streaming_response(self, chunks, media_type: str) -> StreamingResponse:
+        """
+        Admits a streamed response: waits for a slot, then iterates the blocking generator
+        `chunks` in worker threads, holding the slot until it is exhausted or the client leaves.
+        """
+        await self.acquire()
+        started = time.perf_counter()
+        released = False
+
+        async def finish():
+            # Runs from the generator and again as the response's background task; the
+            # latter covers streams the client abandons before the first chunk
+            nonlocal released
+            if not released:
+                released = True
+                self._finished(time.perf_counter() - started)
+
+        async def admitted_chunks():
+            try:
+                async for chunk in iterate_in_threadpool(chunks):
+                    yield chunk
+            finally:
+                await finish()
+        return StreamingResponse(admitted_chunks(), media_type=media_type, background=BackgroundTask(finish))
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "queued": self.queue_depth,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "queue_timeout_s": self.queue_timeout,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "mean_execution_s": round(self._mean_seconds, 3) if self._mean_seconds is not None else None,
+        }
+
+def _run_profiled(fn, *args):
+    with profile_current_thread():
+        return fn(*args)
+
+class _Unlimited(AdmissionController):
+    """Used when ADMISSION_ENABLED is false: every request is admitted at once."""
+    async def acquire(self) -> float:
+        self.active += 1
+        self.admitted += 1
+        return 0.0
+
+    def release(self):
+        self.active -= 1
+
+@lru_cache(maxsize=None)
+def get_admission_controller(group: str) -> AdmissionController:
+    max_concurrent, max_queue, queue_timeout = ADMISSION_LIMITS[group]
+    prefix = f"ADMISSION_{group.upper()}"
+    controller_class = AdmissionController if ADMISSION_ENABLED else _Unlimited
+    return controller_class(
+        group,
+        max_concurrent=int(os.getenv(f"{prefix}_CONCURRENCY", str(max_concurrent))),
+        max_queue=int(os.getenv(f"{prefix}_QUEUE", str(max_queue))),
+        queue_timeout=float(os.getenv(f"{prefix}_QUEUE_TIMEOUT_SECONDS", str(queue_timeout))),
+    )
+
+def admission_stats() -> dict:
+    return {group: get_admission_controller(group).stats() for group in ADMISSION_LIMITS}
@@ -1,7 +1,8 @@
 # src/langgraphagenticai/api/core/dependencies.py
 
+import hmac
 import os
-from fastapi import HTTPException
+from fastapi import Header, HTTPException
 from typing import Optional
 from src.langgraphagenticai.LLMS.groqllm import GroqLLM
 
@@ -23,4 +24,16 @@ def check_tool_keys():
 def check_email_credentials(recipient_email: Optional[str]):
     """Checks for email credentials if an email is to be sent."""
     if recipient_email and not (os.getenv("GMAIL_SENDER_EMAIL") and os.getenv("GMAIL_SENDER_PASSWORD")):
-        raise HTTPException(status_code=400, detail="Email credentials (GMAIL_SENDER_EMAIL, GMAIL_SENDER_PASSWORD) must be set in the .env file to send emails.")   
\ No newline at end of file
+        raise HTTPException(status_code=400, detail="Email credentials (GMAIL_SENDER_EMAIL, GMAIL_SENDER_PASSWORD) must be set in the .env file to send emails.")
+
+
+def is_admin(admin_token: Optional[str]) -> bool:
+    """True if `admin_token` matches ADMIN_TOKEN. Admin access is off while ADMIN_TOKEN is unset."""
+    expected = os.getenv("ADMIN_TOKEN", "")
+    return bool(expected) and admin_token is not None and hmac.compare_digest(admin_token, expected)
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Route dependency for operator-only endpoints: requires the X-Admin-Token header."""
+    if not is_admin(x_admin_token):
+        raise HTTPException(status_code=403, detail="This endpoint requires a valid X-Admin-Token (see ADMIN_TOKEN).")
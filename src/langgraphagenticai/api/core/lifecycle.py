@@ -0,0 +1,74 @@
+# src/langgraphagenticai/api/core/lifecycle.py
+
+import asyncio
+import importlib
+import os
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from src.langgraphagenticai.monitoring.metrics import GRAPH_RUNS_IN_PROGRESS
+from src.langgraphagenticai.storage.artifacts import get_artifact_writer
+
+GRACEFUL_TIMEOUT_SECONDS = float(os.getenv("GRACEFUL_TIMEOUT_SECONDS", "120"))
+
+# Modules deferred by the lazy imports; production workers load them before serving
+WARMUP_MODULES = [
+    "langchain_groq",
+    "langgraph.prebuilt",
+    "src.langgraphagenticai.nodes.ai_news_node",
+    "src.langgraphagenticai.tools.search_tool",
+    "src.langgraphagenticai.tools.pdf_tool",
+    "src.langgraphagenticai.tools.email_tool",
+    "src.langgraphagenticai.cache.prompt_cache",
+    "src.langgraphagenticai.storage.article_archive",
+]
+
+
+_inflight_runs = 0
+_inflight_changed = threading.Condition()
+
+@contextmanager
+def graph_run(usecase: str):
+    """Marks a graph execution as in flight so shutdown can wait for it to finish."""
+    global _inflight_runs
+    with _inflight_changed:
+        _inflight_runs += 1
+    GRAPH_RUNS_IN_PROGRESS.labels(usecase).inc()
+    try:
+        yield
+    finally:
+        GRAPH_RUNS_IN_PROGRESS.labels(usecase).dec()
+        with _inflight_changed:
+            _inflight_runs -= 1
+            _inflight_changed.notify_all()
+
+def wait_for_inflight_runs(timeout: float) -> bool:
+    """Blocks until no graph runs are in flight or the timeout expires. Returns True if drained."""
+    with _inflight_changed:
+        return _inflight_changed.wait_for(lambda: _inflight_runs == 0, timeout=timeout)
+
+def warmup_imports():
+    """Imports the lazily loaded modules. Safe to call before forking workers (no connections are opened)."""
+    for module in WARMUP_MODULES:
+        importlib.import_module(module)
+
+def warmup_worker():
+    """Per-process warmup: imports plus process-local resources such as SQLite connections."""
+    from src.langgraphagenticai.cache.prompt_cache import get_prompt_cache
+    from src.langgraphagenticai.memory.checkpointer import get_checkpointer
+
+    warmup_imports()
+    get_checkpointer()
+    get_prompt_cache()
+    print(f"Worker {os.getpid()} warmed up.")
+
+@asynccontextmanager
+async def lifespan(app):
+    """FastAPI lifespan: optional warmup on startup, draining in-flight graph runs and artifact writes on shutdown."""
+    if os.getenv("WARMUP_ON_STARTUP", "false").lower() in ("1", "true", "yes"):
+        await asyncio.to_thread(warmup_worker)
+    yield
+    drained = await asyncio.to_thread(wait_for_inflight_runs, GRACEFUL_TIMEOUT_SECONDS)
+    if not drained:
+        print(f"Worker {os.getpid()} shutting down with graph runs still in flight after {GRACEFUL_TIMEOUT_SECONDS}s.")
+    if not await asyncio.to_thread(get_artifact_writer().flush, GRACEFUL_TIMEOUT_SECONDS):
+        print(f"Worker {os.getpid()} shutting down with artifact writes still pending.")
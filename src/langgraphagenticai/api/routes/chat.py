@@ -6,32 +6,84 @@ from langchain_core.messages import AIMessage, ToolMessage, HumanMessage
 from src.langgraphagenticai.api.schemas.models import ChatRequest, WebChatRequest, ChatResponse, WebChatResponse
 from src.langgraphagenticai.api.core.dependencies import initialize_llm, check_tool_keys
 from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.memory.checkpointer import get_checkpointer, thread_config, delete_thread
+from src.langgraphagenticai.monitoring.tracing import current_trace_id
+from src.langgraphagenticai.api.core.lifecycle import graph_run
+from src.langgraphagenticai.api.core.admission import OverloadedError, get_admission_controller
 
 router = APIRouter()
 
+def _build_chat_graph(llm, usecase: str, thread_id: str | None):
+    """Builds a chat graph, backed by the SQLite checkpointer when a thread_id is given."""
+    checkpointer = get_checkpointer() if thread_id else None
+    graph = GraphBuilder(llm).setup_graph(usecase, checkpointer=checkpointer)
+    config = thread_config(thread_id) if thread_id else None
+    return graph, config
+
+def _current_turn(messages: list) -> list:
+    """Returns the messages produced since the latest user message."""
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            return messages[i + 1:]
+    return messages
+
 @router.post("/basic", response_model=ChatResponse, summary="Basic Chatbot")
 async def basic_chatbot(request: ChatRequest):
     llm = initialize_llm(request.model if hasattr(request, 'model') else "llama3-8b-8192") # Handle model attribute for basic request
-    graph = GraphBuilder(llm).setup_graph("Basic Chatbot")
+    graph, config = _build_chat_graph(llm, "Basic Chatbot", request.thread_id)
+    inputs = {'messages': [("user", request.message)], 'trace_id': current_trace_id()}
+
+    def run_graph():
+        with graph_run("Basic Chatbot"):
+            return graph.invoke(inputs, config=config)
     try:
-        response = graph.invoke({'messages': [("user", request.message)]})
+        response = await get_admission_controller("chat").run(run_graph)
         ai_message = response['messages'][-1].content
-        return ChatResponse(success=True, response=ai_message)
+        return ChatResponse(success=True, response=ai_message, thread_id=request.thread_id)
+    except OverloadedError:
+        # Mapped to 429/503 with Retry-After by the app's OverloadedError handler
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chatbot processing failed: {str(e)}")
 
+@router.post("/basic/stream", summary="Basic Chatbot (streamed)")
+async def basic_chatbot_stream(request: ChatRequest):
+    """Streams the answer as plain-text chunks while the LLM generates it."""
+    llm = initialize_llm(request.model if hasattr(request, 'model') else "llama3-8b-8192")
+    graph, config = _build_chat_graph(llm, "Basic Chatbot", request.thread_id)
+    inputs = {'messages': [("user", request.message)], 'trace_id': current_trace_id()}
+
+    def chunks():
+        with graph_run("Basic Chatbot"):
+            try:
+                for chunk, metadata in graph.stream(inputs, config=config, stream_mode="messages"):
+                    # Skip tokens from other nodes, e.g. the context summarizer
+                    if metadata.get("langgraph_node") == "chatbot" and isinstance(chunk.content, str) and chunk.content:
+                        yield chunk.content
+            except Exception as e:
+                # Headers are already sent, so report the failure in-band
+                yield f"\n\n[Chatbot processing failed: {str(e)}]"
+
+    return await get_admission_controller("chat").streaming_response(chunks(), media_type="text/plain; charset=utf-8")
+
 @router.post("/web", response_model=WebChatResponse, summary="Web-Enabled Chatbot")
 async def web_chatbot(request: WebChatRequest):
     check_tool_keys()
     llm = initialize_llm(request.model)
-    graph = GraphBuilder(llm).setup_graph("Chatbot With Web")
+    graph, config = _build_chat_graph(llm, "Chatbot With Web", request.thread_id)
     try:
-        initial_state = {"messages": [HumanMessage(content=request.message)]}
-        final_response = graph.invoke(initial_state)
+        initial_state = {"messages": [HumanMessage(content=request.message)], "trace_id": current_trace_id()}
+
+        def run_graph():
+            with graph_run("Chatbot With Web"):
+                return graph.invoke(initial_state, config=config)
+        final_response = await get_admission_controller("chat").run(run_graph)
         
+        # Only look at this turn; with a thread_id the state also holds earlier turns
+        turn_messages = _current_turn(final_response['messages'])
         ai_message = ""
-        tool_outputs = [json.loads(msg.content) for msg in final_response['messages'] if isinstance(msg, ToolMessage)]
-        for msg in final_response['messages']:
+        tool_outputs = [json.loads(msg.content) for msg in turn_messages if isinstance(msg, ToolMessage)]
+        for msg in turn_messages:
             if isinstance(msg, AIMessage) and msg.content:
                 ai_message = msg.content
                 break
@@ -39,6 +91,16 @@ async def web_chatbot(request: WebChatRequest):
         if not ai_message:
             raise HTTPException(status_code=500, detail="Failed to get a final response from the AI.")
             
-        return WebChatResponse(success=True, response=ai_message, tool_outputs=tool_outputs)
+        return WebChatResponse(success=True, response=ai_message, tool_outputs=tool_outputs, thread_id=request.thread_id)
+    except OverloadedError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Web Chatbot processing failed: {str(e)}")
+
+@router.delete("/threads/{thread_id}", summary="Clear Conversation Memory")
+async def clear_thread(thread_id: str):
+    try:
+        delete_thread(thread_id)
+        return {"success": True, "message": f"Conversation thread '{thread_id}' cleared."}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Web Chatbot processing failed: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to clear thread: {str(e)}")
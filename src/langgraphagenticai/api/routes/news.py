@@ -1,30 +1,217 @@
 # src/langgraphagenticai/api/routes/news.py
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi.responses import FileResponse, Response
+import asyncio
 import os
-from src.langgraphagenticai.api.schemas.models import NewsInvokeRequest, NewsRequest, NewsResponse
+import uuid
+from src.langgraphagenticai.api.schemas.models import NewsInvokeRequest, NewsRequest, NewsResponse, NewsResumeRequest
 from src.langgraphagenticai.api.core.dependencies import initialize_llm, check_tool_keys, check_email_credentials
 from src.langgraphagenticai.graph.graph_builder import GraphBuilder
 from src.langgraphagenticai.utils.message_parser import NewsMessageParser
 from src.langgraphagenticai.tools.translation_tool import SUPPORTED_LANGUAGES
+from src.langgraphagenticai.monitoring.tracing import current_trace_id
+from src.langgraphagenticai.api.core.lifecycle import graph_run
+from src.langgraphagenticai.api.core.admission import OverloadedError, get_admission_controller
+from src.langgraphagenticai.cache.digest_cache import digest_key, get_digest_cache
+from src.langgraphagenticai.storage.artifacts import get_artifact_writer
+from src.langgraphagenticai.storage.archive import get_archive_store
+from src.langgraphagenticai.LLMS.model_router import STAGES, ModelRouter
+from src.langgraphagenticai.LLMS.resilience import LLMError
+from src.langgraphagenticai.memory.checkpointer import get_news_checkpointer, thread_config
+from src.langgraphagenticai.memory.news_runs import RunConflictError, get_news_run_registry
 
 router = APIRouter()
 
-def _run_news_graph_and_get_path(llm, frequency: str, topic: str, language: str, recipient_email: str | None) -> str:
-    """Helper function to build and run the news graph, returning the output file path."""
+# With defer_delivery the response is sent before these nodes; they finish in the background
+DEFERRED_NODES = ["convert_to_pdf"]
+
+def _check_stage_models(stage_models: dict | None):
+    unknown = set(stage_models or {}) - set(STAGES)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown pipeline stages: {', '.join(sorted(unknown))}. Valid stages: {', '.join(STAGES)}")
+
+def _run_news_graph(llm, frequency: str, topic: str, language: str, recipient_email: str | None, stage_models: dict | None = None,
+                    since_last_digest: bool = False, feed_id: str | None = None, run_id: str | None = None,
+                    defer_delivery: bool = False) -> dict:
+    """
+    Helper function to build and run the news graph, returning the final state with the in-memory artifact.
+    A delta digest with no new articles returns a state without an artifact.
+    Each node's output is checkpointed under `run_id`, so repeating a request with the run ID of a
+    failed run resumes it from the failed node, and with that of a finished run returns its result.
+    With `defer_delivery` the run pauses once the markdown is saved (`delivery_pending` in the state);
+    `_finish_deferred_run` then renders the PDF and sends the email.
+    """
     user_message = f"{frequency}:{topic}:{language}:{recipient_email or ''}"
-    graph = GraphBuilder(llm).setup_graph("News")
-    final_state = graph.invoke({"messages": [("user", user_message)]})
-    md_path = final_state.get('md_filename')
-    if not md_path or not os.path.exists(md_path):
+    inputs = {"messages": [("user", user_message)], "trace_id": current_trace_id(),
+              "since_last_digest": since_last_digest, "digest_feed": feed_id}
+    request = f"{user_message}|{since_last_digest}|{feed_id or ''}"
+    return _execute_news_run(llm, stage_models, run_id or uuid.uuid4().hex, request, inputs, defer_delivery)
+
+def _execute_news_run(llm, stage_models: dict | None, run_id: str, request: str, inputs: dict | None, defer_delivery: bool = False) -> dict:
+    """Starts, resumes or returns the checkpointed run `run_id`. With `inputs` None the run must already exist."""
+    graph = GraphBuilder(llm, stage_models=stage_models).setup_graph("News", checkpointer=get_news_checkpointer())
+    config = thread_config(run_id)
+    registry = get_news_run_registry()
+    try:
+        with registry.claim(run_id, request):
+            snapshot = graph.get_state(config)
+            if snapshot.values and not snapshot.next:
+                final_state = snapshot.values
+            elif inputs is None and not snapshot.next:
+                raise HTTPException(status_code=404, detail=f"News run '{run_id}' has no checkpoint to resume from.")
+            else:
+                if snapshot.next:
+                    print(f"[trace {current_trace_id()}] Resuming news run {run_id} at {', '.join(snapshot.next)}")
+                    inputs = None
+                # Only fresh runs pause; a resumed one is finished in full
+                interrupt_before = DEFERRED_NODES if defer_delivery and inputs is not None else None
+                final_state = _invoke_news_run(graph, config, registry, run_id, inputs, interrupt_before)
+            delivery_pending = bool(graph.get_state(config).next)
+            registry.finish(run_id, deferred=delivery_pending)
+    except RunConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if final_state.get('artifact') is None and not _nothing_new(final_state):
         raise HTTPException(status_code=500, detail="News agent failed to generate the summary file.")
-    return md_path
+    _remember_digest(final_state, run_id, _digest_key(llm, stage_models, final_state['frequency'], final_state['topic'],
+                                                      final_state['target_language']))
+    return {**final_state, 'run_id': run_id, 'delivery_pending': delivery_pending}
+
+def _digest_key(llm, stage_models: dict | None, frequency: str, topic: str, language: str) -> str:
+    """The digest cache key, including the request's model and the model each stage resolves to."""
+    router = ModelRouter.from_config(llm, stage_models)
+    return digest_key(frequency, topic, language, router.default_model, router.routing())
+
+def _remember_digest(final_state: dict, run_id: str, key: str):
+    """Caches a full (non-delta) digest for stale-while-revalidate serving."""
+    cache = get_digest_cache()
+    artifact = final_state.get('artifact')
+    if cache is None or artifact is None or final_state.get('since_last_digest'):
+        return
+    cache.put(key, {
+        "filename": artifact.md_name, "file_path": get_artifact_writer().location(artifact.md_path), "markdown": artifact.markdown,
+        "model_routing": final_state.get('model_routing'), "run_id": run_id,
+    })
+
+def _invoke_news_run(graph, config: dict, registry, run_id: str, inputs: dict | None, interrupt_before: list | None = None) -> dict:
+    try:
+        with graph_run("News"):
+            return graph.invoke(inputs, config, interrupt_before=interrupt_before)
+    except Exception as e:
+        # The last checkpoint is the one before the node that raised
+        failed_node = ", ".join(graph.get_state(config).next) or None
+        registry.finish(run_id, failed_node=failed_node, error=str(e) or type(e).__name__)
+        if isinstance(e, LLMError):
+            e.run_id = run_id
+            raise
+        raise HTTPException(status_code=500, headers={"X-Run-Id": run_id},
+                            detail=f"News run '{run_id}' failed at {failed_node or 'start'}: {e}. Retry with this run_id to resume it.")
+
+async def _finish_deferred_run(llm, stage_models: dict | None, run_id: str):
+    """
+    Background task: renders the PDF and sends the email of a run that returned early. It
+    takes a news execution slot like any other run, so deferred work cannot pile up past
+    the admission limits.
+    """
+    def finish():
+        return _execute_news_run(llm, stage_models, run_id, get_news_run_registry().get(run_id)['request'], None)
+    try:
+        await get_admission_controller("news").run(finish)
+    except Exception as e:
+        # The run keeps its checkpoint; GET /news/runs/{run_id} reports it and the run can be resumed
+        print(f"Deferred delivery of news run {run_id} failed: {getattr(e, 'detail', e)}")
+
+def _schedule_delivery(final_state: dict, background_tasks: BackgroundTasks, llm, stage_models: dict | None):
+    if final_state.get('delivery_pending'):
+        background_tasks.add_task(_finish_deferred_run, llm, stage_models, final_state['run_id'])
+
+# Background refreshes, referenced until they finish
+_refreshes = set()
+
+def _keep_running(task: asyncio.Future, key: str | None = None):
+    """Lets a digest run finish after its request was answered from the cache."""
+    def finished(task):
+        _refreshes.discard(task)
+        if key is not None:
+            get_digest_cache().release_refresh(key)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Background digest refresh failed: {getattr(task.exception(), 'detail', task.exception())}")
+    _refreshes.add(task)
+    task.add_done_callback(finished)
+
+def _cached_response(entry: dict, status: str, response: Response, message: str, processing_details: dict) -> NewsResponse:
+    digest = entry['digest']
+    response.headers["Age"] = str(int(entry['age']))
+    response.headers["X-Digest-Cache"] = status
+    if status != "fresh":
+        response.headers["Warning"] = '111 - "Revalidation Failed"' if status == "stale-if-error" else '110 - "Response is Stale"'
+    return NewsResponse(success=True, message=message, run_id=digest.get('run_id'), filename=digest['filename'], file_path=digest['file_path'],
+                        markdown=digest['markdown'], model_routing=digest.get('model_routing'),
+                        digest_cache={"status": status, "age_seconds": round(entry['age'], 1)}, processing_details=processing_details)
+
+async def _serve_digest(llm, frequency: str, topic: str, language: str, stage_models: dict | None,
+                        response: Response, message: str, processing_details: dict) -> NewsResponse:
+    """
+    Stale-while-revalidate for plain digest requests: a fresh cached digest is returned at once;
+    a stale one is returned at once while a single background run refreshes it. Otherwise the
+    pipeline runs, but if it fails or outlasts the revalidation timeout the newest cached copy
+    is returned instead, with Age and Warning headers (a slow run still refreshes the cache).
+    """
+    cache = get_digest_cache()
+    key = _digest_key(llm, stage_models, frequency, topic, language)
+    entry = await asyncio.to_thread(cache.get, key)
+    controller = get_admission_controller("news")
+    if entry and entry['state'] == "fresh":
+        return _cached_response(entry, "fresh", response, message, processing_details)
+    if entry and entry['state'] == "stale":
+        if await asyncio.to_thread(cache.claim_refresh, key):
+            _keep_running(asyncio.ensure_future(controller.run(_run_news_graph, llm, frequency, topic, language, None, stage_models)), key)
+        return _cached_response(entry, "stale", response, message, processing_details)
+
+    run = asyncio.ensure_future(controller.run(_run_news_graph, llm, frequency, topic, language, None, stage_models))
+    try:
+        if entry is None:
+            final_state = await run
+        else:
+            final_state = await asyncio.wait_for(asyncio.shield(run), cache.revalidate_timeout)
+    except asyncio.TimeoutError:
+        _keep_running(run)
+        return _cached_response(entry, "stale", response, message, processing_details)
+    except (LLMError, OverloadedError, HTTPException) as e:
+        if entry is None or (isinstance(e, HTTPException) and e.status_code < 500):
+            raise
+        print(f"Serving a cached {frequency} '{topic}' digest, {int(entry['age'])}s old: {getattr(e, 'detail', e)}")
+        return _cached_response(entry, "stale-if-error", response, message, processing_details)
+    response.headers["X-Digest-Cache"] = "miss"
+    return _news_response(final_state, message, processing_details)
+
+def _cacheable(request) -> bool:
+    """Requests with side effects or their own run semantics always run the pipeline."""
+    return (request.allow_cached and get_digest_cache() is not None and not request.recipient_email
+            and not request.since_last_digest and not request.run_id and not request.defer_delivery)
+
+def _nothing_new(final_state: dict) -> bool:
+    return bool(final_state.get('since_last_digest')) and not final_state.get('news_data')
+
+def _news_response(final_state: dict, message: str, processing_details: dict) -> NewsResponse:
+    if _nothing_new(final_state):
+        return NewsResponse(success=True, message="No new articles since the last digest.", run_id=final_state.get('run_id'),
+                            delta=final_state.get('delta'), processing_details=processing_details)
+    artifact = final_state['artifact']
+    status_url = None
+    if final_state.get('delivery_pending'):
+        message = f"{message} The PDF and email are being delivered in the background."
+        status_url = f"/news/runs/{final_state['run_id']}"
+    return NewsResponse(success=True, message=message, run_id=final_state.get('run_id'), status_url=status_url, filename=artifact.md_name,
+                        file_path=get_artifact_writer().location(artifact.md_path),
+                        markdown=artifact.markdown, model_routing=final_state.get('model_routing'), delta=final_state.get('delta'),
+                        processing_details=processing_details)
 
 @router.post("/invoke", response_model=NewsResponse, summary="Invoke News Agent with Query")
-async def invoke_news_agent(request: NewsInvokeRequest):
+async def invoke_news_agent(request: NewsInvokeRequest, background_tasks: BackgroundTasks, response: Response):
     check_tool_keys()
     check_email_credentials(request.recipient_email)
+    _check_stage_models(request.stage_models)
     
     parser = NewsMessageParser()
     if not parser.is_news_request(request.query):
@@ -32,52 +219,133 @@ async def invoke_news_agent(request: NewsInvokeRequest):
     
     parsed = parser.parse_news_message(request.query)
     llm = initialize_llm(request.model)
+    if _cacheable(request):
+        return await _serve_digest(llm, parsed['frequency'], parsed['topic'], parsed['language'], request.stage_models,
+                                   response, "News processing initiated.", parsed)
 
-    md_path = _run_news_graph_and_get_path(llm, parsed['frequency'], parsed['topic'], parsed['language'], request.recipient_email)
+    final_state = await get_admission_controller("news").run(
+        _run_news_graph, llm, parsed['frequency'], parsed['topic'], parsed['language'], request.recipient_email, request.stage_models,
+        request.since_last_digest, request.feed_id, request.run_id, request.defer_delivery)
+    _schedule_delivery(final_state, background_tasks, llm, request.stage_models)
     
-    return NewsResponse(success=True, message=f"News processing initiated.", filename=os.path.basename(md_path), file_path=md_path, processing_details=parsed)
+    return _news_response(final_state, "News processing initiated.", parsed)
 
 @router.post("/structured", response_model=NewsResponse, summary="Fetch News with Structured Data")
-async def fetch_news_structured(request: NewsRequest):
+async def fetch_news_structured(request: NewsRequest, background_tasks: BackgroundTasks, response: Response):
     check_tool_keys()
     check_email_credentials(request.recipient_email)
     
     if request.language not in SUPPORTED_LANGUAGES:
         raise HTTPException(status_code=400, detail=f"Unsupported language: {request.language}")
+    _check_stage_models(request.stage_models)
         
     llm = initialize_llm(request.model)
+    if _cacheable(request):
+        return await _serve_digest(llm, request.frequency.lower(), request.topic, request.language, request.stage_models,
+                                   response, "News processed successfully.", request.dict())
     
-    md_path = _run_news_graph_and_get_path(llm, request.frequency.lower(), request.topic, request.language, request.recipient_email)
+    final_state = await get_admission_controller("news").run(
+        _run_news_graph, llm, request.frequency.lower(), request.topic, request.language, request.recipient_email, request.stage_models,
+        request.since_last_digest, request.feed_id, request.run_id, request.defer_delivery)
+    _schedule_delivery(final_state, background_tasks, llm, request.stage_models)
     
-    return NewsResponse(success=True, message="News processed successfully.", filename=os.path.basename(md_path), file_path=md_path, processing_details=request.dict())
+    return _news_response(final_state, "News processed successfully.", request.dict())
+
+@router.get("/articles/rollup", summary="Roll Up Archived Articles")
+async def rollup_articles(by: str = "date,topic", topic: str | None = None, days: float = 7):
+    from src.langgraphagenticai.storage.article_archive import get_article_archive
+
+    archive = get_article_archive()
+    if archive is None:
+        raise HTTPException(status_code=404, detail="The article archive is disabled.")
+    keys = tuple(key.strip() for key in by.split(",") if key.strip())
+    try:
+        rows = await asyncio.to_thread(archive.rollup, keys, topic, days)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"by": list(keys), "days": days, "groups": rows, "count": len(rows)}
+
+@router.get("/runs/{run_id}", summary="Get News Run Status")
+async def get_news_run(run_id: str):
+    run = get_news_run_registry().get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="News run not found.")
+    status = {key: value for key, value in run.items() if key != 'request'}
+    if run['status'] == 'completed':
+        checkpoint = get_news_checkpointer().get_tuple(thread_config(run_id))
+        artifact = checkpoint.checkpoint['channel_values'].get('artifact') if checkpoint else None
+        if artifact is not None and artifact.pdf:
+            status['pdf_url'] = f"/news/download/{artifact.pdf_name}"
+    return status
+
+@router.post("/runs/{run_id}/resume", response_model=NewsResponse, summary="Resume a Failed News Run")
+async def resume_news_run(run_id: str, request: NewsResumeRequest):
+    run = get_news_run_registry().get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="News run not found.")
+    _check_stage_models(request.stage_models)
+    llm = initialize_llm(request.model)
+
+    final_state = await get_admission_controller("news").run(
+        _execute_news_run, llm, request.stage_models, run_id, run['request'], None)
+
+    return _news_response(final_state, "News run resumed successfully.", {"run_id": run_id, "resumed_from": run['failed_node']})
+
+def _news_file(file_path: str, media_type: str) -> Response | None:
+    name = os.path.basename(file_path)
+    # A just-generated file may still be queued for writing; serve it from memory
+    data = get_artifact_writer().pending(file_path)
+    if data is None:
+        data = get_archive_store().get(name)
+    if data is not None:
+        return Response(content=data, media_type=media_type,
+                        headers={"Content-Disposition": f'attachment; filename="{name}"'})
+    # Files written before the archive existed stay loose in ./News
+    if os.path.exists(file_path):
+        return FileResponse(path=file_path, filename=name, media_type=media_type)
+    return None
 
 @router.get("/download/{filename}", summary="Download News File")
 async def download_file(filename: str):
-    file_path_pdf = f"./News/{filename.replace('.md', '.pdf')}"
-    if os.path.exists(file_path_pdf):
-        return FileResponse(path=file_path_pdf, filename=os.path.basename(file_path_pdf), media_type='application/pdf')
-    
-    file_path_md = f"./News/{filename}"
-    if os.path.exists(file_path_md):
-        return FileResponse(path=file_path_md, filename=filename, media_type='text/markdown')
+    candidates = [(f"./News/{filename.replace('.md', '.pdf')}", 'application/pdf'), (f"./News/{filename}", 'text/markdown')]
+    for file_path, media_type in candidates:
+        response = _news_file(file_path, media_type)
+        if response is not None:
+            return response
 
     raise HTTPException(status_code=404, detail="File not found.")
 
+@router.get("/files/{filename}", summary="Get News File")
+async def get_news_file(filename: str):
+    """Serves exactly the named file; `file_path` in news responses points here when files are archived."""
+    if not filename.endswith(('.md', '.pdf')) or os.path.basename(filename) != filename:
+        raise HTTPException(status_code=404, detail="File not found.")
+    response = _news_file(f"./News/{filename}", 'application/pdf' if filename.endswith('.pdf') else 'text/markdown')
+    if response is None:
+        raise HTTPException(status_code=404, detail="File not found.")
+    return response
+
 @router.get("/files", summary="List News Files")
 async def list_news_files():
     news_dir = "./News"
-    if not os.path.exists(news_dir):
-        return {"files": []}
-    files = [{"filename": f, "size_bytes": os.path.getsize(os.path.join(news_dir, f))} for f in os.listdir(news_dir) if f.endswith(('.md', '.pdf'))]
+    files = {entry["filename"]: entry for entry in get_archive_store().list()}
+    if os.path.exists(news_dir):
+        for f in os.listdir(news_dir):
+            if f.endswith(('.md', '.pdf')) and f not in files:
+                files[f] = {"filename": f, "size_bytes": os.path.getsize(os.path.join(news_dir, f))}
+    files = sorted(files.values(), key=lambda entry: entry["filename"])
     return {"files": files, "count": len(files)}
 
 @router.delete("/files/{filename}", summary="Delete News File")
 async def delete_news_file(filename: str):
     file_path = f"./News/{filename}"
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="File not found.")
     try:
-        os.remove(file_path)
-        return {"success": True, "message": f"File '{filename}' deleted successfully."}
+        deleted = get_archive_store().delete(filename)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+            deleted = True
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to delete file: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to delete file: {str(e)}")
+    if not deleted:
+        raise HTTPException(status_code=404, detail="File not found.")
+    return {"success": True, "message": f"File '{filename}' deleted successfully."}
@@ -0,0 +1,91 @@
+# src/langgraphagenticai/api/routes/subscriptions.py
+
+import asyncio
+from fastapi import APIRouter, Depends, Header, HTTPException
+from src.langgraphagenticai.api.schemas.models import SubscriptionRequest, DeliveryRequest
+from src.langgraphagenticai.api.core.dependencies import initialize_llm, check_tool_keys, check_email_credentials, is_admin, require_admin
+from src.langgraphagenticai.api.core.lifecycle import graph_run
+from src.langgraphagenticai.api.core.admission import get_admission_controller
+from src.langgraphagenticai.api.routes.news import _check_stage_models
+from src.langgraphagenticai.tools.email_tool import confirmation_email_text, send_email
+from src.langgraphagenticai.tools.translation_tool import SUPPORTED_LANGUAGES
+from src.langgraphagenticai.subscriptions.store import get_subscription_store
+
+router = APIRouter()
+
+FREQUENCIES = ("daily", "weekly", "monthly", "yearly")
+
+def _check_frequency(frequency: str):
+    if frequency.lower() not in FREQUENCIES:
+        raise HTTPException(status_code=400, detail=f"Unsupported frequency: {frequency}. Valid frequencies: {', '.join(FREQUENCIES)}")
+
+@router.post("", summary="Subscribe to a News Digest")
+async def subscribe(request: SubscriptionRequest, x_admin_token: str | None = Header(None)):
+    """
+    Emails the address a confirmation link; digests are only sent once it is opened. With
+    the admin token the subscription is confirmed immediately and returned with its tokens.
+    """
+    _check_frequency(request.frequency)
+    if request.language not in SUPPORTED_LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"Unsupported language: {request.language}")
+    if "@" not in request.email:
+        raise HTTPException(status_code=400, detail=f"Invalid email address: {request.email}")
+    check_email_credentials(request.email)
+    admin = is_admin(x_admin_token)
+    subscription = get_subscription_store().add(request.email, request.frequency, request.topic, request.language, confirmed=admin)
+    if admin:
+        return {"success": True, "subscription": subscription}
+    if subscription['confirmed_at'] is None:
+        subject, body = confirmation_email_text(subscription['frequency'], subscription['topic'], subscription['confirm_token'])
+        try:
+            await asyncio.to_thread(send_email, subscription['email'], subject, body)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to send the confirmation email: {str(e)}")
+    # The same answer whether or not the address was already subscribed
+    return {"success": True, "message": f"A confirmation link was sent to {request.email}."}
+
+@router.get("/confirm", summary="Confirm a Subscription")
+async def confirm_subscription(token: str):
+    """Opened from the confirmation email."""
+    subscription = get_subscription_store().confirm(token)
+    if subscription is None:
+        raise HTTPException(status_code=404, detail="Subscription not found.")
+    return {"success": True, "message": f"Subscribed to the {subscription['frequency']} news summary for '{subscription['topic']}'."}
+
+@router.get("", summary="List Subscriptions", dependencies=[Depends(require_admin)])
+async def list_subscriptions(frequency: str | None = None, email: str | None = None):
+    subscriptions = get_subscription_store().list(frequency, email)
+    return {"subscriptions": subscriptions, "count": len(subscriptions)}
+
+def _unsubscribe(token: str) -> dict:
+    subscription = get_subscription_store().remove(token)
+    if subscription is None:
+        raise HTTPException(status_code=404, detail="Subscription not found.")
+    return {"success": True, "message": f"Unsubscribed from the {subscription['frequency']} news summary for '{subscription['topic']}'."}
+
+@router.get("/unsubscribe", summary="Unsubscribe via Email Link")
+async def unsubscribe_link(token: str):
+    """Opened from the link at the bottom of every digest email."""
+    return _unsubscribe(token)
+
+@router.delete("/{unsubscribe_token}", summary="Unsubscribe")
+async def unsubscribe(unsubscribe_token: str):
+    return _unsubscribe(unsubscribe_token)
+
+@router.post("/deliver", summary="Deliver Subscribed Digests", dependencies=[Depends(require_admin)])
+async def deliver(request: DeliveryRequest):
+    """Generates each distinct digest of the frequency once and emails it to all of its subscribers."""
+    from src.langgraphagenticai.subscriptions.delivery import run_delivery_cycle
+
+    _check_frequency(request.frequency)
+    _check_stage_models(request.stage_models)
+    check_tool_keys()
+    check_email_credentials("subscribers")
+    llm = initialize_llm(request.model)
+
+    def deliver_cycle():
+        with graph_run("News"):
+            return run_delivery_cycle(llm, request.frequency.lower(), request.stage_models)
+    # Digests are generated one at a time, so a cycle holds one news execution slot
+    report = await get_admission_controller("news").run(deliver_cycle)
+    return {"success": not report["failed_digests"] and not report["failed_recipients"], **report}
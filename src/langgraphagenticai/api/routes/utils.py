@@ -1,9 +1,17 @@
 # src/langgraphagenticai/api/routes/utils.py
 
-from fastapi import APIRouter, HTTPException
-from src.langgraphagenticai.api.schemas.models import TranslationRequest, TranslationResponse
+import asyncio
+import os
+from fastapi import APIRouter, HTTPException, Response
+from src.langgraphagenticai.api.schemas.models import TranslationRequest, TranslationResponse, BatchTranslationRequest, BatchTranslationResponse
 from src.langgraphagenticai.api.core.dependencies import initialize_llm
 from src.langgraphagenticai.tools.translation_tool import SUPPORTED_LANGUAGES, create_translation_tool
+from src.langgraphagenticai.monitoring.metrics import render_metrics
+from src.langgraphagenticai.LLMS.resilience import LLMError
+from src.langgraphagenticai.cache.translation_cache import get_translation_cache
+from src.langgraphagenticai.api.core.admission import OverloadedError, admission_stats, get_admission_controller
+
+BATCH_MAX_TEXTS = 5000
 
 router = APIRouter()
 
@@ -15,6 +23,16 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@router.get("/metrics", summary="Prometheus Metrics")
+async def metrics():
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
+
+@router.get("/admission", summary="Admission Control Status")
+async def admission_status():
+    """Executions in flight, queue depth and shed requests per route group in this worker."""
+    return {"pid": os.getpid(), "groups": admission_stats()}
+
 @router.get("/languages", summary="Get Supported Languages")
 async def get_supported_languages():
     return {"supported_languages": SUPPORTED_LANGUAGES}
@@ -27,9 +45,35 @@ async def translate_text(request: TranslationRequest):
         raise HTTPException(status_code=400, detail=f"Unsupported language: {request.target_language}")
     
     llm = initialize_llm(request.model)
+    cache = get_translation_cache()
+    model = getattr(llm, "model_name", None)
+    cached = await asyncio.to_thread(cache.get_many, model, request.target_language, [request.text]) if cache else {}
+    if cached:
+        return TranslationResponse(success=True, translated_text=cached[0], target_language=request.target_language, message="Text successfully translated")
     translation_tool = create_translation_tool(llm)
     try:
-        translated_text = translation_tool._run(request.text, request.target_language)
+        translated_text = await get_admission_controller("translate").run(translation_tool._run, request.text, request.target_language)
+        if cache:
+            await asyncio.to_thread(cache.store_many, model, request.target_language, [(request.text, translated_text)])
         return TranslationResponse(success=True, translated_text=translated_text, target_language=request.target_language, message="Text successfully translated")
+    except (LLMError, OverloadedError):
+        # Mapped to 502/503/504 and 429/503 by the app's exception handlers
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
+
+@router.post("/translate/batch", response_model=BatchTranslationResponse, summary="Translate Many Texts")
+async def translate_batch(request: BatchTranslationRequest):
+    """Packs many short texts into few LLM calls; items that can't be translated carry an error."""
+    from src.langgraphagenticai.tools.batch_translation import BatchTranslator
+
+    if not request.texts:
+        raise HTTPException(status_code=400, detail="Texts to translate cannot be empty.")
+    if len(request.texts) > BATCH_MAX_TEXTS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_TEXTS} texts can be translated per request.")
+    if request.target_language not in SUPPORTED_LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"Unsupported language: {request.target_language}")
+
+    llm = initialize_llm(request.model)
+    results, stats = await get_admission_controller("translate").run(BatchTranslator(llm).translate, request.texts, request.target_language)
+    return BatchTranslationResponse(success=not stats["failed"], target_language=request.target_language, translations=results, stats=stats)
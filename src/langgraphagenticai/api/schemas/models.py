@@ -11,31 +11,80 @@ class NewsRequest(BaseRequest):
     topic: str = Field("general news", description="The topic for the news.")
     language: str = Field("English", description="The target language for the summary.")
     recipient_email: Optional[str] = Field(None, description="Optional email address to send the PDF summary to.")
+    stage_models: Optional[Dict[str, str]] = Field(None, description="Optional model per pipeline stage (chunk_summary, merge, translation), overriding uiconfigfile.ini.")
+    since_last_digest: bool = Field(False, description="Only summarize articles not delivered in an earlier digest for this topic and feed; nothing is generated when there are none.")
+    feed_id: Optional[str] = Field(None, description="Subscriber or feed the delta digest is tracked for. Defaults to recipient_email.")
+    run_id: Optional[str] = Field(None, description="Optional ID for the run. Repeating a request with the ID of a failed run resumes it; with that of a finished run returns its result.")
+    defer_delivery: bool = Field(False, description="Return the summary as soon as it is ready; the PDF and email follow in the background (see status_url).")
+    allow_cached: bool = Field(True, description="Allow a cached digest (fresh, or stale while it is refreshed) for requests without recipient_email, since_last_digest, run_id or defer_delivery.")
 
 class NewsInvokeRequest(BaseRequest):
     query: str = Field(..., description="A natural language query for the news agent.")
     recipient_email: Optional[str] = Field(None, description="Optional email address to send the PDF summary to.")
+    stage_models: Optional[Dict[str, str]] = Field(None, description="Optional model per pipeline stage (chunk_summary, merge, translation), overriding uiconfigfile.ini.")
+    since_last_digest: bool = Field(False, description="Only summarize articles not delivered in an earlier digest for this topic and feed; nothing is generated when there are none.")
+    feed_id: Optional[str] = Field(None, description="Subscriber or feed the delta digest is tracked for. Defaults to recipient_email.")
+    run_id: Optional[str] = Field(None, description="Optional ID for the run. Repeating a request with the ID of a failed run resumes it; with that of a finished run returns its result.")
+    defer_delivery: bool = Field(False, description="Return the summary as soon as it is ready; the PDF and email follow in the background (see status_url).")
+    allow_cached: bool = Field(True, description="Allow a cached digest (fresh, or stale while it is refreshed) for requests without recipient_email, since_last_digest, run_id or defer_delivery.")
+
+class NewsResumeRequest(BaseRequest):
+    stage_models: Optional[Dict[str, str]] = Field(None, description="Optional model per pipeline stage (chunk_summary, merge, translation), overriding uiconfigfile.ini.")
+
+class SubscriptionRequest(BaseModel):
+    email: str = Field(..., description="Address the digest is sent to.")
+    frequency: str = Field("daily", description="News frequency: daily, weekly, monthly, yearly.")
+    topic: str = Field("general news", description="The topic for the news.")
+    language: str = Field("English", description="The target language for the summary.")
+
+class DeliveryRequest(BaseRequest):
+    frequency: str = Field("daily", description="Deliver the digests of this frequency.")
+    stage_models: Optional[Dict[str, str]] = Field(None, description="Optional model per pipeline stage (chunk_summary, merge, translation), overriding uiconfigfile.ini.")
 
 class ChatRequest(BaseModel):
     message: str
+    thread_id: Optional[str] = Field(None, description="Optional conversation thread ID. When set, earlier turns are loaded from memory.")
 
 class WebChatRequest(BaseRequest):
     message: str
+    thread_id: Optional[str] = Field(None, description="Optional conversation thread ID. When set, earlier turns are loaded from memory.")
 
 class TranslationRequest(BaseRequest):
     text: str
     target_language: str
 
+class BatchTranslationRequest(BaseRequest):
+    texts: List[str] = Field(..., description="Texts to translate, e.g. headlines. Results keep this order.")
+    target_language: str
+
 class NewsResponse(BaseModel):
     success: bool
     message: str
     filename: Optional[str] = None
-    file_path: Optional[str] = None
+    file_path: Optional[str] = Field(None, description="Path of the markdown file, or its URL (/news/files/...) when files are kept in the news archive.")
+    run_id: Optional[str] = Field(None, description="ID of the checkpointed run; pass it back to resume the run if a retry is needed.")
+    status_url: Optional[str] = Field(None, description="With defer_delivery: where to poll for the PDF and email delivery status.")
+    markdown: Optional[str] = Field(None, description="The generated markdown summary.")
+    model_routing: Optional[Dict[str, Any]] = Field(None, description="Models used per stage and any escalations.")
+    delta: Optional[Dict[str, Any]] = Field(None, description="For delta digests: articles fetched, new and already delivered.")
+    digest_cache: Optional[Dict[str, Any]] = Field(None, description="Set when the digest came from the cache: fresh, stale or stale-if-error, and its age.")
     processing_details: Optional[Dict[str, Any]] = None
 
+class BatchTranslationItem(BaseModel):
+    translated_text: Optional[str] = None
+    cached: bool = False
+    error: Optional[str] = None
+
+class BatchTranslationResponse(BaseModel):
+    success: bool
+    target_language: str
+    translations: List[BatchTranslationItem]
+    stats: Dict[str, Any] = Field(default_factory=dict, description="Items, cache hits and LLM calls made.")
+
 class ChatResponse(BaseModel):
     success: bool
     response: str
+    thread_id: Optional[str] = None
 
 class WebChatResponse(ChatResponse):
     tool_outputs: Optional[List[Any]] = None
@@ -0,0 +1,88 @@
+# src/langgraphagenticai/cache/digest_cache.py
+
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+from src.langgraphagenticai.monitoring.metrics import record_cache_lookup
+from src.langgraphagenticai.storage.sqlite import connect
+from src.langgraphagenticai.subscriptions.store import normalize_topic
+
+DIGEST_CACHE_DB_PATH = os.getenv("DIGEST_CACHE_DB_PATH", "./Memory/digest_cache.sqlite")
+# Longest a background refresh may hold its lease before another worker may start one
+REFRESH_LEASE_SECONDS = 300
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS digests (
+    key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    refreshing_until REAL NOT NULL DEFAULT 0
+);
+"""
+
+def digest_key(frequency: str, topic: str, language: str, model: str | None, routing: dict) -> str:
+    """Digests made with other models are other digests: `model` is the request's model, `routing` the resolved {stage: model}."""
+    stages = ",".join(f"{stage}={stage_model}" for stage, stage_model in sorted(routing.items()))
+    return f"{frequency.lower()}|{normalize_topic(topic)}|{language.lower()}|{model}|{stages}"
+
+class DigestCache:
+    """
+    The newest digest per (frequency, topic, language, models), for stale-while-revalidate serving.
+    Up to `fresh_seconds` old a digest is served as is; for `stale_seconds` more it is served
+    while one background refresh runs; up to `stale_if_error_seconds` old it still stands in
+    when generating a new digest fails or is too slow. Shared by all worker processes.
+    """
+    def __init__(self, path: str = DIGEST_CACHE_DB_PATH, fresh_seconds: float = 600, stale_seconds: float = 21600,
+                 stale_if_error_seconds: float = 604800, revalidate_timeout: float = 20):
+        self.fresh_seconds = fresh_seconds
+        self.stale_seconds = stale_seconds
+        self.stale_if_error_seconds = stale_if_error_seconds
+        self.revalidate_timeout = revalidate_timeout
+        self._conn = connect(path)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        """Returns {"digest", "age", "state"} with state "fresh", "stale" or "expired", or None if there is no usable copy."""
+        with self._lock:
+            row = self._conn.execute("SELECT digest, created_at FROM digests WHERE key = ?", (key,)).fetchone()
+        age = time.time() - row[1] if row else None
+        if row is None or age > self.stale_if_error_seconds:
+            record_cache_lookup("digest", False)
+            return None
+        state = "fresh" if age < self.fresh_seconds else "stale" if age < self.fresh_seconds + self.stale_seconds else "expired"
+        record_cache_lookup("digest", state == "fresh")
+        return {"digest": json.loads(row[0]), "age": age, "state": state}
+
+    def put(self, key: str, digest: dict):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO digests (key, digest, created_at, refreshing_until) VALUES (?, ?, ?, 0)",
+                (key, json.dumps(digest), time.time()),
+            )
+
+    def claim_refresh(self, key: str) -> bool:
+        """True if the caller may refresh `key`: no other refresh holds an unexpired lease."""
+        now = time.time()
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "UPDATE digests SET refreshing_until = ? WHERE key = ? AND refreshing_until < ?", (now + REFRESH_LEASE_SECONDS, key, now)
+            ).rowcount > 0
+
+    def release_refresh(self, key: str):
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE digests SET refreshing_until = 0 WHERE key = ?", (key,))
+
+@lru_cache(maxsize=1)
+def get_digest_cache() -> DigestCache | None:
+    """Returns the digest cache, or None when disabled via DIGEST_CACHE_ENABLED."""
+    if os.getenv("DIGEST_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    return DigestCache(
+        fresh_seconds=float(os.getenv("DIGEST_FRESH_SECONDS", "600")),
+        stale_seconds=float(os.getenv("DIGEST_STALE_SECONDS", "21600")),
+        stale_if_error_seconds=float(os.getenv("DIGEST_STALE_IF_ERROR_SECONDS", "604800")),
+        revalidate_timeout=float(os.getenv("DIGEST_REVALIDATE_TIMEOUT_SECONDS", "20")),
+    )
@@ -0,0 +1,119 @@
+# src/langgraphagenticai/cache/prompt_cache.py
+
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from src.langgraphagenticai.monitoring.metrics import record_cache_lookup
+from src.langgraphagenticai.storage.sqlite import connect
+
+PROMPT_CACHE_DB_PATH = os.getenv("PROMPT_CACHE_DB_PATH", "./Memory/prompt_cache.sqlite")
+
+# Words that only frame a request ("what is RAG" ~ "explain RAG"). Logical, relational and
+# negating words ("and", "or", "not", "on", "for", "to", ...) change the answer and are kept.
+STOPWORDS = frozenset("""
+a an are can could define describe do does explain give i is it me please show tell the
+what whats what's would you
+""".split())
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prompt_cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+"""
+
+def normalize_prompt(text: str) -> str:
+    """The prompt's words, lower-cased and in order, without punctuation or framing words."""
+    return " ".join(w for w in re.findall(r"\w+", text.lower()) if w not in STOPWORDS)
+
+class PromptCache:
+    """
+    Caches LLM answers by normalized prompt, with TTL and LRU eviction per namespace.
+
+    Two prompts share an answer only when they are identical after normalization, so
+    rephrasings that add or drop framing words hit ("What's RAG?" / "explain RAG") while
+    any change of content words or their order misses. Entries are kept in SQLite, so
+    all worker processes share them.
+    """
+    def __init__(self, path: str = PROMPT_CACHE_DB_PATH, ttl_seconds: float = 3600, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._conn = connect(path)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def lookup(self, namespace: str, prompt: str) -> str | None:
+        """Returns the cached answer for the same normalized prompt, if any."""
+        key = normalize_prompt(prompt)
+        now = time.time()
+        row = None
+        if key:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT answer FROM prompt_cache WHERE namespace = ? AND key = ? AND expires_at > ?", (namespace, key, now)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute("UPDATE prompt_cache SET last_used = ? WHERE namespace = ? AND key = ?", (now, namespace, key))
+        self._record(row is not None)
+        return row[0] if row else None
+
+    def store(self, namespace: str, prompt: str, answer: str):
+        """Caches an answer, evicting the least recently used entries when the namespace is full."""
+        key = normalize_prompt(prompt)
+        if not key:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO prompt_cache (namespace, key, answer, expires_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, answer, now + self.ttl_seconds, now),
+            )
+            self._conn.execute("DELETE FROM prompt_cache WHERE namespace = ? AND expires_at <= ?", (namespace, now))
+            self._conn.execute(
+                "DELETE FROM prompt_cache WHERE namespace = ? AND key IN "
+                "(SELECT key FROM prompt_cache WHERE namespace = ? ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (namespace, namespace, self.max_entries),
+            )
+
+    def _record(self, hit: bool):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        record_cache_lookup("prompt", hit)
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM prompt_cache")
+
+    def stats(self) -> dict:
+        """Hits and misses of this worker process; entries of the shared cache."""
+        total = self.hits + self.misses
+        with self._lock:
+            entries = self._conn.execute(
+                "SELECT namespace, COUNT(*) FROM prompt_cache WHERE expires_at > ? GROUP BY namespace", (time.time(),)
+            ).fetchall()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "entries": dict(entries),
+        }
+
+@lru_cache(maxsize=1)
+def get_prompt_cache() -> PromptCache | None:
+    """Returns the prompt cache, or None when disabled via PROMPT_CACHE_ENABLED."""
+    if os.getenv("PROMPT_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    return PromptCache(
+        ttl_seconds=float(os.getenv("PROMPT_CACHE_TTL_SECONDS", "3600")),
+        max_entries=int(os.getenv("PROMPT_CACHE_MAX_ENTRIES", "1024")),
+    )
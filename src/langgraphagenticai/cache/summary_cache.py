@@ -0,0 +1,75 @@
+# src/langgraphagenticai/cache/summary_cache.py
+
+import hashlib
+import os
+import threading
+import time
+from functools import lru_cache
+from src.langgraphagenticai.monitoring.metrics import record_cache_lookup
+from src.langgraphagenticai.storage.sqlite import connect
+from src.langgraphagenticai.utils.urls import canonical_url
+
+SUMMARY_CACHE_DB_PATH = os.getenv("ARTICLE_SUMMARY_CACHE_DB_PATH", "./Memory/article_summaries.sqlite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    article_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    headline TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    model TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS summaries_created_at ON summaries(created_at);
+"""
+
+def article_key(item: dict) -> str:
+    """
+    Identifies an article by canonical URL and a hash of its title and uncompressed text
+    (the full page when enriched), so an article whose text changes is summarized again.
+    """
+    text = f"{item.get('title') or ''}\n{item.get('content') or ''}"
+    return f"{canonical_url(item.get('url') or '')}|{hashlib.sha256(text.encode('utf-8')).hexdigest()[:24]}"
+
+class ArticleSummaryCache:
+    """
+    Per-article summaries shared by every digest: an article in the daily, weekly and
+    several topic digests is summarized once. Kept in SQLite so all worker processes and
+    later runs share it; entries expire after `ttl_days`.
+    """
+    def __init__(self, path: str = SUMMARY_CACHE_DB_PATH, ttl_days: float = 30):
+        self.ttl_seconds = ttl_days * 86400
+        self._conn = connect(path)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: list) -> dict:
+        """Returns {article_key: (headline, summary)} for the keys found."""
+        keys = list(dict.fromkeys(keys))
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT article_key, headline, summary FROM summaries WHERE created_at >= ? AND article_key IN ({','.join('?' * len(keys))})",
+                (cutoff, *keys),
+            ).fetchall() if keys else []
+        found = {key: (headline, summary) for key, headline, summary in rows}
+        for key in keys:
+            record_cache_lookup("article_summary", key in found)
+        return found
+
+    def store_many(self, entries: list, model: str | None = None):
+        """Stores (article_key, url, headline, summary) entries and drops expired ones."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO summaries (article_key, url, headline, summary, model, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [(key, url, headline, summary, model, now) for key, url, headline, summary in entries],
+            )
+            self._conn.execute("DELETE FROM summaries WHERE created_at < ?", (now - self.ttl_seconds,))
+
+@lru_cache(maxsize=1)
+def get_summary_cache() -> ArticleSummaryCache | None:
+    """Returns the article summary cache, or None when disabled via ARTICLE_SUMMARY_CACHE_ENABLED."""
+    if os.getenv("ARTICLE_SUMMARY_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    return ArticleSummaryCache(ttl_days=float(os.getenv("ARTICLE_SUMMARY_CACHE_TTL_DAYS", "30")))
@@ -0,0 +1,86 @@
+# src/langgraphagenticai/cache/translation_cache.py
+
+import hashlib
+import os
+import threading
+import time
+from functools import lru_cache
+from src.langgraphagenticai.monitoring.metrics import record_cache_lookup
+from src.langgraphagenticai.storage.sqlite import connect
+
+TRANSLATION_CACHE_DB_PATH = os.getenv("TRANSLATION_CACHE_DB_PATH", "./Memory/translation_cache.sqlite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    translation TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS translations_last_used ON translations(last_used);
+"""
+
+class TranslationCache:
+    """
+    Caches translations by exact source text, target language and model, with TTL and LRU
+    eviction. Unlike the prompt cache this never normalizes texts: two headlines
+    that differ by one name need different translations. Kept in SQLite so all worker
+    processes share it.
+    """
+    def __init__(self, path: str = TRANSLATION_CACHE_DB_PATH, ttl_seconds: float = 86400, max_entries: int = 20000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._conn = connect(path)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(model: str | None, target_language: str, text: str) -> str:
+        return f"{model}|{target_language}|{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+    def get_many(self, model: str | None, target_language: str, texts: list) -> dict:
+        """Returns {index: translation} for the texts found in the cache."""
+        now = time.time()
+        keys = [self._key(model, target_language, text) for text in texts]
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, translation FROM translations WHERE expires_at > ? AND key IN ({','.join('?' * len(unique))})",
+                (now, *unique),
+            ).fetchall() if unique else []
+            if rows:
+                with self._conn:
+                    self._conn.executemany("UPDATE translations SET last_used = ? WHERE key = ?", [(now, key) for key, _ in rows])
+        cached = dict(rows)
+        found = {}
+        for index, key in enumerate(keys):
+            if key in cached:
+                found[index] = cached[key]
+            record_cache_lookup("translation", key in cached)
+        return found
+
+    def store_many(self, model: str | None, target_language: str, pairs: list):
+        """Caches (source text, translation) pairs, evicting expired and then least recently used entries."""
+        if not pairs:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, translation, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                [(self._key(model, target_language, text), translation, now + self.ttl_seconds, now) for text, translation in pairs],
+            )
+            self._conn.execute("DELETE FROM translations WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM translations WHERE key IN (SELECT key FROM translations ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+@lru_cache(maxsize=1)
+def get_translation_cache() -> TranslationCache | None:
+    """Returns the translation cache, or None when disabled via TRANSLATION_CACHE_ENABLED."""
+    if os.getenv("TRANSLATION_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    return TranslationCache(
+        ttl_seconds=float(os.getenv("TRANSLATION_CACHE_TTL_SECONDS", "86400")),
+        max_entries=int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "20000")),
+    )
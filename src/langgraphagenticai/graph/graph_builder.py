@@ -1,63 +1,106 @@
 # src/langgraphagenticai/graph/graph_builder.py
+import os
 from langgraph.graph import StateGraph, START, END
-from src.langgraphagenticai.nodes.ai_news_node import NewsNode
 from src.langgraphagenticai.state.state import State
 from src.langgraphagenticai.nodes.basic_chatbot_node import BasicChatbotNode
-from src.langgraphagenticai.tools.search_tool import get_tools, create_tool_node
-from langgraph.prebuilt import tools_condition
 from src.langgraphagenticai.nodes.chatbot_with_Tool_node import ChatbotWithToolNode
+from src.langgraphagenticai.memory.context_manager import ConversationContextManager
+from src.langgraphagenticai.monitoring.metrics import timed_node
+
+# Heavy dependencies (NumPy, Tavily, langchain_community, PDF rendering) are imported
+# inside the build methods, so they only load when a graph that needs them is first built.
 
 class GraphBuilder:
-    def __init__(self, model):
+    def __init__(self, model, stage_models=None):
         self.llm = model
+        # Per-request model overrides for the news pipeline stages, e.g. {"merge": "llama3-70b-8192"}
+        self.stage_models = stage_models
         self.graph_builder = StateGraph(State)
+        self.usecase = None
+
+    def _add_node(self, name, node):
+        """Adds a node wrapped with a per-node latency histogram."""
+        self.graph_builder.add_node(name, timed_node(self.usecase, name, node))
         
     def basic_chatbot_build_graph(self):
-        self.basic_chatbot_node = BasicChatbotNode(self.llm)
-        self.graph_builder.add_node("chatbot", self.basic_chatbot_node.process)
-        self.graph_builder.add_edge(START, "chatbot")
+        from src.langgraphagenticai.cache.prompt_cache import get_prompt_cache
+
+        self.basic_chatbot_node = BasicChatbotNode(self.llm, cache=get_prompt_cache())
+        context_manager = ConversationContextManager(self.llm)
+        self._add_node("manage_context", context_manager.fold)
+        self._add_node("chatbot", self.basic_chatbot_node.process)
+        self.graph_builder.add_edge(START, "manage_context")
+        self.graph_builder.add_edge("manage_context", "chatbot")
         self.graph_builder.add_edge("chatbot", END)
 
     def chatbot_with_tools_build_graph(self):
+        from langgraph.prebuilt import tools_condition
+        from src.langgraphagenticai.tools.search_tool import get_tools, create_tool_node
+
         tools = get_tools()
         tool_node = create_tool_node(tools)
         llm = self.llm
         obj_chatbot_with_node = ChatbotWithToolNode(llm)
         chatbot_node = obj_chatbot_with_node.create_chatbot(tools)
-        self.graph_builder.add_node("chatbot", chatbot_node)
-        self.graph_builder.add_node("tools", tool_node)
-        self.graph_builder.add_edge(START, "chatbot")
+        context_manager = ConversationContextManager(llm)
+        self._add_node("manage_context", context_manager.fold)
+        self._add_node("chatbot", chatbot_node)
+        self._add_node("tools", tool_node)
+        self.graph_builder.add_edge(START, "manage_context")
+        self.graph_builder.add_edge("manage_context", "chatbot")
         self.graph_builder.add_conditional_edges("chatbot", tools_condition)
         self.graph_builder.add_edge("tools", "chatbot")
 
 
     def news_builder_graph(self):
         """Builds a news processing pipeline with PDF conversion and email support."""
-        news_node = NewsNode(self.llm)
+        from src.langgraphagenticai.nodes.ai_news_node import NewsNode
+        from src.langgraphagenticai.LLMS.model_router import ModelRouter
+
+        news_node = NewsNode(self.llm, router=ModelRouter.from_config(self.llm, self.stage_models))
 
         # Add the nodes
-        self.graph_builder.add_node("fetch_news", news_node.fetch_news)
-        self.graph_builder.add_node("summarize_news", news_node.summarize_news)
-        self.graph_builder.add_node("translate_news", news_node.translate_news)
-        self.graph_builder.add_node("save_result", news_node.save_result)
-        self.graph_builder.add_node("convert_to_pdf", news_node.convert_to_pdf)
-        self.graph_builder.add_node("send_email", news_node.send_email)
+        self._add_node("fetch_news", news_node.fetch_news)
+        self._add_node("filter_delivered", news_node.filter_delivered)
+        self._add_node("compress_news", news_node.compress_news)
+        # Optional: fetch full article pages instead of relying on search snippets
+        enrich = os.getenv("NEWS_ENRICH_ENABLED", "false").lower() in ("1", "true", "yes")
+        if enrich:
+            self._add_node("enrich_news", news_node.enrich_news)
+        self._add_node("summarize_news", news_node.summarize_news)
+        self._add_node("translate_news", news_node.translate_news)
+        self._add_node("save_result", news_node.save_result)
+        self._add_node("convert_to_pdf", news_node.convert_to_pdf)
+        self._add_node("send_email", news_node.send_email)
 
         # Add the edges
         self.graph_builder.set_entry_point("fetch_news")
-        self.graph_builder.add_edge("fetch_news", "summarize_news")
+        self.graph_builder.add_edge("fetch_news", "filter_delivered")
+        # Delta digests with no new articles stop here, before any LLM call
+        self.graph_builder.add_conditional_edges(
+            "filter_delivered",
+            news_node.route_after_filter,
+            {"continue": "enrich_news" if enrich else "compress_news", "nothing_new": END},
+        )
+        if enrich:
+            self.graph_builder.add_edge("enrich_news", "compress_news")
+        self.graph_builder.add_edge("compress_news", "summarize_news")
         self.graph_builder.add_edge("summarize_news", "translate_news")
         self.graph_builder.add_edge("translate_news", "save_result")
         self.graph_builder.add_edge("save_result", "convert_to_pdf")
         self.graph_builder.add_edge("convert_to_pdf", "send_email")
         self.graph_builder.add_edge("send_email", END)
 
-    def setup_graph(self, usecase: str):
-        """Sets up the graph for the selected use case."""
+    def setup_graph(self, usecase: str, checkpointer=None):
+        """
+        Sets up the graph for the selected use case.
+        Pass a checkpointer to persist state per thread_id across invocations.
+        """
+        self.usecase = usecase
         if usecase == "Basic Chatbot":
             self.basic_chatbot_build_graph()
         elif usecase == "Chatbot With Web":
             self.chatbot_with_tools_build_graph()
         elif usecase == "News":
             self.news_builder_graph()
-        return self.graph_builder.compile()
\ No newline at end of file
+        return self.graph_builder.compile(checkpointer=checkpointer)
\ No newline at end of file
@@ -4,14 +4,23 @@ from src.langgraphagenticai.ui.streamlitui.loadui import LoadStreamlitUI
 from src.langgraphagenticai.LLMS.groqllm import GroqLLM
 from src.langgraphagenticai.graph.graph_builder import GraphBuilder
 from src.langgraphagenticai.ui.streamlitui.display_result import DisplayResultStreamlit
+from src.langgraphagenticai.ui.streamlitui.display_result_api import DisplayResultAPI
 from src.langgraphagenticai.utils.message_parser import NewsMessageParser
+from src.langgraphagenticai.ui.streamlitui.api_client import get_backend_url, get_supported_languages
+
+@st.cache_resource
+def get_llm_model(groq_api_key: str, model_name: str):
+    """Creates the LLM client once per key and model instead of on every rerun."""
+    return GroqLLM(user_contols_input={"GROQ_API_KEY": groq_api_key, "selected_groq_model": model_name}).get_llm_model()
 
 def load_langgraph_agenticai_app():
     """
     Loads and runs the LangGraph AgenticAI application with a streamlined and
     efficient main execution flow.
     """
-    ui = LoadStreamlitUI()
+    # With a backend URL the UI is a thin client; graphs run in the FastAPI process
+    backend_url = get_backend_url()
+    ui = LoadStreamlitUI(languages=get_supported_languages(backend_url) if backend_url else None, remote=bool(backend_url))
     user_input = ui.load_streamlit_ui()
     
     user_message = None
@@ -49,9 +58,14 @@ def load_langgraph_agenticai_app():
     # This block runs only if a valid user_message was generated from either path
     if user_message:
         try:
-            # Efficient: LLM is initialized only once, right when needed
-            obj_llm_config = GroqLLM(user_contols_input=user_input)
-            model = obj_llm_config.get_llm_model()
+            if backend_url:
+                DisplayResultAPI(detected_usecase, backend_url, user_message, user_input["selected_groq_model"]).display_result_on_ui()
+                if st.session_state.get('IsFetchButtonClicked', False):
+                    st.session_state.IsFetchButtonClicked = False
+                return
+
+            # Efficient: LLM is initialized only once per model and reused across reruns
+            model = get_llm_model(user_input["GROQ_API_KEY"], user_input["selected_groq_model"])
 
             if not model:
                 st.error("Error: LLM model could not be initialized.")
@@ -0,0 +1,28 @@
+# src/langgraphagenticai/memory/checkpointer.py
+
+import os
+from functools import lru_cache
+from langgraph.checkpoint.sqlite import SqliteSaver
+from src.langgraphagenticai.storage.sqlite import connect
+
+MEMORY_DB_PATH = os.getenv("CHAT_MEMORY_DB_PATH", "./Memory/chat_memory.sqlite")
+NEWS_RUNS_DB_PATH = os.getenv("NEWS_RUNS_DB_PATH", "./Memory/news_runs.sqlite")
+
+@lru_cache(maxsize=1)
+def get_checkpointer() -> SqliteSaver:
+    """Returns the process-wide SQLite checkpointer used for thread-based chat memory."""
+    # Opened lazily so each worker process gets its own connection to the shared database
+    return SqliteSaver(connect(MEMORY_DB_PATH))
+
+@lru_cache(maxsize=1)
+def get_news_checkpointer() -> SqliteSaver:
+    """Returns the checkpointer for news runs: each node's output is saved so a failed run can resume."""
+    return SqliteSaver(connect(NEWS_RUNS_DB_PATH))
+
+def thread_config(thread_id: str) -> dict:
+    """Builds the LangGraph run config that binds an invocation to a conversation thread."""
+    return {"configurable": {"thread_id": thread_id}}
+
+def delete_thread(thread_id: str):
+    """Removes every checkpoint stored for the given conversation thread."""
+    get_checkpointer().delete_thread(thread_id)
@@ -0,0 +1,64 @@
+# src/langgraphagenticai/memory/context_manager.py
+
+import os
+from langchain_core.messages import HumanMessage, SystemMessage, RemoveMessage
+from src.langgraphagenticai.state.state import State
+
+DEFAULT_MAX_TURNS = int(os.getenv("CHAT_MEMORY_MAX_TURNS", "10"))
+DEFAULT_KEEP_TURNS = int(os.getenv("CHAT_MEMORY_KEEP_TURNS", "6"))
+
+def with_conversation_summary(state: State) -> list:
+    """Returns the messages to send to the LLM, prefixed with the rolling summary if one exists."""
+    summary = state.get("conversation_summary")
+    if not summary:
+        return state["messages"]
+    return [SystemMessage(content=f"Summary of the earlier conversation:\n{summary}")] + list(state["messages"])
+
+class ConversationContextManager:
+    """
+    Keeps the per-turn prompt bounded by folding old turns into a rolling summary.
+
+    A turn starts at a user message and includes every AI and tool message that
+    follows it. Once a thread holds more than `max_turns` turns, everything except
+    the last `keep_turns` turns is summarized and removed from the state.
+    """
+    def __init__(self, llm, max_turns: int = DEFAULT_MAX_TURNS, keep_turns: int = DEFAULT_KEEP_TURNS):
+        if keep_turns < 1 or keep_turns > max_turns:
+            raise ValueError("keep_turns must be between 1 and max_turns.")
+        self.llm = llm
+        self.max_turns = max_turns
+        self.keep_turns = keep_turns
+
+    def split_history(self, messages: list) -> tuple[list, list]:
+        """Splits messages into (older, recent), cutting only at user-message boundaries."""
+        turn_starts = [i for i, msg in enumerate(messages) if isinstance(msg, HumanMessage)]
+        if len(turn_starts) <= self.max_turns:
+            return [], messages
+        cut = turn_starts[-self.keep_turns]
+        return messages[:cut], messages[cut:]
+
+    def fold(self, state: State) -> dict:
+        """Graph node: summarizes and removes turns that fall outside the verbatim window."""
+        older, _ = self.split_history(state["messages"])
+        if not older:
+            return {}
+        summary = self._summarize(state.get("conversation_summary", ""), older)
+        return {
+            "conversation_summary": summary,
+            "messages": [RemoveMessage(id=msg.id) for msg in older],
+        }
+
+    def _summarize(self, previous_summary: str, messages: list) -> str:
+        transcript = "\n".join(
+            f"{msg.type}: {msg.content}" for msg in messages if isinstance(msg.content, str) and msg.content
+        )
+        instructions = (
+            "You maintain a running summary of a conversation. Extend the existing summary with the "
+            "new messages below. Keep facts, names, decisions and open questions; drop pleasantries. "
+            "Reply with the updated summary only."
+        )
+        prompt = [
+            SystemMessage(content=instructions),
+            HumanMessage(content=f"Existing summary:\n{previous_summary or '(none)'}\n\nNew messages:\n{transcript}"),
+        ]
+        return self.llm.invoke(prompt).content
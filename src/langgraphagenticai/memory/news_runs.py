@@ -0,0 +1,120 @@
+# src/langgraphagenticai/memory/news_runs.py
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from src.langgraphagenticai.memory.checkpointer import NEWS_RUNS_DB_PATH, get_news_checkpointer
+from src.langgraphagenticai.storage.sqlite import connect
+
+# Checkpoints of news runs older than this are deleted, resumable or not
+NEWS_RUN_RETENTION_HOURS = float(os.getenv("NEWS_RUN_RETENTION_HOURS", "168"))
+# Longest a claimed run counts as executing; after that (e.g. its worker died) it may be claimed again
+NEWS_RUN_LEASE_SECONDS = float(os.getenv("NEWS_RUN_LEASE_SECONDS", "1800"))
+PRUNE_INTERVAL_SECONDS = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS news_runs (
+    run_id TEXT PRIMARY KEY,
+    request TEXT NOT NULL,
+    status TEXT NOT NULL,
+    failed_node TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    lease_until REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS news_runs_updated_at ON news_runs(updated_at);
+"""
+
+class RunConflictError(Exception):
+    """The run is executing right now, or its ID was used for a different request."""
+
+class NewsRunRegistry:
+    """
+    Status of checkpointed news runs, keyed by run ID (the LangGraph thread ID). It decides
+    whether a request starts a new run, resumes a failed one or returns a finished one,
+    and deletes old runs' checkpoints. Claims are leased in the database, so a run executes
+    in at most one worker process at a time.
+    """
+    def __init__(self, path: str = NEWS_RUNS_DB_PATH, retention_hours: float = NEWS_RUN_RETENTION_HOURS,
+                 lease_seconds: float = NEWS_RUN_LEASE_SECONDS):
+        self.retention_seconds = retention_hours * 3600
+        self.lease_seconds = lease_seconds
+        self._conn = connect(path)
+        self._conn.row_factory = lambda cursor, row: {col[0]: value for col, value in zip(cursor.description, row)}
+        self._conn.executescript(_SCHEMA)
+        if "lease_until" not in {row['name'] for row in self._conn.execute("PRAGMA table_info(news_runs)")}:
+            # Registries created before runs were leased
+            with self._conn:
+                self._conn.execute("ALTER TABLE news_runs ADD COLUMN lease_until REAL NOT NULL DEFAULT 0")
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+
+    def get(self, run_id: str) -> dict | None:
+        with self._lock:
+            return self._conn.execute("SELECT * FROM news_runs WHERE run_id = ?", (run_id,)).fetchone()
+
+    @contextmanager
+    def claim(self, run_id: str, request: str):
+        """
+        Marks the run as executing for the duration of the block and yields its previous
+        record (None for a new run). Raises RunConflictError if it is already executing,
+        in this or another worker process, or was started for a different request.
+        """
+        self._prune()
+        now = time.time()
+        lease_until = now + self.lease_seconds
+        with self._lock:
+            previous = self._conn.execute("SELECT * FROM news_runs WHERE run_id = ?", (run_id,)).fetchone()
+            if previous is not None and previous['request'] != request:
+                raise RunConflictError(f"News run '{run_id}' belongs to a different request.")
+            with self._conn:
+                # One statement, so two workers claiming the same run cannot both succeed
+                claimed = self._conn.execute(
+                    "INSERT INTO news_runs (run_id, request, status, created_at, updated_at, lease_until) VALUES (?, ?, 'running', ?, ?, ?) "
+                    "ON CONFLICT(run_id) DO UPDATE SET status = 'running', updated_at = excluded.updated_at, lease_until = excluded.lease_until "
+                    "WHERE news_runs.request = excluded.request AND (news_runs.status != 'running' OR news_runs.lease_until < ?)",
+                    (run_id, request, now, now, lease_until, now),
+                ).rowcount > 0
+        if not claimed:
+            raise RunConflictError(f"News run '{run_id}' is already in progress.")
+        try:
+            yield previous
+        finally:
+            with self._lock, self._conn:
+                # Left unfinished, e.g. by an error raised outside the graph; unless the lease
+                # expired and another worker has claimed the run since
+                self._conn.execute(
+                    "UPDATE news_runs SET status = 'failed', error = COALESCE(error, 'interrupted'), updated_at = ? "
+                    "WHERE run_id = ? AND status = 'running' AND lease_until = ?", (time.time(), run_id, lease_until),
+                )
+
+    def finish(self, run_id: str, failed_node: str | None = None, error: str | None = None, deferred: bool = False):
+        """Records the outcome of a run: completed, failed at `failed_node`, or paused with its delivery deferred."""
+        status = "failed" if error else "delivering" if deferred else "completed"
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE news_runs SET status = ?, failed_node = ?, error = ?, updated_at = ? WHERE run_id = ?",
+                (status, failed_node, error, time.time(), run_id),
+            )
+
+    def _prune(self):
+        now = time.time()
+        if now - self._last_prune < PRUNE_INTERVAL_SECONDS:
+            return
+        self._last_prune = now
+        with self._lock:
+            expired = [row['run_id'] for row in self._conn.execute(
+                "SELECT run_id FROM news_runs WHERE updated_at < ? AND (status != 'running' OR lease_until < ?)",
+                (now - self.retention_seconds, now),
+            ).fetchall()]
+        for run_id in expired:
+            get_news_checkpointer().delete_thread(run_id)
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM news_runs WHERE run_id = ?", (run_id,))
+
+@lru_cache(maxsize=1)
+def get_news_run_registry() -> NewsRunRegistry:
+    return NewsRunRegistry()
@@ -0,0 +1,203 @@
+# src/langgraphagenticai/monitoring/metrics.py
+
+import os
+import time
+from contextlib import contextmanager
+from uuid import UUID
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables import Runnable
+from starlette.routing import Match
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess,
+)
+
+# Graph nodes and external calls range from milliseconds (cache, save) to minutes (news summaries)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+
+NODE_LATENCY = Histogram(
+    "news_weaver_node_duration_seconds", "Latency of LangGraph node executions.",
+    ["graph", "node"], buckets=LATENCY_BUCKETS,
+)
+NODE_ERRORS = Counter(
+    "news_weaver_node_errors_total", "LangGraph node executions that raised.", ["graph", "node"],
+)
+DEPENDENCY_LATENCY = Histogram(
+    "news_weaver_dependency_duration_seconds", "Latency of calls to external dependencies (groq, tavily, pdf, smtp).",
+    ["dependency"], buckets=LATENCY_BUCKETS,
+)
+DEPENDENCY_ERRORS = Counter(
+    "news_weaver_dependency_errors_total", "Calls to external dependencies that failed.", ["dependency"],
+)
+HTTP_LATENCY = Histogram(
+    "news_weaver_http_request_duration_seconds", "Latency of API requests.",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS,
+)
+HTTP_IN_PROGRESS = Gauge(
+    "news_weaver_http_requests_in_progress", "API requests currently being served (queue depth per route).",
+    ["method", "route"], multiprocess_mode="livesum",
+)
+GRAPH_RUNS_IN_PROGRESS = Gauge(
+    "news_weaver_graph_runs_in_progress", "Graph executions currently running.",
+    ["usecase"], multiprocess_mode="livesum",
+)
+CACHE_REQUESTS = Counter(
+    "news_weaver_cache_requests_total", "Cache lookups by result; hit ratio = hit / (hit + miss).", ["cache", "result"],
+)
+MODEL_CALLS = Counter(
+    "news_weaver_model_calls_total", "Routed LLM calls per pipeline stage and model; result is ok or escalated.",
+    ["stage", "model", "result"],
+)
+LLM_FAILURES = Counter(
+    "news_weaver_llm_failures_total", "Failed LLM calls by stage, model and reason (timeout, provider_error, circuit_open).",
+    ["stage", "model", "reason"],
+)
+LLM_HEDGES = Counter(
+    "news_weaver_llm_hedged_calls_total", "LLM calls that sent a hedged duplicate, by which request answered first.",
+    ["stage", "model", "winner"],
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "news_weaver_admission_queue_depth", "Requests waiting for an execution slot, per route group.",
+    ["group"], multiprocess_mode="livesum",
+)
+ADMISSION_WAIT = Histogram(
+    "news_weaver_admission_wait_seconds", "Time admitted requests waited for an execution slot.",
+    ["group"], buckets=LATENCY_BUCKETS,
+)
+ADMISSION_REJECTED = Counter(
+    "news_weaver_admission_rejected_total", "Requests shed by admission control; reason is queue_full or queue_timeout.",
+    ["group", "reason"],
+)
+
+# Optional in-process observers of raw latencies, called as listener(kind, name, seconds)
+# with kind "node" (name "<graph>/<node>"), "dependency" or "queue" (admission wait per route
+# group). Used by the benchmark harness.
+_latency_listeners = []
+
+def add_latency_listener(listener):
+    _latency_listeners.append(listener)
+
+def remove_latency_listener(listener):
+    _latency_listeners.remove(listener)
+
+def _observe_dependency(dependency: str, seconds: float):
+    DEPENDENCY_LATENCY.labels(dependency).observe(seconds)
+    for listener in _latency_listeners:
+        listener("dependency", dependency, seconds)
+
+def _observe_node(graph: str, node: str, seconds: float):
+    NODE_LATENCY.labels(graph, node).observe(seconds)
+    for listener in _latency_listeners:
+        listener("node", f"{graph}/{node}", seconds)
+
+def observe_admission_wait(group: str, seconds: float):
+    ADMISSION_WAIT.labels(group).observe(seconds)
+    for listener in _latency_listeners:
+        listener("queue", group, seconds)
+
+@contextmanager
+def track_dependency(dependency: str):
+    """Times a block that calls an external dependency and counts it as an error if it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        DEPENDENCY_ERRORS.labels(dependency).inc()
+        raise
+    finally:
+        _observe_dependency(dependency, time.perf_counter() - start)
+
+def timed_node(graph: str, name: str, node):
+    """Wraps a graph node (plain callable or Runnable such as ToolNode) with a latency histogram."""
+    def observe(call):
+        start = time.perf_counter()
+        try:
+            return call()
+        except Exception:
+            NODE_ERRORS.labels(graph, name).inc()
+            raise
+        finally:
+            _observe_node(graph, name, time.perf_counter() - start)
+
+    if isinstance(node, Runnable):
+        # Runnables need the run config (ToolNode reads injected state/store from it)
+        def run_runnable(state, config):
+            return observe(lambda: node.invoke(state, config))
+        return run_runnable
+
+    def run(state):
+        return observe(lambda: node(state))
+    return run
+
+def record_cache_lookup(cache: str, hit: bool):
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+class DependencyMetricsCallback(BaseCallbackHandler):
+    """
+    LangChain callback that records latency and errors of chat model and tool calls.
+    Attach it to the Groq chat model or a search tool to cover every invocation.
+    """
+    def __init__(self, dependency: str):
+        self.dependency = dependency
+        self._starts: dict[UUID, float] = {}
+
+    def _start(self, run_id: UUID):
+        self._starts[run_id] = time.perf_counter()
+
+    def _finish(self, run_id: UUID, error: bool = False):
+        start = self._starts.pop(run_id, None)
+        if start is not None:
+            _observe_dependency(self.dependency, time.perf_counter() - start)
+        if error:
+            DEPENDENCY_ERRORS.labels(self.dependency).inc()
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs):
+        self._start(run_id)
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, **kwargs):
+        self._start(run_id)
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs):
+        self._finish(run_id)
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs):
+        self._finish(run_id, error=True)
+
+    def on_tool_start(self, serialized, input_str, *, run_id: UUID, **kwargs):
+        self._start(run_id)
+
+    def on_tool_end(self, output, *, run_id: UUID, **kwargs):
+        self._finish(run_id)
+
+    def on_tool_error(self, error, *, run_id: UUID, **kwargs):
+        self._finish(run_id, error=True)
+
+def _route_template(request) -> str:
+    """Returns the matched route path (e.g. /news/download/{filename}) to keep label cardinality low."""
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+    return "unmatched"
+
+async def metrics_middleware(request, call_next):
+    """HTTP middleware recording per-route latency and in-flight request counts."""
+    method, route = request.method, _route_template(request)
+    in_progress = HTTP_IN_PROGRESS.labels(method, route)
+    in_progress.inc()
+    start = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        in_progress.dec()
+        HTTP_LATENCY.labels(method, route, status).observe(time.perf_counter() - start)
+
+def render_metrics() -> tuple[bytes, str]:
+    """Renders all metrics in the Prometheus text format, aggregating worker processes if configured."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,174 @@
+# src/langgraphagenticai/monitoring/tracing.py
+
+import glob
+import hmac
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from src.langgraphagenticai.monitoring.metrics import add_latency_listener
+
+DIAGNOSTICS_DIR = os.getenv("DIAGNOSTICS_DIR", "./Diagnostics")
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+# Secret a request must send as `X-Profile: <token>`; profiling stays off while it is unset
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+# Profiles kept in DIAGNOSTICS_DIR; older ones are deleted as new ones are written
+DIAGNOSTICS_MAX_PROFILES = int(os.getenv("DIAGNOSTICS_MAX_PROFILES", "20"))
+PROFILE_INTERVAL_SECONDS = float(os.getenv("PROFILE_INTERVAL_SECONDS", "0.005"))
+
+@dataclass
+class Span:
+    name: str
+    kind: str
+    start: float  # seconds since the trace started
+    duration: float
+
+@dataclass
+class Trace:
+    trace_id: str
+    started_at: float = field(default_factory=time.perf_counter)
+    spans: list = field(default_factory=list)
+
+    def add_span(self, name: str, kind: str, duration: float):
+        start = time.perf_counter() - duration - self.started_at
+        self.spans.append(Span(name, kind, round(start, 6), round(duration, 6)))
+
+    def server_timing(self) -> str:
+        """Aggregates span durations per name into a Server-Timing header value."""
+        totals = {}
+        for span in self.spans:
+            key = f"{span.kind}.{span.name}".replace("/", ".").replace(" ", "_")
+            totals[key] = totals.get(key, 0.0) + span.duration
+        return ", ".join(f"{key};dur={seconds * 1000:.1f}" for key, seconds in totals.items())
+
+_current_trace: ContextVar[Trace | None] = ContextVar("news_weaver_trace", default=None)
+
+def current_trace_id() -> str | None:
+    trace = _current_trace.get()
+    return trace.trace_id if trace else None
+
+def _record_span(kind: str, name: str, seconds: float):
+    # Called for every node and dependency observation; a no-op outside a traced request
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add_span(name, kind, seconds)
+
+add_latency_listener(_record_span)
+
+class SamplingProfiler:
+    """
+    Samples the call stack of one thread at a fixed interval and writes it in the
+    collapsed ("folded") stack format read by flamegraph.pl, speedscope and inferno.
+
+    Async routes share the event loop thread, so stacks of concurrent requests on
+    that thread can appear in the profile too. Work the request moves to worker threads
+    is sampled while it runs inside `profile_current_thread()`.
+    """
+    def __init__(self, thread_id: int, interval: float = PROFILE_INTERVAL_SECONDS):
+        self.thread_ids = {thread_id}
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in list(self.thread_ids):
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                if stack:
+                    self.samples[";".join(reversed(stack))] += 1
+
+    def start(self) -> "SamplingProfiler":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write_folded(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+_current_profiler: ContextVar[SamplingProfiler | None] = ContextVar("news_weaver_profiler", default=None)
+
+@contextmanager
+def profile_current_thread():
+    """Includes the calling worker thread in the current request's profile, if it is being profiled."""
+    profiler = _current_profiler.get()
+    if profiler is None:
+        yield
+        return
+    thread_id = threading.get_ident()
+    profiler.thread_ids.add(thread_id)
+    try:
+        yield
+    finally:
+        profiler.thread_ids.discard(thread_id)
+
+# Only one request is profiled at a time; further profile flags are ignored until it finishes
+_profile_lock = threading.Lock()
+
+def _profiling_requested(request) -> bool:
+    token = request.headers.get("x-profile")
+    return PROFILING_ENABLED and bool(PROFILING_TOKEN) and token is not None and hmac.compare_digest(token, PROFILING_TOKEN)
+
+def _rotate_diagnostics(keep: int):
+    """Deletes all but the newest `keep` profiles (each a .folded and a .trace.json file)."""
+    profiles = sorted(glob.glob(os.path.join(DIAGNOSTICS_DIR, "*.folded")), key=os.path.getmtime)
+    for folded in profiles[:max(len(profiles) - keep, 0)]:
+        for path in (folded, folded[:-len(".folded")] + ".trace.json"):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def _save_diagnostics(trace: Trace, profiler: SamplingProfiler, route: str):
+    os.makedirs(DIAGNOSTICS_DIR, exist_ok=True)
+    base = os.path.join(DIAGNOSTICS_DIR, f"{time.strftime('%Y%m%dT%H%M%S')}-{trace.trace_id}")
+    profiler.write_folded(f"{base}.folded")
+    with open(f"{base}.trace.json", "w", encoding="utf-8") as f:
+        json.dump({"trace_id": trace.trace_id, "route": route, "interval_s": profiler.interval,
+                   "spans": [asdict(span) for span in trace.spans]}, f, indent=2)
+    _rotate_diagnostics(DIAGNOSTICS_MAX_PROFILES)
+
+async def tracing_middleware(request, call_next):
+    """
+    Assigns each request a trace ID (from X-Trace-Id or generated), collects node and
+    dependency spans, and returns them in the X-Trace-Id and Server-Timing headers.
+    With PROFILING_ENABLED and `X-Profile: <PROFILING_TOKEN>`, the request is also profiled
+    and the flamegraph input is saved under DIAGNOSTICS_DIR, named after the trace ID.
+    """
+    trace = Trace(trace_id=request.headers.get("x-trace-id") or uuid.uuid4().hex)
+    token = _current_trace.set(trace)
+    profiler = None
+    if _profiling_requested(request) and _profile_lock.acquire(blocking=False):
+        profiler = SamplingProfiler(threading.get_ident()).start()
+    profiler_token = _current_profiler.set(profiler)
+    try:
+        response = await call_next(request)
+    finally:
+        _current_trace.reset(token)
+        _current_profiler.reset(profiler_token)
+        if profiler is not None:
+            profiler.stop()
+            _profile_lock.release()
+    response.headers["X-Trace-Id"] = trace.trace_id
+    if trace.spans:
+        response.headers["Server-Timing"] = trace.server_timing()
+    if profiler is not None:
+        _save_diagnostics(trace, profiler, request.url.path)
+    return response
@@ -2,18 +2,66 @@
 
 from tavily import TavilyClient
 from langchain_core.prompts import ChatPromptTemplate
-from src.langgraphagenticai.tools.translation_tool import create_translation_tool
-from src.langgraphagenticai.tools.pdf_tool import convert_md_to_pdf
-from src.langgraphagenticai.tools.email_tool import send_email_with_attachment
+from langchain_core.runnables import RunnableLambda
+from src.langgraphagenticai.tools.translation_tool import translation_prompt
+from src.langgraphagenticai.LLMS.model_router import ModelRouter
+from src.langgraphagenticai.utils.output_validation import validate_translation
+
+from src.langgraphagenticai.utils.token_budget import TokenBudgetPlanner, count_tokens
+from src.langgraphagenticai.utils.extractive import ExtractiveCompressor, split_sentences
+from src.langgraphagenticai.utils.digest_markdown import render_digest
+from src.langgraphagenticai.tools.batch_translation import parse_packed
+from src.langgraphagenticai.cache.summary_cache import article_key, get_summary_cache
+from src.langgraphagenticai.tools.news_search import NewsSearcher
+from src.langgraphagenticai.storage.artifacts import NewsArtifact, get_artifact_writer
 import os
+import re
+
+TIME_RANGE_DAYS = {'daily': 1, 'weekly': 7, 'monthly': 30, 'yearly': 366}
+
+ARTICLE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a skilled news summarizer. Summarize each numbered article below on its own.
+
+    **Instructions:**
+    1. **Format**: Answer every article in the given order. Start each one with its marker line exactly as given (e.g. `<<<1>>>`), followed by one line: `**Headline**: summary`
+    2. **Content**: Create concise, informative summaries (2-3 sentences max per article) with the main facts and implications
+    3. **Completeness**: Do not merge, split or skip articles
+    4. **Quality**: Focus on key facts, avoid redundancy, maintain journalistic tone. Do not add dates, links or source names
+    """),
+    ("user", "Please summarize the following articles:\n\n{items}")
+])
+
+HEADLINE_SUMMARY = re.compile(r"^\s*(?:[-*]\s*)?\*\*\[?(.+?)\]?\*\*\s*:?\s*(.+)$", re.DOTALL)
+
+def format_article(item: dict, content: str) -> str:
+    """Renders one article as it appears in the summarization prompt."""
+    return f"Title: {item.get('title', '')}\nContent: {content}"
+
+def parse_article_summary(text: str, item: dict) -> tuple:
+    """Splits one answer of a packed summary into (headline, summary); without a bold headline the title is used."""
+    match = HEADLINE_SUMMARY.match(text)
+    if match:
+        return match.group(1).strip(), " ".join(match.group(2).split())
+    return item.get('title') or "News update", " ".join(text.split())
+
+def lead_summary(item: dict) -> tuple:
+    """Fallback for an article the model did not summarize: its title and first sentence."""
+    sentences = split_sentences(item.get('content', ''))
+    return item.get('title') or "News update", sentences[0] if sentences else (item.get('content') or '')[:300]
 
 class NewsNode:
-    def __init__(self, llm):
+    def __init__(self, llm, router=None):
         """Initialize the NewsNode with API keys and tools."""
         self.tavily = TavilyClient()
         self.llm = llm
         self.state = {}
-        self.translation_tool = create_translation_tool(llm)
+        # Chooses the model per stage; without one, every stage uses `llm` in a single call
+        self.router = router or ModelRouter(llm)
+
+    def _restore(self, state: dict):
+        """A resumed run starts at a later node: pick up the working state from its checkpoint."""
+        if not self.state:
+            self.state.update(state)
 
     def fetch_news(self, state: dict) -> dict:
         """Fetch news and parse user input for frequency, topic, language, and email."""
@@ -25,102 +73,193 @@ class NewsNode:
         self.state['topic'] = parts[1].strip() if len(parts) > 1 and parts[1].strip() else "general news"
         self.state['target_language'] = parts[2].strip() if len(parts) > 2 and parts[2].strip() else "English"
         self.state['recipient_email'] = parts[3].strip() if len(parts) > 3 and parts[3].strip() else None
+        self.state['since_last_digest'] = bool(state.get('since_last_digest'))
+        self.state['digest_feed'] = state.get('digest_feed')
+
+        # Several regional and sub-topic queries run concurrently; results are merged and ranked
+        searcher = NewsSearcher(self.tavily)
+        news_data, self.state['search'] = searcher.search(self.state['topic'], TIME_RANGE_DAYS.get(self.state['frequency'], 1))
+        self.state['news_data'] = news_data
+        # The whole working state, so the checkpoint after this node is enough to resume from
+        return self.state
 
-        time_range_map = {'daily': 'd', 'weekly': 'w', 'monthly': 'm', 'yearly': 'y'}
-        days_map = {'daily': 1, 'weekly': 7, 'monthly': 30, 'yearly': 366}
+    def filter_delivered(self, state: dict) -> dict:
+        """In "since last digest" mode, drop articles the feed already received in an earlier digest."""
+        self._restore(state)
+        if self.state.get('since_last_digest'):
+            from src.langgraphagenticai.storage.digest_ledger import feed_key, get_digest_ledger
 
-        search_query = f"Top latest {self.state['topic']} news India and globally"
-        response = self.tavily.search(query=search_query, topic="news", max_results=20, days=days_map.get(self.state['frequency'], 1))
-        
-        state['news_data'] = response.get('results', [])
-        self.state['news_data'] = state['news_data']
-        return state
+            feed = feed_key(self.state['topic'], self.state.get('digest_feed') or self.state.get('recipient_email'))
+            self.state['news_data'], report = get_digest_ledger().filter_new(feed, self.state['news_data'])
+            self.state['delta'] = {"feed": feed, **report}
+        return self.state
+
+    def route_after_filter(self, state: dict) -> str:
+        """Ends the run before any LLM call when a delta digest has nothing new."""
+        if self.state.get('since_last_digest') and not self.state.get('news_data'):
+            return "nothing_new"
+        return "continue"
+
+    def enrich_news(self, state: dict) -> dict:
+        """Replace Tavily's short snippets with the full article text, fetched concurrently."""
+        self._restore(state)
+        from src.langgraphagenticai.tools.article_fetcher import get_article_fetcher
+
+        self.state['news_data'], self.state['enrichment'] = get_article_fetcher().enrich(self.state['news_data'])
+        return self.state
+
+    def compress_news(self, state: dict) -> dict:
+        """Keep only the most central, on-topic sentences of each article before summarizing."""
+        self._restore(state)
+        # Keyed before compression, which depends on the topic, so every digest finds the same
+        # summaries; after enrichment, so a full-text summary is never mistaken for a snippet one
+        self.state['news_data'] = [{**item, 'article_key': article_key(item)} for item in self.state['news_data']]
+        compressor = ExtractiveCompressor(
+            sentences_per_article=int(os.getenv("NEWS_EXTRACT_SENTENCES", "4")),
+            query_weight=float(os.getenv("NEWS_EXTRACT_QUERY_WEIGHT", "0.4")),
+            max_sentences=int(os.getenv("NEWS_EXTRACT_MAX_SENTENCES", "60")),
+        )
+        self.state['news_data'], self.state['compression'] = compressor.compress(self.state['news_data'], self.state['topic'])
+        return self.state
     
     def summarize_news(self, state: dict) -> dict:
-        """Summarize the fetched news using an LLM."""
-        # ... (This method remains unchanged)
+        """Summarize each article on its own, reusing cached summaries, and lay out the digest locally."""
+        self._restore(state)
         news_items = self.state['news_data']
-        topic = self.state['topic']
-
-        prompt_template = ChatPromptTemplate.from_messages([
-            ("system", """You are a skilled news summarizer. Your task is to process news articles and create a well-structured markdown summary.
-
-            **Instructions:**
-            1. **Date Format**: Use **YYYY-MM-DD** format in IST timezone
-            2. **Content**: Create concise, informative summaries (2-3 sentences max per article)
-            3. **Organization**: Sort chronologically with latest news first
-            4. **Sources**: Include source URL as clickable link
-            5. **Quality**: Focus on key facts, avoid redundancy, maintain journalistic tone
-
-            **Output Format:**
-            ```
-            ### YYYY-MM-DD
-            - **[Headline/Key Point]**: [2-3 sentence summary with main facts and implications] ([Source Name](URL))
-            ```
-            """),
-            ("user", "Please summarize the following articles:\n\n{articles}")
-        ])
-        
-        articles_str = "\n\n".join([f"Content: {item.get('content', '')}\nURL: {item.get('url', '')}" for item in news_items])
-        response = self.llm.invoke(prompt_template.format(articles=articles_str))
-        state['summary'] = response.content
+
+        # Fit the articles into the model's context window, favouring relevant and recent ones
+        window_days = TIME_RANGE_DAYS.get(self.state.get('frequency'), 1)
+        planner = TokenBudgetPlanner(
+            self.router.model_for("merge"),
+            reserved_output_tokens=int(os.getenv("NEWS_SUMMARY_MAX_OUTPUT_TOKENS", "2048")),
+            max_input_tokens=int(os.getenv("NEWS_PROMPT_MAX_INPUT_TOKENS")) if os.getenv("NEWS_PROMPT_MAX_INPUT_TOKENS") else None,
+            recency_half_life_hours=window_days * 24 / 2,
+        )
+        fixed_prompt_tokens = count_tokens(ARTICLE_PROMPT.format(items=""))
+        news_items, self.state['token_budget'] = planner.plan(news_items, fixed_prompt_tokens, format_article)
+        # Articles dropped by the budget are not in the digest, so a delta digest may still deliver them later
+        self.state['news_data'] = news_items
+
+        # Only articles no earlier digest has summarized cost an LLM call
+        keys = [item.get('article_key') or article_key(item) for item in news_items]
+        cache = get_summary_cache()
+        cached = cache.get_many(keys) if cache else {}
+        missing = list({key: item for key, item in zip(keys, news_items) if key not in cached}.items())
+        summarized, model = self._summarize_articles(missing)
+        if cache and summarized:
+            cache.store_many([(key, item.get('url', ''), *summarized[key]) for key, item in missing if key in summarized], model)
+        summaries = {**cached, **summarized}
+
+        entries = [(item, *(summaries.get(key) or lead_summary(item))) for key, item in zip(keys, news_items)]
+        self.state['summary_cache'] = {
+            "articles": len(news_items),
+            "cached": sum(1 for key in keys if key in cached),
+            "summarized": len(summarized),
+            "fallback": sum(1 for key in keys if key not in summaries),
+        }
+        self.state['model_routing'] = self.router.report()
+        state['summary'] = render_digest(entries)
         self.state['summary'] = state['summary']
         return self.state
 
+    def _summarize_articles(self, articles: list) -> tuple:
+        """
+        Summarizes (article_key, article) pairs with packed multi-article prompts. Returns
+        ({article_key: (headline, summary)}, model used); articles missing from the answers are left out.
+        """
+        router = self.router
+        if not articles:
+            return {}, None
+        if router.chunk_size is None or len(articles) <= router.chunk_size:
+            # Few new articles: one call with the merge model
+            stage, batches = "merge", [articles]
+        else:
+            # Summarize chunks concurrently with the small model
+            stage, batches = "chunk_summary", [articles[i:i + router.chunk_size] for i in range(0, len(articles), router.chunk_size)]
+
+        def summarize_batch(batch):
+            items = "\n\n".join(f"<<<{position + 1}>>>\n{format_article(item, item.get('content', ''))}" for position, (_, item) in enumerate(batch))
+            prompt = ARTICLE_PROMPT.format_messages(items=items)
+
+            def validate(output):
+                found = len(parse_packed(output.content, len(batch)))
+                return [] if found == len(batch) else [f"summarized {found} of {len(batch)} articles"]
+            parsed = parse_packed(router.run(stage, lambda llm: llm.invoke(prompt), validate).content, len(batch))
+            return {batch[position][0]: parse_article_summary(text, batch[position][1]) for position, text in parsed.items()}
+
+        summarized = {}
+        for found in RunnableLambda(summarize_batch).batch(batches):
+            summarized.update(found)
+        return summarized, router.model_for(stage)
+
     def translate_news(self, state: dict) -> dict:
         """Translate the news summary if a target language is specified."""
-        # ... (This method remains unchanged)
+        self._restore(state)
         target_language = self.state.get('target_language', 'English')
         summary = self.state.get('summary', '')
         if target_language.lower() == 'english':
             self.state['translated_summary'] = summary
         else:
-            self.state['translated_summary'] = self.translation_tool._run(summary, target_language)
+            self.state['translated_summary'] = self.router.run(
+                "translation",
+                lambda llm: llm.invoke(translation_prompt(summary, target_language)).content,
+                lambda output: validate_translation(summary, output),
+            )
+            self.state['model_routing'] = self.router.report()
         return self.state
     
     def save_result(self, state: dict) -> dict:
-            """Save the summary to a markdown file with language in the filename."""
+            """Build the markdown artifact (named with the language) and queue it for saving."""
+            self._restore(state)
             summary = self.state.get('translated_summary', self.state.get('summary', ''))
             topic_clean = self.state['topic'].replace(' ', '_').replace('/', '_')
             frequency = self.state['frequency']
             target_language = self.state.get('target_language', 'English')
             
-            # Create directory if it doesn't exist
-            news_dir = "./News"
-            os.makedirs(news_dir, exist_ok=True)
-            
             # --- CORRECTED FILENAME LOGIC ---
             if target_language.lower() == 'english':
-                filename = f"{news_dir}/{frequency}_{topic_clean}_summary.md"
+                basename = f"{frequency}_{topic_clean}_summary"
                 header = f"# {frequency.capitalize()} {topic_clean.title()} News Summary\n\n"
             else:
                 language_clean = target_language.replace(' ', '_').replace('(', '').replace(')', '')
-                filename = f"{news_dir}/{frequency}_{topic_clean}_{language_clean}_summary.md"
+                basename = f"{frequency}_{topic_clean}_{language_clean}_summary"
                 header = f"# {frequency.capitalize()} {topic_clean.title()} News Summary ({target_language})\n\n"
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(header + summary)
+            # Later nodes and callers use the in-memory artifact; the file is written behind
+            artifact = NewsArtifact(basename=basename, markdown=header + summary)
+            get_artifact_writer().persist(artifact.md_path, artifact.markdown.encode("utf-8"))
             
-            self.state['md_filename'] = filename
+            self.state['artifact'] = artifact
+            self.state['md_filename'] = artifact.md_path
             return self.state
 
     def convert_to_pdf(self, state: dict) -> dict:
-        """Convert the saved markdown file to PDF."""
-        md_path = self.state.get('md_filename')
-        if md_path:
-            pdf_path = convert_md_to_pdf(md_path)
-            self.state['pdf_filename'] = pdf_path
-            print(f"Converted {md_path} to {pdf_path}")
+        """Render the markdown artifact to PDF in memory and queue it for saving."""
+        self._restore(state)
+        artifact = self.state.get('artifact')
+        if artifact:
+            # PyMuPDF is slow to import; load it on the first conversion
+            from src.langgraphagenticai.tools.pdf_tool import render_md_to_pdf
+            artifact.pdf = render_md_to_pdf(artifact.markdown, artifact.md_name)
+            get_artifact_writer().persist(artifact.pdf_path, artifact.pdf)
+            self.state['pdf_filename'] = artifact.pdf_path
+            print(f"[trace {state.get('trace_id')}] Converted {artifact.md_name} to {artifact.pdf_name}")
         return self.state
 
     def send_email(self, state: dict) -> dict:
         """Send the generated PDF as an email attachment if an email is provided."""
+        self._restore(state)
         recipient_email = self.state.get('recipient_email')
-        pdf_path = self.state.get('pdf_filename')
+        artifact = self.state.get('artifact')
         
-        if recipient_email and pdf_path:
-            subject = f"{self.state['frequency'].capitalize()} {self.state['topic'].title()} News Summary"
-            body = f"Please find attached the {self.state['frequency']} news summary for '{self.state['topic']}'."
-            send_email_with_attachment(recipient_email, subject, body, pdf_path)
+        if recipient_email and artifact and artifact.pdf:
+            from src.langgraphagenticai.tools.email_tool import digest_email_text, send_email_with_attachment
+            subject, body = digest_email_text(self.state['frequency'], self.state['topic'])
+            send_email_with_attachment(recipient_email, subject, body, artifact.pdf_path, data=artifact.pdf)
             self.state['email_sent'] = True
+        if self.state.get('since_last_digest') and 'delta' in self.state:
+            from src.langgraphagenticai.storage.digest_ledger import get_digest_ledger
+
+            # Recorded only once the digest is delivered, so a failed run doesn't hide its articles
+            get_digest_ledger().record(self.state['delta']['feed'], self.state['news_data'])
         return self.state
\ No newline at end of file
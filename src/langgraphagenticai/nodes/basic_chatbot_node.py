@@ -1,17 +1,40 @@
 # src/langgraphagenticai/nodes/basic_chatbot_node.py
 
+from langchain_core.messages import AIMessage, HumanMessage
 from src.langgraphagenticai.state.state import State
+from src.langgraphagenticai.memory.context_manager import with_conversation_summary
 
 class BasicChatbotNode:
     """
     Basic Chatbot login implementation
     """
-    def __init__(self,model):
+    def __init__(self,model,cache=None):
         self.llm=model
+        self.cache=cache
+        # Answers are only reused for the model that produced them
+        self.cache_namespace=getattr(model,"model_name",None) or type(model).__name__
 
     def process(self,state:State)->dict:
         """
         Processes the input state and generates a chatbot response.
+        Stand-alone prompts are answered from the prompt cache when the same normalized prompt was seen before.
         """
-        return {"messages":self.llm.invoke(state['messages'])}
+        prompt=self._cacheable_prompt(state)
+        if prompt is not None:
+            cached=self.cache.lookup(self.cache_namespace,prompt)
+            if cached is not None:
+                return {"messages":AIMessage(content=cached,response_metadata={"prompt_cache":"hit"})}
 
+        response=self.llm.invoke(with_conversation_summary(state))
+        if prompt is not None and isinstance(response.content,str):
+            self.cache.store(self.cache_namespace,prompt,response.content)
+        return {"messages":response}
+
+    def _cacheable_prompt(self,state:State)->str|None:
+        """Returns the prompt text if the answer cannot depend on earlier turns."""
+        if self.cache is None or state.get("conversation_summary"):
+            return None
+        messages=state["messages"]
+        if len(messages)!=1 or not isinstance(messages[0],HumanMessage):
+            return None
+        return messages[0].content if isinstance(messages[0].content,str) else None
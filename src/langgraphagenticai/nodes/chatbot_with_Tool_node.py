@@ -1,6 +1,7 @@
 # src/langgraphagenticai/nodes/chatbot_with_Tool_node.py
 
 from src.langgraphagenticai.state.state import State
+from src.langgraphagenticai.memory.context_manager import with_conversation_summary
 
 class ChatbotWithToolNode:
     """
@@ -32,7 +33,7 @@ class ChatbotWithToolNode:
             """
             Chatbot logic for processing the input state and returning a response.
             """
-            return {"messages": [llm_with_tools.invoke(state["messages"])]}
+            return {"messages": [llm_with_tools.invoke(with_conversation_summary(state))]}
 
         return chatbot_node
 
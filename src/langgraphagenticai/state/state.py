@@ -2,11 +2,35 @@
 
 from typing_extensions import TypedDict,List
 from langgraph.graph.message import add_messages
-from typing import Annotated
+from typing import Annotated, Optional
+from src.langgraphagenticai.storage.artifacts import NewsArtifact
 
 
 class State(TypedDict):
     """
     Represent the structure of the state used in graph
     """
-    messages: Annotated[List,add_messages]
\ No newline at end of file
+    messages: Annotated[List,add_messages]
+    conversation_summary: str
+    trace_id: Optional[str]
+    # News pipeline
+    frequency: str
+    topic: str
+    target_language: str
+    recipient_email: Optional[str]
+    since_last_digest: bool
+    digest_feed: Optional[str]
+    search: dict
+    news_data: List[dict]
+    delta: dict
+    enrichment: dict
+    compression: dict
+    token_budget: dict
+    summary_cache: dict
+    model_routing: dict
+    summary: str
+    translated_summary: str
+    artifact: Optional[NewsArtifact]
+    md_filename: str
+    pdf_filename: str
+    email_sent: bool
\ No newline at end of file
@@ -0,0 +1,197 @@
+# src/langgraphagenticai/storage/archive.py
+
+import gzip
+import hashlib
+import os
+import threading
+import time
+from functools import lru_cache
+from src.langgraphagenticai.storage.files import atomic_write_bytes
+from src.langgraphagenticai.storage.sqlite import connect
+
+NEWS_DIR = "./News"
+ARCHIVE_DIR = os.getenv("NEWS_ARCHIVE_DIR", os.path.join(NEWS_DIR, ".archive"))
+ARCHIVE_MAX_BYTES = int(os.getenv("NEWS_ARCHIVE_MAX_BYTES", str(500 * 1024 * 1024)))
+ARCHIVE_RETENTION_DAYS = float(os.getenv("NEWS_ARCHIVE_RETENTION_DAYS", "30"))
+# Markdown not read for this long is stored gzip-compressed
+ARCHIVE_COMPRESS_AFTER_SECONDS = float(os.getenv("NEWS_ARCHIVE_COMPRESS_AFTER_SECONDS", "86400"))
+ARCHIVE_MAINTENANCE_INTERVAL_SECONDS = float(os.getenv("NEWS_ARCHIVE_MAINTENANCE_INTERVAL_SECONDS", "60"))
+COMPRESSIBLE_SUFFIXES = (".md",)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    compressed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    digest TEXT NOT NULL REFERENCES objects(digest),
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_digest ON files(digest);
+CREATE INDEX IF NOT EXISTS files_accessed_at ON files(accessed_at);
+"""
+
+class ArchiveStore:
+    """
+    Content-addressed store for generated news files.
+
+    Each file name (e.g. "daily_ai_summary.pdf") points to an object named by the SHA-256
+    of its bytes, so identical digests are stored once. Cold markdown is gzip-compressed,
+    names older than the retention period are dropped, and when the objects exceed
+    `max_bytes` the least recently accessed names are evicted. Objects without names are
+    deleted. The index is a SQLite database shared by all worker processes; changes run
+    in IMMEDIATE transactions so object writes and deletions never race.
+    """
+    def __init__(self, root: str = ARCHIVE_DIR, max_bytes: int = ARCHIVE_MAX_BYTES,
+                 retention_days: float = ARCHIVE_RETENTION_DAYS, compress_after: float = ARCHIVE_COMPRESS_AFTER_SECONDS,
+                 maintenance_interval: float = ARCHIVE_MAINTENANCE_INTERVAL_SECONDS):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.retention_seconds = retention_days * 86400
+        self.compress_after = compress_after
+        self.maintenance_interval = maintenance_interval
+        self._last_maintenance = 0.0
+        self._conn = connect(os.path.join(root, "index.sqlite"))
+        self._conn.isolation_level = None  # transactions are explicit
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest: str, compressed: bool = False) -> str:
+        return os.path.join(self.root, "objects", digest[:2], digest + (".gz" if compressed else ""))
+
+    def _transaction(self):
+        store = self
+
+        class _Tx:
+            def __enter__(self):
+                store._lock.acquire()
+                store._conn.execute("BEGIN IMMEDIATE")
+                return store._conn
+
+            def __exit__(self, exc_type, exc, tb):
+                try:
+                    store._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+                finally:
+                    store._lock.release()
+        return _Tx()
+
+    def put(self, name: str, data: bytes):
+        """Stores `data` under `name`, replacing any previous version."""
+        digest = hashlib.sha256(data).hexdigest()
+        now = time.time()
+        with self._transaction() as conn:
+            if conn.execute("SELECT 1 FROM objects WHERE digest = ?", (digest,)).fetchone() is None:
+                atomic_write_bytes(self._object_path(digest), data)
+                conn.execute("INSERT INTO objects (digest, size, stored_size) VALUES (?, ?, ?)", (digest, len(data), len(data)))
+            previous = conn.execute("SELECT digest FROM files WHERE name = ?", (name,)).fetchone()
+            conn.execute(
+                "INSERT INTO files (name, digest, created_at, accessed_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET digest = excluded.digest, created_at = excluded.created_at, accessed_at = excluded.accessed_at",
+                (name, digest, now, now),
+            )
+            if previous and previous[0] != digest:
+                self._collect(conn, [previous[0]])
+        if now - self._last_maintenance >= self.maintenance_interval:
+            self.maintain()
+
+    def get(self, name: str) -> bytes | None:
+        """Returns the bytes stored under `name` and marks it as recently used, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT o.digest, o.compressed FROM files f JOIN objects o ON o.digest = f.digest WHERE f.name = ?", (name,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE files SET accessed_at = ? WHERE name = ?", (time.time(), name))
+        digest, compressed = row
+        try:
+            with open(self._object_path(digest, bool(compressed)), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            # Compressed or evicted by another worker since the lookup; look again
+            return self.get(name) if self.exists(name) else None
+        return gzip.decompress(data) if compressed else data
+
+    def exists(self, name: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM files WHERE name = ?", (name,)).fetchone() is not None
+
+    def list(self) -> list:
+        """Returns [{"filename", "size_bytes"}] for every stored name (original, uncompressed sizes)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT f.name, o.size FROM files f JOIN objects o ON o.digest = f.digest ORDER BY f.name"
+            ).fetchall()
+        return [{"filename": name, "size_bytes": size} for name, size in rows]
+
+    def delete(self, name: str) -> bool:
+        with self._transaction() as conn:
+            row = conn.execute("SELECT digest FROM files WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return False
+            conn.execute("DELETE FROM files WHERE name = ?", (name,))
+            self._collect(conn, [row[0]])
+        return True
+
+    def _collect(self, conn, digests: list):
+        """Deletes objects among `digests` that no name refers to. Runs inside a transaction."""
+        for digest in set(digests):
+            if conn.execute("SELECT 1 FROM files WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+                continue
+            row = conn.execute("SELECT compressed FROM objects WHERE digest = ?", (digest,)).fetchone()
+            conn.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+            if row is not None:
+                try:
+                    os.remove(self._object_path(digest, bool(row[0])))
+                except FileNotFoundError:
+                    pass
+
+    def maintain(self) -> dict:
+        """Applies retention, compresses cold markdown and evicts LRU names beyond max_bytes."""
+        self._last_maintenance = now = time.time()
+        report = {"expired": 0, "compressed": 0, "evicted": 0}
+        with self._transaction() as conn:
+            expired = conn.execute("SELECT name, digest FROM files WHERE created_at < ?", (now - self.retention_seconds,)).fetchall()
+            conn.executemany("DELETE FROM files WHERE name = ?", [(name,) for name, _ in expired])
+            self._collect(conn, [digest for _, digest in expired])
+            report["expired"] = len(expired)
+
+            suffix_filter = " OR ".join("f.name LIKE ?" for _ in COMPRESSIBLE_SUFFIXES)
+            cold = conn.execute(
+                f"SELECT o.digest FROM objects o JOIN files f ON f.digest = o.digest WHERE o.compressed = 0 AND ({suffix_filter}) "
+                "GROUP BY o.digest HAVING MAX(f.accessed_at) < ?",
+                [f"%{suffix}" for suffix in COMPRESSIBLE_SUFFIXES] + [now - self.compress_after],
+            ).fetchall()
+            for (digest,) in cold:
+                with open(self._object_path(digest), "rb") as f:
+                    packed = gzip.compress(f.read())
+                atomic_write_bytes(self._object_path(digest, compressed=True), packed)
+                conn.execute("UPDATE objects SET compressed = 1, stored_size = ? WHERE digest = ?", (len(packed), digest))
+                os.remove(self._object_path(digest))
+            report["compressed"] = len(cold)
+
+            total = conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM objects").fetchone()[0]
+            if total > self.max_bytes:
+                for name, digest in conn.execute("SELECT name, digest FROM files ORDER BY accessed_at").fetchall():
+                    conn.execute("DELETE FROM files WHERE name = ?", (name,))
+                    self._collect(conn, [digest])
+                    report["evicted"] += 1
+                    total = conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM objects").fetchone()[0]
+                    if total <= self.max_bytes:
+                        break
+        return report
+
+    def stats(self) -> dict:
+        with self._lock:
+            names, objects, size, stored = self._conn.execute(
+                "SELECT (SELECT COUNT(*) FROM files), COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM objects"
+            ).fetchone()
+        return {"files": names, "objects": objects, "bytes": size, "stored_bytes": stored, "max_bytes": self.max_bytes}
+
+@lru_cache(maxsize=1)
+def get_archive_store() -> ArchiveStore:
+    return ArchiveStore()
@@ -0,0 +1,105 @@
+# src/langgraphagenticai/storage/article_archive.py
+
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from functools import lru_cache
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from src.langgraphagenticai.utils.article_batch import ArticleBatch
+
+ARTICLE_ARCHIVE_DIR = os.getenv("ARTICLE_ARCHIVE_DIR", "./News/.articles")
+ARTICLE_ARCHIVE_RETENTION_DAYS = float(os.getenv("ARTICLE_ARCHIVE_RETENTION_DAYS", "90"))
+PRUNE_INTERVAL_SECONDS = 3600
+ROLLUP_KEYS = ("date", "topic", "source")
+
+PARTITIONING = ds.partitioning(pa.schema([("date", pa.string()), ("topic", pa.string())]), flavor="hive")
+
+def topic_partition(topic: str) -> str:
+    """Directory-safe partition value for a topic; topics differing only in case or punctuation share one."""
+    return re.sub(r"[^a-z0-9]+", "_", topic.lower()).strip("_") or "general"
+
+class ArticleArchive:
+    """
+    Every fetched article batch as Parquet, partitioned by fetch date and topic
+    (`date=YYYY-MM-DD/topic=<topic>/part-*.parquet`). Scans read memory-mapped files and
+    skip partitions outside the requested dates and topic. Date partitions past the
+    retention period are deleted.
+    """
+    def __init__(self, root: str = ARTICLE_ARCHIVE_DIR, retention_days: float = ARTICLE_ARCHIVE_RETENTION_DAYS):
+        self.root = root
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+
+    def append(self, batch: ArticleBatch, topic: str, fetched_at: float | None = None):
+        """Writes one fetched batch as a new file in its date and topic partition."""
+        if not len(batch):
+            return
+        fetched_at = fetched_at or time.time()
+        table = batch.table.append_column("canonical_url", batch.canonical_urls())
+        table = table.append_column("source", pc.replace_substring_regex(table["canonical_url"], pattern=r"[/?].*$", replacement=""))
+        table = table.append_column("fetched_at", pa.array([fetched_at] * len(batch), pa.timestamp("s", tz="UTC")))
+        directory = os.path.join(self.root, f"date={_day(fetched_at)}", f"topic={topic_partition(topic)}")
+        os.makedirs(directory, exist_ok=True)
+        # Unique names, so concurrent runs and worker processes never write the same file
+        pq.write_table(table, os.path.join(directory, f"part-{uuid.uuid4().hex}.parquet"), compression="zstd")
+        self._prune()
+
+    def scan(self, columns: list | None = None, topic: str | None = None, since_days: float | None = None) -> pa.Table:
+        """Reads the archived articles, optionally only `columns`, one topic and the last `since_days` days."""
+        if not os.path.isdir(self.root):
+            return pa.table({})
+        filters = []
+        if topic:
+            filters.append(("topic", "=", topic_partition(topic)))
+        if since_days is not None:
+            filters.append(("date", ">=", _day(time.time() - since_days * 86400)))
+        return pq.read_table(self.root, columns=columns, filters=filters or None, partitioning=PARTITIONING, memory_map=True)
+
+    def rollup(self, by: tuple = ("date", "topic"), topic: str | None = None, since_days: float | None = 7) -> list:
+        """Article counts per group of `by` (date, topic, source): fetched, distinct and mean rank score."""
+        unknown = set(by) - set(ROLLUP_KEYS)
+        if unknown or not by:
+            raise ValueError(f"Roll-up keys must be among {', '.join(ROLLUP_KEYS)}")
+        table = self.scan(columns=[*by, "canonical_url", "rank_score"], topic=topic, since_days=since_days)
+        if table.num_rows == 0:
+            return []
+        grouped = table.group_by(list(by)).aggregate([
+            ("canonical_url", "count"),
+            ("canonical_url", "count_distinct"),
+            ("rank_score", "mean"),
+        ])
+        rows = [
+            {**{key: row[key] for key in by}, "fetched": row["canonical_url_count"], "distinct": row["canonical_url_count_distinct"],
+             "mean_rank_score": round(row["rank_score_mean"], 4) if row["rank_score_mean"] is not None else None}
+            for row in grouped.to_pylist()
+        ]
+        return sorted(rows, key=lambda row: tuple(row[key] for key in by), reverse=True)
+
+    def _prune(self):
+        now = time.time()
+        with self._lock:
+            if now - self._last_prune < PRUNE_INTERVAL_SECONDS:
+                return
+            self._last_prune = now
+        cutoff = _day(now - self.retention_days * 86400)
+        for entry in os.listdir(self.root):
+            if entry.startswith("date=") and entry[len("date="):] < cutoff:
+                shutil.rmtree(os.path.join(self.root, entry), ignore_errors=True)
+
+def _day(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%d")
+
+@lru_cache(maxsize=1)
+def get_article_archive() -> ArticleArchive | None:
+    """Returns the Parquet article archive, or None when disabled via ARTICLE_ARCHIVE_ENABLED."""
+    if os.getenv("ARTICLE_ARCHIVE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    return ArticleArchive()
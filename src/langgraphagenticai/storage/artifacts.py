@@ -0,0 +1,96 @@
+# src/langgraphagenticai/storage/artifacts.py
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from src.langgraphagenticai.storage.archive import get_archive_store
+from src.langgraphagenticai.storage.files import atomic_write_bytes
+
+NEWS_DIR = "./News"
+# Write artifacts to disk in the background; set to false to write before the graph continues
+ARTIFACT_WRITE_BEHIND = os.getenv("ARTIFACT_WRITE_BEHIND", "true").lower() not in ("0", "false", "no")
+# Store artifacts in the content-addressed archive under ./News/.archive; false writes plain files
+NEWS_ARCHIVE_ENABLED = os.getenv("NEWS_ARCHIVE_ENABLED", "true").lower() not in ("0", "false", "no")
+
+@dataclass
+class NewsArtifact:
+    """The rendered outputs of one news run, kept in memory and carried in the graph state."""
+    basename: str  # e.g. "daily_ai_Hindi_summary"
+    markdown: str
+    pdf: bytes | None = None
+
+    @property
+    def md_name(self) -> str:
+        return f"{self.basename}.md"
+
+    @property
+    def pdf_name(self) -> str:
+        return f"{self.basename}.pdf"
+
+    @property
+    def md_path(self) -> str:
+        return f"{NEWS_DIR}/{self.md_name}"
+
+    @property
+    def pdf_path(self) -> str:
+        return f"{NEWS_DIR}/{self.pdf_name}"
+
+class ArtifactWriter:
+    """
+    Write-behind persistence for artifacts. Writes run on a small thread pool so the
+    pipeline does not wait on disk; until a write lands, `pending(path)` serves its bytes.
+    """
+    def __init__(self, write_behind: bool = ARTIFACT_WRITE_BEHIND, max_workers: int = 2, archive: bool = NEWS_ARCHIVE_ENABLED):
+        self.write_behind = write_behind
+        self.archive = archive
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifact-writer")
+        self._pending = {}  # path -> (bytes, future)
+        self._lock = threading.Lock()
+
+    def persist(self, path: str, data: bytes):
+        if not self.write_behind:
+            self._store(path, data)
+            return
+        with self._lock:
+            future = self._executor.submit(self._write, path, data)
+            self._pending[path] = (data, future)
+
+    def _write(self, path: str, data: bytes):
+        try:
+            self._store(path, data)
+        except Exception as e:
+            print(f"Failed to persist {path}: {e}")
+        finally:
+            with self._lock:
+                # A newer write of the same path may have been queued meanwhile
+                entry = self._pending.get(path)
+                if entry is not None and entry[0] is data:
+                    del self._pending[path]
+
+    def _store(self, path: str, data: bytes):
+        if self.archive:
+            get_archive_store().put(os.path.basename(path), data)
+        else:
+            atomic_write_bytes(path, data)
+
+    def location(self, path: str) -> str:
+        """Where clients find a persisted file: its path when written as a plain file, else its URL in the archive."""
+        return f"/news/files/{os.path.basename(path)}" if self.archive else path
+
+    def pending(self, path: str) -> bytes | None:
+        with self._lock:
+            entry = self._pending.get(path)
+        return entry[0] if entry else None
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits for queued writes. Returns True if all of them finished."""
+        with self._lock:
+            futures = [future for _, future in self._pending.values()]
+        _, not_done = wait(futures, timeout=timeout)
+        return not not_done
+
+@lru_cache(maxsize=1)
+def get_artifact_writer() -> ArtifactWriter:
+    return ArtifactWriter()
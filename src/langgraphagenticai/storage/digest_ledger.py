@@ -0,0 +1,84 @@
+# src/langgraphagenticai/storage/digest_ledger.py
+
+import hashlib
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from src.langgraphagenticai.storage.sqlite import connect
+
+LEDGER_DB_PATH = os.getenv("DIGEST_LEDGER_DB_PATH", "./Memory/digest_ledger.sqlite")
+# Delivered articles older than this may appear in a digest again
+LEDGER_RETENTION_DAYS = float(os.getenv("DIGEST_LEDGER_RETENTION_DAYS", "90"))
+WORD = re.compile(r"\w+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS delivered (
+    feed TEXT NOT NULL,
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    delivered_at REAL NOT NULL,
+    PRIMARY KEY (feed, url)
+);
+CREATE INDEX IF NOT EXISTS delivered_hash ON delivered(feed, content_hash);
+CREATE INDEX IF NOT EXISTS delivered_at ON delivered(delivered_at);
+"""
+
+def feed_key(topic: str, feed: str | None) -> str:
+    """Ledger key for a topic and a subscriber (recipient email or feed ID)."""
+    return f"{' '.join(topic.lower().split())}|{(feed or 'default').strip().lower()}"
+
+def content_hash(item: dict) -> str:
+    """
+    Fingerprint of an article's headline (or its text when there is none), so the same
+    story syndicated under another URL is recognized as already delivered.
+    """
+    text = item.get('title') or item.get('content') or ''
+    return hashlib.sha256(" ".join(WORD.findall(text.lower())).encode("utf-8")).hexdigest()[:32]
+
+class DigestLedger:
+    """Remembers which articles each feed has already received in a digest."""
+    def __init__(self, path: str = LEDGER_DB_PATH, retention_days: float = LEDGER_RETENTION_DAYS):
+        self.retention_seconds = retention_days * 86400
+        self._conn = connect(path)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def filter_new(self, feed: str, news_items: list) -> tuple:
+        """
+        Returns (items not yet delivered to `feed`, report). Each returned item carries its
+        `content_hash`. Duplicates within `news_items` are dropped as well.
+        """
+        cutoff = time.time() - self.retention_seconds
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, content_hash FROM delivered WHERE feed = ? AND delivered_at >= ?", (feed, cutoff)
+            ).fetchall()
+        seen_urls = {url for url, _ in rows}
+        seen_hashes = {digest for _, digest in rows}
+        new_items = []
+        for item in news_items:
+            digest = content_hash(item)
+            if item.get('url') in seen_urls or digest in seen_hashes:
+                continue
+            seen_urls.add(item.get('url'))
+            seen_hashes.add(digest)
+            new_items.append({**item, 'content_hash': digest})
+        return new_items, {"fetched": len(news_items), "new": len(new_items), "already_delivered": len(news_items) - len(new_items)}
+
+    def record(self, feed: str, news_items: list):
+        """Marks `news_items` as delivered to `feed` and drops entries past the retention period."""
+        now = time.time()
+        rows = [(feed, item.get('url') or '', item.get('content_hash') or content_hash(item), now) for item in news_items]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO delivered (feed, url, content_hash, delivered_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(feed, url) DO UPDATE SET content_hash = excluded.content_hash, delivered_at = excluded.delivered_at",
+                rows,
+            )
+            self._conn.execute("DELETE FROM delivered WHERE delivered_at < ?", (now - self.retention_seconds,))
+
+@lru_cache(maxsize=1)
+def get_digest_ledger() -> DigestLedger:
+    return DigestLedger()
@@ -0,0 +1,36 @@
+# src/langgraphagenticai/storage/files.py
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+@contextmanager
+def atomic_path(path: str):
+    """
+    Yields a temporary path next to `path` and moves it into place on success.
+
+    Readers (other requests or worker processes) see either the previous file or the
+    complete new one, never a partially written file.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    # A .tmp suffix keeps in-progress files out of listings that filter on .md/.pdf
+    fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=directory)
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def atomic_write_text(path: str, text: str, encoding: str = "utf-8"):
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, "w", encoding=encoding) as f:
+            f.write(text)
+
+def atomic_write_bytes(path: str, data: bytes):
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
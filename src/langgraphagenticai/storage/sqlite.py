@@ -0,0 +1,22 @@
+# src/langgraphagenticai/storage/sqlite.py
+
+import os
+import sqlite3
+
+BUSY_TIMEOUT_SECONDS = float(os.getenv("SQLITE_BUSY_TIMEOUT_SECONDS", "30"))
+
+def connect(path: str) -> sqlite3.Connection:
+    """
+    Opens a SQLite connection that is safe to share between threads and worker processes.
+
+    WAL mode lets readers in other processes proceed while one process writes, and the
+    busy timeout makes concurrent writers wait instead of failing with "database is locked".
+    Connections must be opened after a worker forks, never inherited from the parent.
+    """
+    db_dir = os.path.dirname(path)
+    if db_dir:
+        os.makedirs(db_dir, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
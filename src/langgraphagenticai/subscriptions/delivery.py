@@ -0,0 +1,142 @@
+# src/langgraphagenticai/subscriptions/delivery.py
+
+import os
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.monitoring.metrics import track_dependency
+from src.langgraphagenticai.monitoring.tracing import current_trace_id
+from src.langgraphagenticai.subscriptions.store import get_subscription_store
+from src.langgraphagenticai.tools.email_tool import build_attachment, build_message, digest_email_text, smtp_login, unsubscribe_footer
+
+MAILER_CONCURRENCY = int(os.getenv("MAILER_CONCURRENCY", "4"))
+# Most SMTP providers throttle senders; stay under their limit instead of getting deferred
+MAILER_RATE_PER_SECOND = float(os.getenv("MAILER_RATE_PER_SECOND", "10"))
+
+class RateLimiter:
+    """Token bucket shared by the mailer threads: at most `rate` sends per second, bursts up to `burst`."""
+    def __init__(self, rate: float, burst: int | None = None):
+        self.rate = rate
+        self.capacity = burst or max(int(rate), 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class FanoutMailer:
+    """
+    Sends one digest to many recipients. A few worker threads each keep one logged-in SMTP
+    connection and reuse it for every message; a shared token bucket limits the send rate.
+    """
+    def __init__(self, concurrency: int = MAILER_CONCURRENCY, rate_per_second: float = MAILER_RATE_PER_SECOND):
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="mailer")
+        self._limiter = RateLimiter(rate_per_second) if rate_per_second > 0 else None
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _connection(self, fresh: bool = False) -> smtplib.SMTP:
+        server = getattr(self._local, "server", None)
+        if server is not None and fresh:
+            self._close(server)
+            server = None
+        if server is None:
+            server = self._local.server = smtp_login()
+            with self._lock:
+                self._connections.append(server)
+        return server
+
+    def _close(self, server: smtplib.SMTP):
+        with self._lock:
+            if server in self._connections:
+                self._connections.remove(server)
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def _send(self, message):
+        if self._limiter:
+            self._limiter.acquire()
+        with track_dependency("smtp"):
+            try:
+                self._connection().send_message(message)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # Idle connections get dropped by the server; reconnect once
+                self._connection(fresh=True).send_message(message)
+
+    def send(self, bodies: dict, subject: str, filename: str, data: bytes) -> dict:
+        """Queues the digest for every recipient in `bodies` ({email: body}). Returns {email: Future}."""
+        attachment = build_attachment(filename, data)
+        return {
+            email: self._executor.submit(self._send, build_message(email, subject, body, attachment))
+            for email, body in bodies.items()
+        }
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        for server in list(self._connections):
+            self._close(server)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def generate_digest(llm, frequency: str, topic: str, language: str, stage_models: dict | None = None) -> dict:
+    """Runs the news graph once without a recipient and returns its final state."""
+    graph = GraphBuilder(llm, stage_models=stage_models).setup_graph("News")
+    return graph.invoke({"messages": [("user", f"{frequency}:{topic}:{language}:")], "trace_id": current_trace_id()})
+
+def run_delivery_cycle(llm, frequency: str, stage_models: dict | None = None, mailer: FanoutMailer | None = None) -> dict:
+    """
+    Generates each distinct (topic, language) digest of `frequency` once and mails it to all
+    of its confirmed subscribers, each with their own unsubscribe link. Mail for one digest
+    goes out while the next one is generated.
+    """
+    started = time.perf_counter()
+    groups = get_subscription_store().digests(frequency)
+    report = {"frequency": frequency, "digests": len(groups), "recipients": sum(len(recipients) for recipients in groups.values()),
+              "sent": 0, "failed_digests": [], "failed_recipients": []}
+    owns_mailer = mailer is None
+    mailer = mailer or FanoutMailer()
+    pending = []
+    try:
+        for (topic, language), recipients in groups.items():
+            try:
+                artifact = generate_digest(llm, frequency, topic, language, stage_models).get('artifact')
+                if artifact is None or not artifact.pdf:
+                    raise RuntimeError("no PDF was generated")
+            except Exception as e:
+                report["failed_digests"].append({"topic": topic, "language": language, "recipients": len(recipients), "error": str(e)})
+                continue
+            subject, body = digest_email_text(frequency, topic)
+            bodies = {email: body + unsubscribe_footer(token) for email, token in recipients.items()}
+            pending.extend(mailer.send(bodies, subject, artifact.pdf_name, artifact.pdf).items())
+
+        for email, future in pending:
+            error = future.exception()
+            if error is None:
+                report["sent"] += 1
+            else:
+                report["failed_recipients"].append({"email": email, "error": str(error)})
+    finally:
+        if owns_mailer:
+            mailer.close()
+    report["seconds"] = round(time.perf_counter() - started, 3)
+    print(f"Delivered {report['sent']} of {report['recipients']} {frequency} digests ({report['digests']} distinct) in {report['seconds']}s")
+    return report
@@ -0,0 +1,130 @@
+# src/langgraphagenticai/subscriptions/store.py
+
+import os
+import secrets
+import threading
+import time
+from functools import lru_cache
+from src.langgraphagenticai.storage.sqlite import connect
+
+SUBSCRIPTIONS_DB_PATH = os.getenv("SUBSCRIPTIONS_DB_PATH", "./Memory/subscriptions.sqlite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscriptions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL,
+    frequency TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    language TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    confirm_token TEXT,
+    unsubscribe_token TEXT,
+    confirmed_at REAL,
+    UNIQUE (email, frequency, topic, language)
+);
+CREATE INDEX IF NOT EXISTS subscriptions_digest ON subscriptions(frequency, topic, language);
+"""
+
+_TOKEN_INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS subscriptions_confirm_token ON subscriptions(confirm_token);
+CREATE UNIQUE INDEX IF NOT EXISTS subscriptions_unsubscribe_token ON subscriptions(unsubscribe_token);
+"""
+
+def normalize_topic(topic: str) -> str:
+    """Topics differing only in case or spacing share one digest."""
+    return " ".join(topic.lower().split())
+
+def _new_token() -> str:
+    return secrets.token_urlsafe(32)
+
+class SubscriptionStore:
+    """
+    Subscribers keyed by the digest they receive: (frequency, topic, language).
+
+    Each subscription has two unguessable tokens: a confirmation token mailed to the address
+    when it subscribes (double opt-in; only confirmed subscriptions receive digests) and an
+    unsubscribe token included in every digest email.
+    """
+    def __init__(self, path: str = SUBSCRIPTIONS_DB_PATH):
+        self._conn = connect(path)
+        self._conn.row_factory = lambda cursor, row: {col[0]: value for col, value in zip(cursor.description, row)}
+        self._conn.executescript(_SCHEMA)
+        if "unsubscribe_token" not in {row['name'] for row in self._conn.execute("PRAGMA table_info(subscriptions)")}:
+            # Stores created before subscriptions had tokens: their subscribers stay subscribed
+            with self._conn:
+                for column in ("confirm_token TEXT", "unsubscribe_token TEXT", "confirmed_at REAL"):
+                    self._conn.execute(f"ALTER TABLE subscriptions ADD COLUMN {column}")
+                ids = [row['id'] for row in self._conn.execute("SELECT id FROM subscriptions")]
+                self._conn.executemany(
+                    "UPDATE subscriptions SET confirm_token = ?, unsubscribe_token = ?, confirmed_at = created_at WHERE id = ?",
+                    [(_new_token(), _new_token(), subscription_id) for subscription_id in ids],
+                )
+        self._conn.executescript(_TOKEN_INDEXES)
+        self._lock = threading.Lock()
+
+    def add(self, email: str, frequency: str, topic: str, language: str, confirmed: bool = False) -> dict:
+        """
+        Subscribes `email` to a digest, pending confirmation unless `confirmed`. Subscribing
+        twice returns the existing subscription with its original tokens.
+        """
+        key = (email.strip().lower(), frequency.lower(), normalize_topic(topic), language)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO subscriptions (email, frequency, topic, language, created_at, confirm_token, unsubscribe_token) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, now, _new_token(), _new_token()),
+            )
+            if confirmed:
+                self._conn.execute(
+                    "UPDATE subscriptions SET confirmed_at = ? WHERE email = ? AND frequency = ? AND topic = ? AND language = ? "
+                    "AND confirmed_at IS NULL", (now, *key)
+                )
+            return self._conn.execute(
+                "SELECT * FROM subscriptions WHERE email = ? AND frequency = ? AND topic = ? AND language = ?", key
+            ).fetchone()
+
+    def confirm(self, confirm_token: str) -> dict | None:
+        """Confirms the subscription the token was mailed for. Returns it, or None for an unknown token."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE subscriptions SET confirmed_at = ? WHERE confirm_token = ? AND confirmed_at IS NULL", (time.time(), confirm_token)
+            )
+            return self._conn.execute("SELECT * FROM subscriptions WHERE confirm_token = ?", (confirm_token,)).fetchone()
+
+    def remove(self, unsubscribe_token: str) -> dict | None:
+        """Deletes the subscription the token belongs to. Returns it, or None for an unknown token."""
+        with self._lock, self._conn:
+            subscription = self._conn.execute(
+                "SELECT * FROM subscriptions WHERE unsubscribe_token = ?", (unsubscribe_token,)
+            ).fetchone()
+            if subscription:
+                self._conn.execute("DELETE FROM subscriptions WHERE id = ?", (subscription['id'],))
+            return subscription
+
+    def list(self, frequency: str | None = None, email: str | None = None) -> list:
+        query, params = "SELECT * FROM subscriptions WHERE 1 = 1", []
+        if frequency:
+            query += " AND frequency = ?"
+            params.append(frequency.lower())
+        if email:
+            query += " AND email = ?"
+            params.append(email.strip().lower())
+        with self._lock:
+            return self._conn.execute(query + " ORDER BY id", params).fetchall()
+
+    def digests(self, frequency: str) -> dict:
+        """Returns {(topic, language): {email: unsubscribe token}} for every distinct confirmed digest of `frequency`."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT topic, language, email, unsubscribe_token FROM subscriptions "
+                "WHERE frequency = ? AND confirmed_at IS NOT NULL ORDER BY topic, language, id", (frequency.lower(),)
+            ).fetchall()
+        groups = {}
+        for row in rows:
+            groups.setdefault((row['topic'], row['language']), {})[row['email']] = row['unsubscribe_token']
+        return groups
+
+@lru_cache(maxsize=1)
+def get_subscription_store() -> SubscriptionStore:
+    return SubscriptionStore()
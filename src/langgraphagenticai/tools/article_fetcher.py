@@ -0,0 +1,165 @@
+# src/langgraphagenticai/tools/article_fetcher.py
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+import httpx
+from src.langgraphagenticai.monitoring.metrics import track_dependency, record_cache_lookup
+
+ENRICH_TIMEOUT_SECONDS = float(os.getenv("NEWS_ENRICH_TIMEOUT_SECONDS", "5"))
+ENRICH_PER_HOST_LIMIT = int(os.getenv("NEWS_ENRICH_PER_HOST_LIMIT", "2"))
+ENRICH_MAX_CONNECTIONS = int(os.getenv("NEWS_ENRICH_MAX_CONNECTIONS", "20"))
+ENRICH_CACHE_ENTRIES = int(os.getenv("NEWS_ENRICH_CACHE_ENTRIES", "512"))
+ENRICH_MAX_CHARS = int(os.getenv("NEWS_ENRICH_MAX_CHARS", "20000"))
+USER_AGENT = "NewsWeaver/1.0 (+article enrichment)"
+
+class _MainTextParser(HTMLParser):
+    """Collects paragraph text, preferring paragraphs inside <article> or <main>."""
+    SKIP = {"script", "style", "nav", "header", "footer", "aside", "form", "noscript", "figure"}
+    BLOCKS = {"p", "h2", "h3", "li", "blockquote"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.skip_depth = 0
+        self.main_depth = 0
+        self.block = None
+        self.main_blocks, self.other_blocks = [], []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP:
+            self.skip_depth += 1
+        elif tag in ("article", "main"):
+            self.main_depth += 1
+        elif tag in self.BLOCKS and not self.skip_depth:
+            self.block = []
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP:
+            self.skip_depth = max(self.skip_depth - 1, 0)
+        elif tag in ("article", "main"):
+            self.main_depth = max(self.main_depth - 1, 0)
+        elif tag in self.BLOCKS and self.block is not None:
+            text = " ".join("".join(self.block).split())
+            if len(text) >= 40:
+                (self.main_blocks if self.main_depth else self.other_blocks).append(text)
+            self.block = None
+
+    def handle_data(self, data):
+        if self.block is not None and not self.skip_depth:
+            self.block.append(data)
+
+def extract_main_text(html: str) -> str:
+    """Returns the article body of an HTML page as plain text, one paragraph per line."""
+    parser = _MainTextParser()
+    parser.feed(html)
+    parser.close()
+    return "\n".join(parser.main_blocks or parser.other_blocks)
+
+@dataclass
+class _CachedPage:
+    etag: str | None
+    last_modified: str | None
+    text: str
+
+class ArticleFetcher:
+    """
+    Fetches full article pages concurrently and extracts their main text.
+
+    One pooled httpx.AsyncClient runs on a private event loop thread, so graph nodes can
+    call `enrich` synchronously (even from inside an async route). Requests are limited
+    per host, every page shares one deadline, and pages are revalidated with
+    If-None-Match / If-Modified-Since against an in-memory LRU cache.
+    """
+    def __init__(self, timeout: float = ENRICH_TIMEOUT_SECONDS, per_host_limit: int = ENRICH_PER_HOST_LIMIT,
+                 max_connections: int = ENRICH_MAX_CONNECTIONS, cache_entries: int = ENRICH_CACHE_ENTRIES):
+        self.timeout = timeout
+        self.per_host_limit = per_host_limit
+        self.max_connections = max_connections
+        self.cache_entries = cache_entries
+        self._cache = OrderedDict()
+        self._host_limits = {}
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="article-fetcher", daemon=True).start()
+        self._client = asyncio.run_coroutine_threadsafe(self._create_client(), self._loop).result()
+
+    async def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+        )
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        # Only touched from the fetcher's loop thread
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_limits[host]
+
+    async def _fetch(self, url: str) -> str | None:
+        cached = self._cache.get(url)
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        async with self._host_limit(url):
+            with track_dependency("article_fetch"):
+                response = await self._client.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            record_cache_lookup("article", True)
+            self._cache.move_to_end(url)
+            return cached.text
+        record_cache_lookup("article", False)
+        if response.status_code != 200 or "html" not in response.headers.get("content-type", "html"):
+            return None
+        text = extract_main_text(response.text)[:ENRICH_MAX_CHARS]
+        if response.headers.get("etag") or response.headers.get("last-modified"):
+            self._cache[url] = _CachedPage(response.headers.get("etag"), response.headers.get("last-modified"), text)
+            self._cache.move_to_end(url)
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        return text
+
+    async def _fetch_all(self, urls: list) -> dict:
+        tasks = {asyncio.ensure_future(self._fetch(url)): url for url in urls}
+        if not tasks:
+            return {}
+        # One deadline for the whole batch: enrichment costs at most one slow fetch
+        done, pending = await asyncio.wait(tasks, timeout=self.timeout)
+        for task in pending:
+            task.cancel()
+        return {tasks[task]: task.result() for task in done if task.exception() is None and task.result()}
+
+    def enrich(self, news_items: list) -> tuple:
+        """
+        Returns (items with `content` replaced by the full article text where it is longer
+        than the snippet, report with counts and timing).
+        """
+        urls = list(dict.fromkeys(item['url'] for item in news_items if item.get('url')))
+        started = time.perf_counter()
+        texts = asyncio.run_coroutine_threadsafe(self._fetch_all(urls), self._loop).result()
+        enriched = []
+        for item in news_items:
+            text = texts.get(item.get('url'))
+            if text and len(text) > len(item.get('content') or ''):
+                item = {**item, 'content': text, 'snippet': item.get('content', '')}
+            enriched.append(item)
+        return enriched, {
+            "requested": len(urls),
+            "fetched": len(texts),
+            "enriched": sum(1 for item in enriched if 'snippet' in item),
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+@lru_cache(maxsize=1)
+def get_article_fetcher() -> ArticleFetcher:
+    return ArticleFetcher()
@@ -0,0 +1,152 @@
+# src/langgraphagenticai/tools/batch_translation.py
+
+import os
+import re
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
+from src.langgraphagenticai.LLMS.resilience import LLMError, call_llm
+from src.langgraphagenticai.cache.translation_cache import get_translation_cache
+from src.langgraphagenticai.tools.translation_tool import translation_prompt
+from src.langgraphagenticai.utils.output_validation import validate_translation
+from src.langgraphagenticai.utils.token_budget import count_tokens
+
+# Source tokens packed into one call; translations into non-Latin scripts can use several
+# times as many output tokens, so this stays well below the models' output limit
+BATCH_MAX_TOKENS = int(os.getenv("TRANSLATION_BATCH_MAX_TOKENS", "1000"))
+BATCH_MAX_ITEMS = int(os.getenv("TRANSLATION_BATCH_MAX_ITEMS", "40"))
+BATCH_CONCURRENCY = int(os.getenv("TRANSLATION_BATCH_CONCURRENCY", "4"))
+
+ITEM_MARKER = re.compile(r"^[ \t]*<<<(\d+)>>>[ \t]*$", re.MULTILINE)
+
+PACKED_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a professional translator. Translate every numbered item below to {target_language}.
+
+    **Instructions:**
+    1. **Format**: Answer with every item in the given order. Start each one with its marker line exactly as given (e.g. `<<<1>>>`), followed by the translation only
+    2. **Completeness**: Do not merge, split, skip or add items, and do not translate the markers
+    3. **Formatting**: Keep markdown formatting, URLs and source names unchanged
+    4. **Tone**: If translating news, maintain journalistic tone
+    """),
+    ("user", "{items}")
+])
+
+def pack_items(texts: list, max_tokens: int = BATCH_MAX_TOKENS, max_items: int = BATCH_MAX_ITEMS) -> list:
+    """
+    Groups texts (as (index, text) pairs) into batches of at most `max_tokens` source tokens
+    and `max_items` items, keeping their order. A text larger than the budget gets its own batch.
+    """
+    batches, current, used = [], [], 0
+    for index, text in texts:
+        tokens = count_tokens(text)
+        if current and (used + tokens > max_tokens or len(current) >= max_items):
+            batches.append(current)
+            current, used = [], 0
+        current.append((index, text))
+        used += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+def parse_packed(output: str, count: int) -> dict:
+    """Returns {position: translation} for the items of a packed answer; duplicated or empty items are left out."""
+    parts = ITEM_MARKER.split(output or "")
+    found, duplicated = {}, set()
+    for marker, text in zip(parts[1::2], parts[2::2]):
+        position = int(marker) - 1
+        if not 0 <= position < count:
+            continue
+        if position in found:
+            duplicated.add(position)
+        found[position] = text.strip()
+    return {position: text for position, text in found.items() if text and position not in duplicated}
+
+class BatchTranslator:
+    """
+    Translates many short texts with few LLM calls. Texts are answered from the translation
+    cache where possible; the rest are deduplicated, packed into delimited multi-item prompts
+    and the packed calls run concurrently. Items missing from a packed answer, or that lost
+    links or headings, are translated again one by one.
+    """
+    def __init__(self, llm, max_tokens: int = BATCH_MAX_TOKENS, max_items: int = BATCH_MAX_ITEMS, concurrency: int = BATCH_CONCURRENCY):
+        self.llm = llm
+        self.model = getattr(llm, "model_name", None)
+        self.max_tokens = max_tokens
+        self.max_items = max_items
+        self.concurrency = concurrency
+
+    def _translate_packed(self, batch: list, target_language: str) -> dict:
+        """Returns {index: translation} for the items of one batch that came back intact."""
+        if len(batch) == 1:
+            # Nothing to pack: the plain prompt keeps long texts' structure best
+            return {}
+        items = "\n".join(f"<<<{position + 1}>>>\n{text}" for position, (_, text) in enumerate(batch))
+        # As separate messages, so the first marker stays on a line of its own
+        prompt = PACKED_PROMPT.format_messages(target_language=target_language, items=items)
+        try:
+            output = call_llm("translation", self.model, lambda: self.llm.invoke(prompt)).content
+        except LLMError as e:
+            print(f"Packed translation of {len(batch)} items failed, translating them one by one: {e}")
+            return {}
+        parsed = parse_packed(output, len(batch))
+        return {
+            index: parsed[position]
+            for position, (index, text) in enumerate(batch)
+            if position in parsed and not validate_translation(text, parsed[position])
+        }
+
+    def _translate_one(self, text: str, target_language: str) -> str:
+        return call_llm("translation", self.model, lambda: self.llm.invoke(translation_prompt(text, target_language))).content
+
+    def translate(self, texts: list, target_language: str) -> tuple:
+        """
+        Returns (results in input order, report). Each result is a dict with `translated_text`,
+        `cached` and `error` (set when the item could not be translated).
+        """
+        results = [{"translated_text": None, "cached": False, "error": None} for _ in texts]
+        unique = {}
+        for index, text in enumerate(texts):
+            if not text.strip():
+                results[index]["translated_text"] = text
+            else:
+                unique.setdefault(text, []).append(index)
+        sources = list(unique)
+
+        cache = get_translation_cache()
+        cached = cache.get_many(self.model, target_language, sources) if cache else {}
+        missing = [(i, text) for i, text in enumerate(sources) if i not in cached]
+        batches = pack_items(missing, self.max_tokens, self.max_items)
+
+        translated = dict(cached)
+        packed = RunnableLambda(lambda batch: self._translate_packed(batch, target_language))
+        for found in packed.batch(batches, config={"max_concurrency": self.concurrency}):
+            translated.update(found)
+
+        retried = [(i, text) for i, text in missing if i not in translated]
+        errors = {}
+        if retried:
+            def translate_single(item):
+                try:
+                    return item[0], self._translate_one(item[1], target_language), None
+                except LLMError as e:
+                    return item[0], None, str(e)
+            single = RunnableLambda(translate_single)
+            for i, translation, error in single.batch(retried, config={"max_concurrency": self.concurrency}):
+                if error is None:
+                    translated[i] = translation
+                else:
+                    errors[i] = error
+
+        if cache:
+            cache.store_many(self.model, target_language, [(sources[i], translated[i]) for i, _ in missing if i in translated])
+        for i, text in enumerate(sources):
+            for index in unique[text]:
+                results[index].update(translated_text=translated.get(i), cached=i in cached, error=errors.get(i))
+
+        return results, {
+            "items": len(texts),
+            "unique": len(sources),
+            "cached": len(cached),
+            "packed_calls": sum(1 for batch in batches if len(batch) > 1),
+            "single_calls": len(retried),
+            "failed": len(errors),
+        }
@@ -6,33 +6,87 @@ from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
 import os
+from src.langgraphagenticai.monitoring.metrics import track_dependency
 
-def send_email_with_attachment(recipient_email: str, subject: str, body: str, file_path: str):
-    """Sends an email with a PDF attachment."""
+# Where recipients reach the API, for the confirm and unsubscribe links in subscription emails
+PUBLIC_BASE_URL = os.getenv("PUBLIC_BASE_URL", "http://localhost:8000").rstrip("/")
+
+def _smtp_connection():
+    """Opens the SMTP connection; defaults to Gmail over SSL, overridable via SMTP_HOST/SMTP_PORT/SMTP_USE_SSL."""
+    host = os.getenv("SMTP_HOST", "smtp.gmail.com")
+    use_ssl = os.getenv("SMTP_USE_SSL", "true").lower() not in ("0", "false", "no")
+    port = int(os.getenv("SMTP_PORT", "465" if use_ssl else "25"))
+    return smtplib.SMTP_SSL(host, port) if use_ssl else smtplib.SMTP(host, port)
+
+def smtp_login() -> smtplib.SMTP:
+    """Opens an SMTP connection and logs in with the sender credentials from .env."""
     sender_email = os.getenv("GMAIL_SENDER_EMAIL")
     sender_password = os.getenv("GMAIL_SENDER_PASSWORD")
-
     if not all([sender_email, sender_password]):
         raise ValueError("Email credentials (GMAIL_SENDER_EMAIL, GMAIL_SENDER_PASSWORD) not found in .env")
+    server = _smtp_connection()
+    try:
+        server.login(sender_email, sender_password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+def digest_email_text(frequency: str, topic: str) -> tuple[str, str]:
+    """Returns (subject, body) of the email that carries a news digest."""
+    subject = f"{frequency.capitalize()} {topic.title()} News Summary"
+    body = f"Please find attached the {frequency} news summary for '{topic}'."
+    return subject, body
+
+def subscription_link(action: str, token: str) -> str:
+    """Link to GET /subscriptions/{action} (confirm or unsubscribe) with a subscription token."""
+    return f"{PUBLIC_BASE_URL}/subscriptions/{action}?token={token}"
 
+def unsubscribe_footer(unsubscribe_token: str) -> str:
+    return f"\n\nTo stop receiving this digest, open {subscription_link('unsubscribe', unsubscribe_token)}"
+
+def confirmation_email_text(frequency: str, topic: str, confirm_token: str) -> tuple[str, str]:
+    """Returns (subject, body) of the email that asks a new subscriber to confirm."""
+    subject = f"Confirm your {frequency} {topic.title()} News subscription"
+    body = (f"Someone, hopefully you, subscribed this address to the {frequency} news summary for '{topic}'.\n\n"
+            f"To start receiving it, open {subscription_link('confirm', confirm_token)}\n\n"
+            "If you did not subscribe, ignore this email and nothing will be sent.")
+    return subject, body
+
+def build_attachment(filename: str, data: bytes) -> MIMEBase:
+    """Encodes an attachment once so it can be reused across many messages."""
+    part = MIMEBase('application', 'octet-stream')
+    part.set_payload(data)
+    encoders.encode_base64(part)
+    part.add_header('Content-Disposition', f"attachment; filename= {filename}")
+    return part
+
+def build_message(recipient_email: str, subject: str, body: str, attachment: MIMEBase | None = None) -> MIMEMultipart:
     msg = MIMEMultipart()
-    msg['From'] = sender_email
+    msg['From'] = os.getenv("GMAIL_SENDER_EMAIL")
     msg['To'] = recipient_email
     msg['Subject'] = subject
     msg.attach(MIMEText(body, 'plain'))
+    if attachment is not None:
+        msg.attach(attachment)
+    return msg
 
-    with open(file_path, "rb") as attachment:
-        part = MIMEBase('application', 'octet-stream')
-        part.set_payload(attachment.read())
-    encoders.encode_base64(part)
-    part.add_header('Content-Disposition', f"attachment; filename= {os.path.basename(file_path)}")
-    msg.attach(part)
+def send_email(recipient_email: str, subject: str, body: str):
+    """Sends a plain email without attachments."""
+    with track_dependency("smtp"), smtp_login() as server:
+        server.send_message(build_message(recipient_email, subject, body))
+
+def send_email_with_attachment(recipient_email: str, subject: str, body: str, file_path: str, data: bytes | None = None):
+    """Sends an email with a PDF attachment. `data` is the attachment content; it is read from `file_path` when omitted."""
+    if data is None:
+        with open(file_path, "rb") as attachment:
+            data = attachment.read()
+    msg = build_message(recipient_email, subject, body, build_attachment(os.path.basename(file_path), data))
 
     try:
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-            server.login(sender_email, sender_password)
+        with track_dependency("smtp"), smtp_login() as server:
             server.send_message(msg)
         print(f"Email sent successfully to {recipient_email}")
     except Exception as e:
         print(f"Failed to send email: {e}")
-        raise
\ No newline at end of file
+        raise
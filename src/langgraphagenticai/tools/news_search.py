@@ -0,0 +1,77 @@
+# src/langgraphagenticai/tools/news_search.py
+
+import os
+import time
+from langchain_core.runnables import RunnableLambda
+from src.langgraphagenticai.monitoring.metrics import track_dependency
+
+# The first query is the original single query; the others add regional and sub-topic angles
+QUERY_TEMPLATES = [
+    "Top latest {topic} news India and globally",
+    "{topic} news India",
+    "{topic} news world",
+    "{topic} business and policy news",
+    "{topic} research and technology news",
+    "{topic} analysis and opinion",
+]
+
+NEWS_FETCH_QUERIES = int(os.getenv("NEWS_FETCH_QUERIES", "4"))
+NEWS_FETCH_RESULTS_PER_QUERY = int(os.getenv("NEWS_FETCH_RESULTS_PER_QUERY", "20"))
+NEWS_FETCH_TOP_K = int(os.getenv("NEWS_FETCH_TOP_K", "20"))
+NEWS_RANK_RECENCY_WEIGHT = float(os.getenv("NEWS_RANK_RECENCY_WEIGHT", "0.3"))
+
+def expand_queries(topic: str, count: int = NEWS_FETCH_QUERIES) -> list:
+    return [template.format(topic=topic) for template in QUERY_TEMPLATES[:max(count, 1)]]
+
+class NewsSearcher:
+    """
+    Fetches news for a topic with several Tavily queries at once, so the fetch takes about as
+    long as one query. The results are merged into one ArticleBatch, deduplicated and ranked
+    locally by BM25 relevance to the topic and by recency, and the best `top_k` are kept.
+    The whole ranked batch is appended to the Parquet article archive for analytics.
+    """
+    def __init__(self, client, queries: int = NEWS_FETCH_QUERIES, results_per_query: int = NEWS_FETCH_RESULTS_PER_QUERY,
+                 top_k: int = NEWS_FETCH_TOP_K, recency_weight: float = NEWS_RANK_RECENCY_WEIGHT):
+        self.client = client
+        self.queries = queries
+        self.results_per_query = results_per_query
+        self.top_k = top_k
+        self.recency_weight = recency_weight
+
+    def _search(self, query: str, days: int) -> list:
+        with track_dependency("tavily"):
+            return self.client.search(query=query, topic="news", max_results=self.results_per_query, days=days).get('results', [])
+
+    def search(self, topic: str, days: int) -> tuple:
+        """Returns (ranked articles, report). Fails only if every query fails."""
+        # Imported here: pyarrow and NumPy are only needed once a news run starts
+        from src.langgraphagenticai.storage.article_archive import get_article_archive
+        from src.langgraphagenticai.utils.article_batch import ArticleBatch
+
+        start = time.perf_counter()
+        queries = expand_queries(topic, self.queries)
+        search = RunnableLambda(lambda query: self._search(query, days))
+        results = search.batch(queries, config={"max_concurrency": len(queries)}, return_exceptions=True)
+        failed = [(query, result) for query, result in zip(queries, results) if isinstance(result, Exception)]
+        if len(failed) == len(queries):
+            raise failed[0][1]
+        for query, error in failed:
+            print(f"News query '{query}' failed, continuing without it: {error}")
+
+        fetched = ArticleBatch.from_results([result for result in results if not isinstance(result, Exception)])
+        ranked = fetched.deduplicate().rank(topic, days, self.recency_weight)
+        archive = get_article_archive()
+        if archive:
+            try:
+                archive.append(ranked, topic)
+            except OSError as e:
+                print(f"Could not archive fetched articles: {e}")
+        kept = ranked.head(self.top_k)
+        return kept.to_items(), {
+            "queries": len(queries),
+            "failed_queries": len(failed),
+            "fetched": len(fetched),
+            "unique": len(ranked),
+            "kept": len(kept),
+            "seconds": round(time.perf_counter() - start, 3),
+        }
@@ -1,18 +1,27 @@
 # src/langgraphagenticai/tools/pdf_tool.py
 
 from markdown_pdf import MarkdownPdf, Section # ADDED: Import the Section class
+import io
 import os
+from src.langgraphagenticai.storage.files import atomic_write_bytes
+from src.langgraphagenticai.monitoring.metrics import track_dependency
+
+def render_md_to_pdf(markdown: str, title: str) -> bytes:
+    """Renders markdown text to PDF bytes in memory."""
+    with track_dependency("pdf"):
+        pdf = MarkdownPdf(toc_level=0)
+        pdf.meta['title'] = title
+        # CHANGED: Wrap the markdown content in a Section object
+        pdf.add_section(Section(markdown))
+        buffer = io.BytesIO()
+        pdf.save(buffer)
+    return buffer.getvalue()
 
 def convert_md_to_pdf(md_file_path: str) -> str:
     """Converts a markdown file to a PDF and returns the new PDF file path."""
     pdf_file_path = md_file_path.replace(".md", ".pdf")
-    
-    pdf = MarkdownPdf(toc_level=0)
-    
-    pdf.meta['title'] = os.path.basename(md_file_path)
     with open(md_file_path, 'r', encoding='utf-8') as f:
-        # CHANGED: Wrap the markdown content in a Section object
-        pdf.add_section(Section(f.read())) 
-        
-    pdf.save(pdf_file_path)
-    return pdf_file_path
\ No newline at end of file
+        data = render_md_to_pdf(f.read(), os.path.basename(md_file_path))
+    # Another worker may be serving this file; replace it atomically
+    atomic_write_bytes(pdf_file_path, data)
+    return pdf_file_path
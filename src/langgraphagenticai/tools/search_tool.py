@@ -2,12 +2,13 @@
 
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langgraph.prebuilt import ToolNode
+from src.langgraphagenticai.monitoring.metrics import DependencyMetricsCallback
 
 def get_tools():
     """
     Return the list of tools to be used in the chatbot
     """
-    tools=[TavilySearchResults(max_results=2)]
+    tools=[TavilySearchResults(max_results=2, callbacks=[DependencyMetricsCallback("tavily")])]
     return tools
 
 def create_tool_node(tools):
@@ -4,12 +4,35 @@ from langchain_core.tools import BaseTool
 from langchain_core.prompts import ChatPromptTemplate
 from typing import Type, Any
 from pydantic import BaseModel, Field
+from src.langgraphagenticai.LLMS.resilience import call_llm
 
 class TranslationInput(BaseModel):
     """Input for translation tool"""
     text: str = Field(description="Text to translate")
     target_language: str = Field(description="Target language for translation")
 
+def translation_prompt(text: str, target_language: str) -> str:
+    """Builds the translation prompt for `text`."""
+    prompt_template = ChatPromptTemplate.from_messages([
+        ("system", f"""You are a professional translator. Translate the following text to {target_language}.
+        
+        **Instructions:**
+        1. Maintain the original formatting (markdown, headers, links, etc.)
+        2. Preserve all URLs and links as they are
+        3. Keep the structure intact (dates, bullet points, etc.)
+        4. Translate only the content, not the markdown syntax
+        5. If translating news, maintain journalistic tone
+        6. For technical terms, provide the translation with original term in parentheses if needed
+        
+        **Important:**
+        - Keep all markdown formatting symbols (###, **, [], (), etc.)
+        - Don't translate URLs or source names unless specifically requested
+        - Maintain the same paragraph structure
+        """),
+        ("user", "Text to translate:\n{text}")
+    ])
+    return prompt_template.format(text=text)
+
 class TranslationTool(BaseTool):
     """Tool for translating text to different languages"""
     
@@ -20,32 +43,12 @@ class TranslationTool(BaseTool):
     
     def _run(self, text: str, target_language: str) -> str:
         """
-        Translate text to target language using LLM
+        Translate text to target language using LLM.
+        Raises an LLMError (timeout, open circuit or provider error) if the translation fails.
         """
-        prompt_template = ChatPromptTemplate.from_messages([
-            ("system", f"""You are a professional translator. Translate the following text to {target_language}.
-            
-            **Instructions:**
-            1. Maintain the original formatting (markdown, headers, links, etc.)
-            2. Preserve all URLs and links as they are
-            3. Keep the structure intact (dates, bullet points, etc.)
-            4. Translate only the content, not the markdown syntax
-            5. If translating news, maintain journalistic tone
-            6. For technical terms, provide the translation with original term in parentheses if needed
-            
-            **Important:**
-            - Keep all markdown formatting symbols (###, **, [], (), etc.)
-            - Don't translate URLs or source names unless specifically requested
-            - Maintain the same paragraph structure
-            """),
-            ("user", "Text to translate:\n{text}")
-        ])
-        
-        try:
-            response = self.llm.invoke(prompt_template.format(text=text))
-            return response.content
-        except Exception as e:
-            return f"Translation error: {str(e)}"
+        prompt = translation_prompt(text, target_language)
+        response = call_llm("translation", getattr(self.llm, "model_name", None), lambda: self.llm.invoke(prompt))
+        return response.content
 
 def create_translation_tool(llm):
     """Create and return translation tool"""
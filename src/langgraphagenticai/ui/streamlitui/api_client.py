@@ -0,0 +1,96 @@
+# src/langgraphagenticai/ui/streamlitui/api_client.py
+
+import os
+import httpx
+import streamlit as st
+
+# Set to the FastAPI base URL (e.g. http://localhost:8000) to run the UI as a thin client
+BACKEND_URL_ENV = "NEWS_WEAVER_BACKEND_URL"
+NEWS_RESULT_TTL_SECONDS = int(os.getenv("UI_NEWS_CACHE_TTL_SECONDS", "900"))
+
+def get_backend_url() -> str | None:
+    return os.getenv(BACKEND_URL_ENV) or None
+
+class NewsWeaverAPIClient:
+    """
+    Thin client for the News Weaver FastAPI backend.
+    One instance is shared across reruns and sessions, so its connection pool is reused.
+    """
+    def __init__(self, base_url: str):
+        self.http = httpx.Client(
+            base_url=base_url,
+            # News runs can take minutes; connecting should not
+            timeout=httpx.Timeout(600.0, connect=5.0),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+
+    def _post(self, path: str, payload: dict) -> dict:
+        response = self.http.post(path, json=payload)
+        if response.status_code >= 400:
+            try:
+                detail = response.json().get("detail", response.text)
+            except ValueError:
+                detail = response.text
+            raise RuntimeError(f"Backend error {response.status_code}: {detail}")
+        return response.json()
+
+    def languages(self) -> dict:
+        response = self.http.get("/languages")
+        response.raise_for_status()
+        return response.json()["supported_languages"]
+
+    def stream_basic_chat(self, message: str, thread_id: str | None = None):
+        """Yields text chunks of the chatbot's answer as the backend streams them."""
+        with self.http.stream("POST", "/chat/basic/stream", json={"message": message, "thread_id": thread_id}) as response:
+            if response.status_code >= 400:
+                response.read()
+                raise RuntimeError(f"Backend error {response.status_code}: {response.text}")
+            for chunk in response.iter_text():
+                if chunk:
+                    yield chunk
+
+    def web_chat(self, message: str, model: str, thread_id: str | None = None) -> dict:
+        return self._post("/chat/web", {"message": message, "model": model, "thread_id": thread_id})
+
+    def fetch_news(self, frequency: str, topic: str, language: str, recipient_email: str | None, model: str) -> dict:
+        return self._post("/news/structured", {
+            "frequency": frequency,
+            "topic": topic,
+            "language": language,
+            "recipient_email": recipient_email or None,
+            "model": model,
+        })
+
+    def download(self, filename: str) -> bytes | None:
+        response = self.http.get(f"/news/download/{filename}")
+        return response.content if response.status_code == 200 else None
+
+@st.cache_resource
+def get_api_client(base_url: str) -> NewsWeaverAPIClient:
+    return NewsWeaverAPIClient(base_url)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_supported_languages(base_url: str) -> dict:
+    return get_api_client(base_url).languages()
+
+def _run_news(base_url: str, frequency: str, topic: str, language: str, recipient_email: str, model: str) -> dict:
+    client = get_api_client(base_url)
+    result = client.fetch_news(frequency, topic, language, recipient_email, model)
+    pdf_name = (result.get("filename") or "").replace(".md", ".pdf")
+    result["pdf_bytes"] = client.download(pdf_name) if pdf_name else None
+    return result
+
+@st.cache_data(ttl=NEWS_RESULT_TTL_SECONDS, show_spinner=False)
+def _cached_news(base_url: str, frequency: str, topic: str, language: str, model: str) -> dict:
+    return _run_news(base_url, frequency, topic, language, "", model)
+
+def fetch_news_result(base_url: str, frequency: str, topic: str, language: str, recipient_email: str, model: str) -> dict:
+    """
+    Runs the news pipeline on the backend and returns the summary with its PDF bytes.
+    Summaries without an email are cached, so reruns triggered by widget interaction do not
+    start the pipeline again; a request with `recipient_email` always reaches the backend,
+    since a cached response would silently skip sending the email.
+    """
+    if recipient_email:
+        return _run_news(base_url, frequency, topic, language, recipient_email, model)
+    return _cached_news(base_url, frequency, topic, language, model)
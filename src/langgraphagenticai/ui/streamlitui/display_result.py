@@ -62,7 +62,7 @@ class DisplayResultStreamlit:
                 for event in graph.stream({'messages': ("user", user_message)}):
                     print(event.values())
                     for value in event.values():
-                        if "messages" in value and value["messages"].content:
+                        if value and "messages" in value and value["messages"].content:
                             with st.chat_message("assistant"):
                                 st.write(value["messages"].content)
         except Exception as e:
@@ -125,29 +125,18 @@ class DisplayResultStreamlit:
 
             with st.spinner(status_text):
                 # Invoke the graph to perform all backend operations
-                graph.invoke({"messages": [("user", user_message)]})
+                final_state = graph.invoke({"messages": [("user", user_message)]})
                 
-                # --- Generate File Paths ---
-                topic_clean = topic.replace(' ', '_').replace('/', '_')
-                lang_suffix = ""
-                if target_language.lower() != 'english':
-                    lang_suffix = f"_{target_language.replace(' ', '_').replace('(', '').replace(')', '')}"
-                
-                # --- FIX: Convert frequency to lowercase to match the saved filename ---
-                base_filename = f"{frequency.lower()}_{topic_clean}{lang_suffix}_summary"
-                
-                md_path = f"./News/{base_filename}.md"
-                pdf_path = f"./News/{base_filename}.pdf"
+                # The summary and PDF come straight from the graph state, not from disk
+                artifact = final_state.get('artifact')
 
                 # --- Display Results ---
-                if not os.path.exists(md_path):
-                    st.error(f"❌ News file not found: {md_path}")
+                if artifact is None:
+                    st.error("❌ News summary was not generated.")
                     st.info("🔄 The news fetching process may have failed. Please try again.")
                     return
 
-                with open(md_path, "r", encoding='utf-8') as file:
-                    markdown_content = file.read()
-
+                markdown_content = artifact.markdown
                 st.success(f"✅ **{topic.title()}** news summary is ready!")
                 st.markdown(markdown_content, unsafe_allow_html=True)
 
@@ -158,20 +147,19 @@ class DisplayResultStreamlit:
                     st.download_button(
                         label="📥 Download Summary (.md)",
                         data=markdown_content,
-                        file_name=f"{base_filename}.md",
+                        file_name=artifact.md_name,
                         mime="text/markdown",
                         use_container_width=True
                     )
                 with col2:
-                    if os.path.exists(pdf_path):
-                        with open(pdf_path, "rb") as pdf_file:
-                            st.download_button(
-                                label="📄 Download Summary (.pdf)",
-                                data=pdf_file.read(),
-                                file_name=f"{base_filename}.pdf",
-                                mime="application/pdf",
-                                use_container_width=True
-                            )
+                    if artifact.pdf:
+                        st.download_button(
+                            label="📄 Download Summary (.pdf)",
+                            data=artifact.pdf,
+                            file_name=artifact.pdf_name,
+                            mime="application/pdf",
+                            use_container_width=True
+                        )
         
         except Exception as e:
             # The existing exception handling logic remains the same
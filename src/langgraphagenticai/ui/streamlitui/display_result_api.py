@@ -0,0 +1,106 @@
+# src/langgraphagenticai/ui/streamlitui/display_result_api.py
+
+import uuid
+import streamlit as st
+from src.langgraphagenticai.ui.streamlitui.display_result import DisplayResultStreamlit
+from src.langgraphagenticai.ui.streamlitui.api_client import get_api_client, fetch_news_result
+
+class DisplayResultAPI(DisplayResultStreamlit):
+    """
+    Renders results produced by the FastAPI backend instead of running the graph in
+    the Streamlit process. API keys are checked by the backend, not here.
+    """
+    def __init__(self, usecase, backend_url, user_message, model):
+        super().__init__(usecase, None, user_message)
+        self.backend_url = backend_url
+        self.model = model
+        self.client = get_api_client(backend_url)
+
+    def _validate_api_keys(self):
+        return True
+
+    def _thread_id(self):
+        # One conversation per browser session, so the backend can keep chat memory
+        return st.session_state.setdefault("thread_id", uuid.uuid4().hex)
+
+    def _handle_basic_chatbot(self, graph, user_message):
+        """Streams the basic chatbot answer from the backend as it is generated."""
+        try:
+            with st.chat_message("user"):
+                st.write(user_message)
+            with st.chat_message("assistant"):
+                st.write_stream(self.client.stream_basic_chat(user_message, self._thread_id()))
+        except Exception as e:
+            st.error(f"❌ Error in basic chatbot: {str(e)}")
+            self._show_troubleshooting_basic()
+
+    def _handle_chatbot_with_web(self, graph, user_message):
+        """Handle chatbot with web search through the backend"""
+        try:
+            with st.chat_message("user"):
+                st.write(user_message)
+
+            with st.spinner("🔍 Searching the web for information..."):
+                res = self.client.web_chat(user_message, self.model, self._thread_id())
+
+            for tool_output in res.get("tool_outputs") or []:
+                with st.chat_message("ai"):
+                    st.write("🔍 **Tool Call Start**")
+                    st.json(tool_output)
+                    st.write("🔍 **Tool Call End**")
+            with st.chat_message("assistant"):
+                st.write(res["response"])
+
+        except Exception as e:
+            st.error(f"❌ Error in web chatbot: {str(e)}")
+            self._show_troubleshooting_web()
+
+    def _handle_news(self, graph, user_message):
+        """Handle news fetching through the backend, display, and download options."""
+        try:
+            parts = user_message.split(':')
+            frequency, topic, target_language, recipient_email, *_ = parts + ["general news", "English", ""]
+            topic = topic or "general news"
+
+            status_text = f"Fetching and summarizing **{topic}** news"
+            if target_language.lower() != 'english':
+                status_text += f" in **{target_language}**... ⏳"
+            else:
+                status_text += "... ⏳"
+
+            with st.spinner(status_text):
+                result = fetch_news_result(self.backend_url, frequency.lower(), topic, target_language, recipient_email, self.model)
+
+            markdown_content = result.get("markdown")
+            if not markdown_content:
+                st.error(f"❌ {result.get('message', 'The backend returned no summary.')}")
+                return
+
+            st.success(f"✅ **{topic.title()}** news summary is ready!")
+            st.markdown(markdown_content, unsafe_allow_html=True)
+
+            # --- Download Buttons ---
+            base_filename = result["filename"].rsplit(".", 1)[0]
+            st.write("---")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.download_button(
+                    label="📥 Download Summary (.md)",
+                    data=markdown_content,
+                    file_name=f"{base_filename}.md",
+                    mime="text/markdown",
+                    use_container_width=True
+                )
+            with col2:
+                if result.get("pdf_bytes"):
+                    st.download_button(
+                        label="📄 Download Summary (.pdf)",
+                        data=result["pdf_bytes"],
+                        file_name=f"{base_filename}.pdf",
+                        mime="application/pdf",
+                        use_container_width=True
+                    )
+
+        except Exception as e:
+            st.error(f"❌ An error occurred while processing the news: {str(e)}")
+            self._show_troubleshooting_news()
@@ -9,9 +9,13 @@ from src.langgraphagenticai.tools.translation_tool import SUPPORTED_LANGUAGES
 load_dotenv()
 
 class LoadStreamlitUI:
-    def __init__(self):
+    def __init__(self, languages=None, remote=False):
         self.config = Config()
         self.user_controls = {}
+        # In remote mode the backend holds the API keys, so they are not required here
+        self.remote = remote
+        # Supported languages, e.g. as reported by the backend; defaults to the local list
+        self.languages = languages or SUPPORTED_LANGUAGES
 
     def load_streamlit_ui(self):
         st.set_page_config(page_title="🤖 " + self.config.get_page_title(), layout="wide")
@@ -36,10 +40,10 @@ class LoadStreamlitUI:
                 st.subheader("📰 News Explorer Settings")
                 time_frame = st.selectbox("📅 Select Time Frame", ["Daily", "Weekly", "Monthly", "Yearly"])
                 news_topic = st.text_input("📝 Enter News Topic", help="Leave empty for general news.")
-                target_language = st.selectbox("🗣️ Select Output Language", options=list(SUPPORTED_LANGUAGES.keys()))
+                target_language = st.selectbox("🗣️ Select Output Language", options=list(self.languages.keys()))
                 recipient_email = st.text_input("📧 Email PDF To", help="Enter an email to send the PDF summary.")
 
-                if st.button("🔍 Fetch & Send News", use_container_width=True, disabled=not self.user_controls["TAVILY_API_KEY"]):
+                if st.button("🔍 Fetch & Send News", use_container_width=True, disabled=not (self.remote or self.user_controls["TAVILY_API_KEY"])):
                     st.session_state.IsFetchButtonClicked = True
                     st.session_state.timeframe = time_frame
                     st.session_state.news_topic = news_topic or "general news"
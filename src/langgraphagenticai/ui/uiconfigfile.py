@@ -19,4 +19,20 @@ class Config:
     
     def get_page_title(self):
         return self.config["DEFAULT"].get("PAGE_TITLE")
+
+    def get_model_routing(self):
+        """Returns the [MODEL_ROUTING] settings, or an empty dict if the section is missing."""
+        if not self.config.has_section("MODEL_ROUTING"):
+            return {}
+        routing = self.config["MODEL_ROUTING"]
+        return {
+            "tiers": [m.strip() for m in routing.get("MODEL_TIERS", "").split(",") if m.strip()],
+            "stage_models": {
+                "chunk_summary": routing.get("CHUNK_SUMMARY_MODEL"),
+                "merge": routing.get("MERGE_MODEL"),
+                "translation": routing.get("TRANSLATION_MODEL"),
+            },
+            "chunk_size": routing.getint("CHUNK_SIZE", 5),
+            "min_link_coverage": routing.getfloat("MIN_LINK_COVERAGE", 0.5),
+        }
     
@@ -0,0 +1,132 @@
+# src/langgraphagenticai/utils/article_batch.py
+
+import re
+import time
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from src.langgraphagenticai.utils.extractive import STOPWORDS, WORD
+from src.langgraphagenticai.utils.urls import canonical_url
+
+# Fields of a search result carried through the pipeline; other keys are dropped
+ARTICLE_SCHEMA = pa.schema([
+    ("title", pa.string()),
+    ("url", pa.string()),
+    ("content", pa.string()),
+    ("score", pa.float64()),
+    ("published_date", pa.string()),
+])
+
+# Formats Tavily and other sources use for published_date, tried in order
+_DATE_FORMATS = [
+    ("%a, %d %b %Y %H:%M:%S GMT", None),
+    ("%Y-%m-%dT%H:%M:%S", 19),
+    ("%Y-%m-%d", 10),
+]
+
+def _first_occurrences(keys: pa.Array) -> np.ndarray:
+    """True for the first row of each distinct non-null, non-empty key."""
+    keep = np.ones(len(keys), dtype=bool)
+    valid = pc.fill_null(pc.greater(pc.utf8_length(keys), 0), False).to_numpy(zero_copy_only=False)
+    codes = keys.dictionary_encode().indices.to_numpy(zero_copy_only=False)
+    first = np.zeros(len(keys), dtype=bool)
+    _, first_rows = np.unique(codes[valid], return_index=True)
+    first[np.flatnonzero(valid)[first_rows]] = True
+    keep[valid] = first[valid]
+    return keep
+
+class ArticleBatch:
+    """
+    Search results as one Arrow table instead of a list of dicts. Deduplication, BM25 and
+    recency scoring run as Arrow compute kernels and NumPy operations over whole columns.
+    The pipeline state keeps plain dicts (`to_items`), which the checkpointer can store.
+    """
+    def __init__(self, table: pa.Table):
+        self.table = table
+
+    @classmethod
+    def from_items(cls, items: list, **columns) -> "ArticleBatch":
+        """Builds a batch from result dicts; `columns` adds extra columns of the same length."""
+        arrays = {field.name: pa.array([item.get(field.name) for item in items], type=field.type) for field in ARTICLE_SCHEMA}
+        return cls(pa.table({**arrays, **columns}))
+
+    @classmethod
+    def from_results(cls, result_lists: list) -> "ArticleBatch":
+        """Concatenates the results of several queries in order, recording each row's query index."""
+        items = [item for results in result_lists for item in results]
+        query = pa.array(np.repeat(np.arange(len(result_lists), dtype=np.int32), [len(results) for results in result_lists]))
+        return cls.from_items(items, query=query)
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def canonical_urls(self) -> pa.Array:
+        """The `canonical_url` of each row; null where the URL is missing."""
+        urls = self.table["url"].combine_chunks().to_pylist()
+        return pa.array([None if url is None else canonical_url(url) for url in urls], type=pa.string())
+
+    def headline_keys(self) -> pa.Array:
+        """Titles lower-cased with punctuation and spacing removed, so syndicated copies match."""
+        titles = pc.replace_substring_regex(pc.utf8_lower(self.table["title"].combine_chunks()), pattern=r"[^\p{L}\p{N}]+", replacement=" ")
+        return pc.utf8_trim_whitespace(titles)
+
+    def deduplicate(self) -> "ArticleBatch":
+        """Keeps the first row of each article, matched by canonical URL or by headline. Rows with neither are dropped."""
+        urls, headlines = self.canonical_urls(), self.headline_keys()
+        keep = _first_occurrences(urls) & _first_occurrences(headlines)
+        keep &= pc.fill_null(pc.or_(pc.greater(pc.utf8_length(urls), 0), pc.greater(pc.utf8_length(headlines), 0)), False).to_numpy(zero_copy_only=False)
+        return ArticleBatch(self.table.filter(pa.array(keep)))
+
+    def published_at(self) -> pa.Array:
+        """Publication times as timestamps; null where the date is missing or unparseable."""
+        dates = self.table["published_date"].combine_chunks()
+        parsed = [
+            pc.strptime(dates if length is None else pc.utf8_slice_codeunits(dates, 0, length), format=fmt, unit="s", error_is_null=True)
+            for fmt, length in _DATE_FORMATS
+        ]
+        return pc.coalesce(*parsed)
+
+    def bm25(self, query: str, k1: float = 1.5, b: float = 0.75) -> np.ndarray:
+        """Okapi BM25 of each article's title (counted twice) and content, with IDF from the batch itself."""
+        terms = sorted({token for token in WORD.findall(query.lower()) if token not in STOPWORDS})
+        if not terms or not len(self):
+            return np.zeros(len(self))
+        title = pc.fill_null(self.table["title"].combine_chunks(), "")
+        text = pc.utf8_lower(pc.binary_join_element_wise(title, title, pc.fill_null(self.table["content"].combine_chunks(), ""), " "))
+        lengths = pc.count_substring_regex(text, pattern=WORD.pattern).to_numpy(zero_copy_only=False).astype(np.float64)
+        norm = k1 * (1 - b + b * lengths / (lengths.mean() or 1.0))
+        scores = np.zeros(len(self))
+        for term in terms:
+            tf = pc.count_substring_regex(text, pattern=rf"\b{re.escape(term)}\b").to_numpy(zero_copy_only=False).astype(np.float64)
+            df = np.count_nonzero(tf)
+            idf = np.log(1 + (len(self) - df + 0.5) / (df + 0.5))
+            scores += idf * tf * (k1 + 1) / (tf + norm)
+        return scores
+
+    def rank(self, query: str, window_days: float, recency_weight: float = 0.3, now: float | None = None) -> "ArticleBatch":
+        """
+        Sorts best first by a blend of BM25 relevance to `query`, scaled to [0, 1], and recency:
+        an article loses half its recency score every half of the search window. Undated
+        articles score 0.5 on recency. Adds `relevance`, `recency`, `rank_score` and `published_at` columns.
+        """
+        now = now or time.time()
+        relevance = self.bm25(query)
+        relevance = relevance / (relevance.max() or 1.0) if len(relevance) else relevance
+        published_at = self.published_at()
+        published = pc.cast(published_at, pa.int64()).to_numpy(zero_copy_only=False).astype(np.float64)
+        half_life = max(window_days / 2, 0.5) * 86400
+        recency = np.where(np.isnan(published), 0.5, 0.5 ** (np.maximum(now - np.nan_to_num(published), 0) / half_life))
+        rank_score = (1 - recency_weight) * relevance + recency_weight * recency
+        table = (self.table.append_column("published_at", published_at)
+                 .append_column("relevance", pa.array(relevance))
+                 .append_column("recency", pa.array(recency))
+                 .append_column("rank_score", pa.array(rank_score)))
+        # Stable sort, so equally scored articles keep the order the queries returned them in
+        return ArticleBatch(table.take(pa.array(np.argsort(-rank_score, kind="stable"))))
+
+    def head(self, k: int) -> "ArticleBatch":
+        return ArticleBatch(self.table.slice(0, k))
+
+    def to_items(self) -> list:
+        """The articles as result dicts, the form the rest of the pipeline uses."""
+        return self.table.select(ARTICLE_SCHEMA.names).to_pylist()
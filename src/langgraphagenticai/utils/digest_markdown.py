@@ -0,0 +1,49 @@
+# src/langgraphagenticai/utils/digest_markdown.py
+
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+def parse_published(value) -> float | None:
+    """Parses a result's published_date (RFC 2822 as Tavily sends it, or ISO 8601) to a UNIX timestamp."""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+def source_name(url: str) -> str:
+    """Link text for an article's source: its host without "www."."""
+    return urlsplit(url or "").netloc.lower().removeprefix("www.") or "Source"
+
+def render_digest(entries: list) -> str:
+    """
+    Renders (article, headline, summary) entries as the news digest markdown: `### YYYY-MM-DD`
+    headings for the IST publication date, latest first, with one
+    `- **Headline**: summary ([Source](URL))` bullet per article. Undated articles come last.
+    """
+    dated, undated = [], []
+    for article, headline, summary in entries:
+        published = parse_published(article.get('published_date'))
+        (undated if published is None else dated).append((published, article, headline, summary))
+    dated.sort(key=lambda entry: entry[0], reverse=True)
+
+    sections, current = [], None
+    for published, article, headline, summary in dated + undated:
+        day = datetime.fromtimestamp(published, IST).strftime("%Y-%m-%d") if published is not None else "Undated"
+        if day != current:
+            sections.append(f"\n### {day}" if sections else f"### {day}")
+            current = day
+        url = article.get('url') or ''
+        source = f" ([{source_name(url)}]({url}))" if url else ""
+        sections.append(f"- **{headline}**: {summary}{source}")
+    return "\n".join(sections) + "\n"
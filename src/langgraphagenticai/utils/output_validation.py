@@ -0,0 +1,25 @@
+# src/langgraphagenticai/utils/output_validation.py
+
+import re
+
+MARKDOWN_LINK = re.compile(r"\[[^\]]*\]\((https?://[^)\s]+)\)")
+DATE_HEADING = re.compile(r"^\s*###\s+\S", re.MULTILINE)
+
+def _normalize_url(url: str) -> str:
+    return url.strip().rstrip("/").lower()
+
+def markdown_links(text: str) -> set:
+    """Returns the normalized URLs of all markdown links in `text`."""
+    return {_normalize_url(url) for url in MARKDOWN_LINK.findall(text or "")}
+
+def validate_translation(source: str, translated: str) -> list:
+    """Checks that a translation kept the markdown headings and every link of its source."""
+    if not (translated or "").strip():
+        return ["translation is empty"]
+    problems = []
+    lost = markdown_links(source) - markdown_links(translated)
+    if lost:
+        problems.append(f"lost {len(lost)} links")
+    if len(DATE_HEADING.findall(source)) != len(DATE_HEADING.findall(translated)):
+        problems.append("heading structure changed")
+    return problems
@@ -0,0 +1,184 @@
+# src/langgraphagenticai/utils/token_budget.py
+
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+
+# Context windows for the Groq models offered in the UI; unknown models fall back to
+# the "-<window>" suffix in their name, then to DEFAULT_CONTEXT_WINDOW.
+MODEL_CONTEXT_WINDOWS = {
+    "llama3-8b-8192": 8192,
+    "llama3-70b-8192": 8192,
+    "gemma2-9b-it": 8192,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Loads the tiktoken encoding, or None if tiktoken or its BPE file is unavailable."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+def count_tokens(text: str) -> int:
+    """Estimates the number of tokens in text (tiktoken if available, else ~4 characters per token)."""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cuts text to at most max_tokens, ending on a word boundary with an ellipsis when trimmed."""
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        trimmed = encoding.decode(tokens[:max_tokens])
+    else:
+        if len(text) <= max_tokens * 4:
+            return text
+        trimmed = text[:max_tokens * 4]
+    cut = trimmed.rfind(" ")
+    if cut > len(trimmed) // 2:
+        trimmed = trimmed[:cut]
+    return trimmed.rstrip() + "…"
+
+def get_context_window(model_name: str | None) -> int:
+    """Returns the context window in tokens for a model name."""
+    if not model_name:
+        return DEFAULT_CONTEXT_WINDOW
+    if model_name in MODEL_CONTEXT_WINDOWS:
+        return MODEL_CONTEXT_WINDOWS[model_name]
+    match = re.search(r"-(\d{4,6})$", model_name)
+    return int(match.group(1)) if match else DEFAULT_CONTEXT_WINDOW
+
+def _parse_date(value) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+class TokenBudgetPlanner:
+    """
+    Plans how many prompt tokens each news article may use.
+
+    The input budget is the model's context window minus the fixed prompt and the
+    tokens reserved for the answer. Articles are weighted by relevance (Tavily score)
+    and recency, and the budget is split proportionally to weight. Articles that need
+    less than their share give the remainder back to the others, and low-weight
+    articles that cannot get `min_article_tokens` are dropped.
+    """
+    def __init__(self, model_name: str | None, reserved_output_tokens: int = 2048,
+                 max_input_tokens: int | None = None, min_article_tokens: int = 48,
+                 recency_half_life_hours: float = 24.0):
+        self.model_name = model_name
+        self.context_window = get_context_window(model_name)
+        self.reserved_output_tokens = reserved_output_tokens
+        self.max_input_tokens = max_input_tokens
+        self.min_article_tokens = min_article_tokens
+        self.recency_half_life_hours = recency_half_life_hours
+
+    def input_budget(self, fixed_prompt_tokens: int) -> int:
+        budget = self.context_window - self.reserved_output_tokens - fixed_prompt_tokens
+        if self.max_input_tokens is not None:
+            budget = min(budget, self.max_input_tokens)
+        return max(budget, 0)
+
+    def weight(self, item: dict, now: datetime) -> float:
+        relevance = float(item.get("score") or 0.5)
+        published = _parse_date(item.get("published_date"))
+        if published is None:
+            recency = 0.5
+        else:
+            age_hours = max((now - published).total_seconds() / 3600, 0.0)
+            recency = 0.5 ** (age_hours / self.recency_half_life_hours)
+        # Recency only scales relevance down to half, so old but relevant articles keep a share
+        return max(relevance, 0.01) * (0.5 + 0.5 * recency)
+
+    def plan(self, news_items: list, fixed_prompt_tokens: int, format_article) -> tuple[list, dict]:
+        """
+        Trims articles to fit the budget.
+
+        `format_article(item, content)` renders one article as it appears in the prompt;
+        it is used to account for per-article framing (labels, URL).
+        Returns (trimmed_items, allocation_report).
+        """
+        now = datetime.now(timezone.utc)
+        budget = self.input_budget(fixed_prompt_tokens)
+        candidates = []
+        for index, item in enumerate(news_items):
+            content = item.get("content", "") or ""
+            candidates.append({
+                "index": index,
+                "weight": self.weight(item, now),
+                "overhead": count_tokens(format_article(item, "")),
+                "needed": count_tokens(content),
+            })
+        candidates.sort(key=lambda c: c["weight"], reverse=True)
+
+        # Keep the highest-weight articles that can each get at least the minimum share
+        kept, reserved = [], 0
+        for c in candidates:
+            cost = c["overhead"] + min(c["needed"], self.min_article_tokens)
+            if reserved + cost <= budget:
+                kept.append(c)
+                reserved += cost
+        content_budget = budget - sum(c["overhead"] for c in kept)
+
+        # Water-filling: split proportionally to weight, cap at need, hand back the surplus
+        for c in kept:
+            c["allocated"] = 0
+        open_set = [c for c in kept if c["needed"] > 0]
+        remaining = content_budget
+        while open_set and remaining > 0:
+            total_weight = sum(c["weight"] for c in open_set)
+            still_open, spent = [], 0
+            for c in open_set:
+                share = int(remaining * c["weight"] / total_weight)
+                grant = min(share, c["needed"] - c["allocated"])
+                c["allocated"] += grant
+                spent += grant
+                if c["allocated"] < c["needed"]:
+                    still_open.append(c)
+            if spent == 0:
+                break
+            remaining -= spent
+            open_set = still_open
+
+        trimmed_items, articles_report = [], []
+        for c in sorted(kept, key=lambda c: c["weight"], reverse=True):
+            item = news_items[c["index"]]
+            content = item.get("content", "") or ""
+            trimmed_items.append({**item, "content": truncate_to_tokens(content, c["allocated"])})
+            articles_report.append({
+                "url": item.get("url", ""),
+                "weight": round(c["weight"], 4),
+                "tokens_original": c["needed"],
+                "tokens_allocated": c["allocated"],
+            })
+
+        used = sum(c["overhead"] + c["allocated"] for c in kept)
+        report = {
+            "model": self.model_name,
+            "context_window": self.context_window,
+            "reserved_output_tokens": self.reserved_output_tokens,
+            "fixed_prompt_tokens": fixed_prompt_tokens,
+            "input_budget": budget,
+            "input_tokens_planned": used,
+            "articles_received": len(news_items),
+            "articles_kept": len(kept),
+            "articles": articles_report,
+        }
+        return trimmed_items, report
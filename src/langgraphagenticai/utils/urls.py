@@ -0,0 +1,14 @@
+# src/langgraphagenticai/utils/urls.py
+
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+def canonical_url(url: str) -> str:
+    """
+    Identifies an article across queries and runs: scheme, "www.", fragment, tracking
+    parameters and trailing slashes are ignored, and the host is lower-cased. Used for
+    deduplication, the article archive and the summary cache alike.
+    """
+    parts = urlsplit(url or "")
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not k.lower().startswith("utm_")])
+    return f"{host}{parts.path.rstrip('/')}" + (f"?{query}" if query else "")
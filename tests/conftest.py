@@ -0,0 +1,29 @@
+# tests/conftest.py
+
+import argparse
+import os
+import pytest
+
+@pytest.fixture(scope="session")
+def smtp_sink():
+    """Local SMTP server; the messages the API sends end up in `smtp_sink.messages`."""
+    from benchmarks.fakes import SMTPSink
+
+    sink = SMTPSink().start()
+    yield sink
+    sink.stop()
+
+@pytest.fixture(scope="session")
+def client(tmp_path_factory, smtp_sink):
+    """The API with the benchmark fakes (Groq, Tavily, SMTP) and every database in a temporary directory."""
+    work_dir = str(tmp_path_factory.mktemp("news_weaver"))
+    os.chdir(work_dir)
+    from benchmarks.run_benchmark import install_fakes
+
+    args = argparse.Namespace(with_cache=True, tavily_latency=0, llm_latency=0, llm_tokens_per_second=10000, llm_output_tokens=50)
+    install_fakes(args, smtp_port=smtp_sink.port, work_dir=work_dir)
+    from fastapi.testclient import TestClient
+    from src.langgraphagenticai.api.app import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,15 @@
+# tests/test_digest_cache.py
+
+def _digest(client, **overrides) -> str:
+    response = client.post("/news/structured", json={"topic": "Routing Test", "frequency": "weekly", **overrides})
+    assert response.status_code == 200
+    return response.headers["X-Digest-Cache"]
+
+def test_cached_digest_is_only_served_for_the_same_models(client):
+    assert _digest(client) == "miss"
+    assert _digest(client) == "fresh"
+    assert _digest(client, model="llama3-70b-8192") == "miss"
+    assert _digest(client, stage_models={"merge": "llama3-8b-8192"}) == "miss"
+    assert _digest(client, stage_models={"merge": "llama3-8b-8192"}) == "fresh"
+    # Naming the configured model of a stage is the same routing
+    assert _digest(client, stage_models={"merge": "llama3-70b-8192"}) == "fresh"
@@ -0,0 +1,34 @@
+# tests/test_news_runs.py
+
+from src.langgraphagenticai.storage.digest_ledger import DigestLedger
+
+def test_resume_from_checkpoint_after_fetch_news(client, monkeypatch):
+    """A run failing in the node after fetch_news resumes with the request's topic and delta mode intact."""
+    def unavailable(self, feed, news_items):
+        raise RuntimeError("ledger unavailable")
+    monkeypatch.setattr(DigestLedger, "filter_new", unavailable)
+    request = {"topic": "Resume Test", "frequency": "daily", "since_last_digest": True, "feed_id": "resume-test"}
+    response = client.post("/news/structured", json=request)
+    assert response.status_code == 500
+    run_id = response.headers["X-Run-Id"]
+    assert client.get(f"/news/runs/{run_id}").json()["failed_node"] == "filter_delivered"
+
+    monkeypatch.undo()
+    response = client.post(f"/news/runs/{run_id}/resume", json={})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["markdown"]
+    assert body["delta"]["feed"]
+    assert client.get(f"/news/runs/{run_id}").json()["status"] == "completed"
+
+def test_deferred_delivery_takes_a_news_slot(client):
+    from src.langgraphagenticai.api.core.admission import get_admission_controller
+
+    controller = get_admission_controller("news")
+    admitted = controller.admitted
+    response = client.post("/news/structured", json={"topic": "Deferred Test", "defer_delivery": True})
+    assert response.status_code == 200, response.text
+    # TestClient runs the background task before returning
+    assert controller.admitted == admitted + 2
+    assert controller.active == 0
+    assert client.get(response.json()["status_url"]).json()["status"] == "completed"
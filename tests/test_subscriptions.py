@@ -0,0 +1,50 @@
+# tests/test_subscriptions.py
+
+import email
+import re
+
+def _token_link(smtp_sink, action: str) -> str:
+    """The token of the last `action` link (confirm or unsubscribe) mailed by the API."""
+    for raw in reversed(smtp_sink.messages):
+        for part in email.message_from_string(raw).walk():
+            if part.get_content_type() == "text/plain":
+                match = re.search(rf"/subscriptions/{action}\?token=([\w-]+)", part.get_payload(decode=True).decode())
+                if match:
+                    return match.group(1)
+    raise AssertionError(f"no {action} link was mailed")
+
+def test_subscribe_requires_confirmation(client, smtp_sink):
+    response = client.post("/subscriptions", json={"email": "reader@example.com", "topic": "Opt In", "frequency": "weekly"})
+    assert response.status_code == 200
+    assert "subscription" not in response.json()
+    assert client.get("/subscriptions", params={"email": "reader@example.com"}).status_code == 403
+
+    from src.langgraphagenticai.subscriptions.store import get_subscription_store
+    assert get_subscription_store().digests("weekly") == {}
+    assert client.get("/subscriptions/confirm", params={"token": "not-a-token"}).status_code == 404
+    assert client.get("/subscriptions/confirm", params={"token": _token_link(smtp_sink, "confirm")}).status_code == 200
+    (recipients,) = get_subscription_store().digests("weekly").values()
+    assert list(recipients) == ["reader@example.com"]
+
+def test_unsubscribe_needs_the_token(client, monkeypatch):
+    monkeypatch.setenv("ADMIN_TOKEN", "test-admin-token")
+    response = client.post("/subscriptions", json={"email": "leaver@example.com", "topic": "Opt Out"},
+                           headers={"X-Admin-Token": "test-admin-token"})
+    subscription = response.json()["subscription"]
+    assert subscription["confirmed_at"] is not None
+
+    assert client.delete(f"/subscriptions/{subscription['id']}").status_code == 404
+    assert client.delete(f"/subscriptions/{subscription['unsubscribe_token']}").status_code == 200
+    listed = client.get("/subscriptions", params={"email": "leaver@example.com"}, headers={"X-Admin-Token": "test-admin-token"})
+    assert listed.json()["count"] == 0
+
+def test_digest_email_carries_the_unsubscribe_link(client, smtp_sink, monkeypatch):
+    monkeypatch.setenv("ADMIN_TOKEN", "test-admin-token")
+    client.post("/subscriptions", json={"email": "monthly@example.com", "topic": "Fan Out", "frequency": "monthly"},
+                headers={"X-Admin-Token": "test-admin-token"})
+    report = client.post("/subscriptions/deliver", json={"frequency": "monthly"}, headers={"X-Admin-Token": "test-admin-token"})
+    assert report.json()["sent"] == 1
+
+    assert client.get("/subscriptions/unsubscribe", params={"token": _token_link(smtp_sink, "unsubscribe")}).status_code == 200
+    from src.langgraphagenticai.subscriptions.store import get_subscription_store
+    assert get_subscription_store().digests("monthly") == {}